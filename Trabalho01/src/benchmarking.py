@@ -0,0 +1,144 @@
+import gc
+import os
+import sys
+import time
+
+# Medição com semântica explícita de cache frio e quente.
+#
+# clear_cache() só roda gc.collect() e o trim de working set do Windows, o que
+# não esvazia nada no Linux; e uma única chamada no labirinto 9x9 leva poucos
+# microssegundos, abaixo do que time.time() consegue medir com confiança.
+#
+# - cold: cada execução roda em um interpretador novo (spawn), depois de
+#   descartar o cache de páginas do kernel quando há permissão.
+# - warm: chamadas de aquecimento, número de repetições por amostra calibrado
+#   automaticamente (como timeit.autorange), perf_counter com o GC desligado e
+#   resumo robusto (mediana/IQR com descarte de outliers pelas cercas de Tukey).
+#
+# Contraparte: Trabalho02/src/medicao.py.
+
+MODES = ('default', 'cold', 'warm')
+
+DROP_CACHES_PATH = '/proc/sys/vm/drop_caches'
+
+# None = ainda não testado; depois guarda se o descarte é permitido
+_drop_allowed = None
+
+
+def drop_page_cache():
+    # Tenta /proc/sys/vm/drop_caches (root) e depois `sudo -n sysctl`
+    # (só funciona se o sudo não pedir senha). Retorna True se descartou.
+    global _drop_allowed
+    if _drop_allowed is False or not sys.platform.startswith('linux'):
+        return False
+
+    os.sync()
+    try:
+        with open(DROP_CACHES_PATH, 'w') as file:
+            file.write('3\n')
+        _drop_allowed = True
+        return True
+    except OSError:
+        pass
+
+    import shutil
+    import subprocess
+    if shutil.which('sudo') and shutil.which('sysctl'):
+        completed = subprocess.run(['sudo', '-n', 'sysctl', '-q', 'vm.drop_caches=3'],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if completed.returncode == 0:
+            _drop_allowed = True
+            return True
+
+    _drop_allowed = False
+    return False
+
+
+def _timed_call(func, args, kwargs):
+    # Roda dentro do processo novo
+    gc.collect()
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run_in_fresh_process(func, *args, drop_cache=True, **kwargs):
+    # func precisa ser uma função de nível de módulo (serializável).
+    # Retorna (resultado, tempo medido com perf_counter no processo filho).
+    # multiprocessing/concurrent.futures só são carregados no modo cold
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    if drop_cache:
+        drop_page_cache()
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(_timed_call, func, args, kwargs).result()
+
+
+def _time_loops(func, args, kwargs, loops):
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(loops):
+            result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return result, elapsed
+
+
+def calibrate_loops(func, args=(), kwargs=None, min_time=0.01):
+    # Menor número de chamadas (1, 2, 5, 10, 20, ...) que passa de min_time segundos
+    kwargs = kwargs or {}
+    base = 1
+    while True:
+        for factor in (1, 2, 5):
+            loops = base * factor
+            _, elapsed = _time_loops(func, args, kwargs, loops)
+            if elapsed >= min_time:
+                return loops
+        base *= 10
+
+
+def measure_warm(func, *args, warmup=3, samples=10, min_time=0.01, **kwargs):
+    # Retorna (último resultado, tempo por chamada de cada amostra, repetições por amostra)
+    for _ in range(warmup):
+        func(*args, **kwargs)
+    loops = calibrate_loops(func, args, kwargs, min_time)
+
+    times = []
+    result = None
+    for _ in range(samples):
+        result, elapsed = _time_loops(func, args, kwargs, loops)
+        times.append(elapsed / loops)
+    return result, times, loops
+
+
+def _quantile(ordered, p):
+    position = p * (len(ordered) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def robust_summary(samples, k=1.5):
+    # Mediana e IQR depois de descartar os pontos fora de [Q1 - k·IQR, Q3 + k·IQR]
+    ordered = sorted(samples)
+    q1, q3 = _quantile(ordered, 0.25), _quantile(ordered, 0.75)
+    iqr = q3 - q1
+    kept = [t for t in ordered if q1 - k * iqr <= t <= q3 + k * iqr]
+
+    q1, q3 = _quantile(kept, 0.25), _quantile(kept, 0.75)
+    return {
+        'median': _quantile(kept, 0.5),
+        'q1': q1,
+        'q3': q3,
+        'iqr': q3 - q1,
+        'mean': sum(kept) / len(kept),
+        'min': kept[0],
+        'max': kept[-1],
+        'kept': len(kept),
+        'outliers': len(ordered) - len(kept)
+    }
@@ -0,0 +1,126 @@
+import argparse
+import math
+import sys
+from stats_stream import bootstrap_ci, mann_whitney_u, read_jsonl
+
+# Compara dois conjuntos de resultados gravados por ResultSink (ex.: antes e
+# depois de uma mudança) e sinaliza regressões estatisticamente significativas.
+# Uma métrica só é considerada regressão quando o teste de Mann–Whitney rejeita
+# a igualdade (p < alpha), o intervalo bootstrap da variação relativa da
+# mediana fica inteiro acima de zero e a variação estimada passa do limiar.
+#
+# Uso:
+#   python compare_runs.py antes.jsonl depois.jsonl
+#   python compare_runs.py antes.jsonl depois.jsonl --metrics execution_time --threshold 0.10
+#
+# Sai com código 1 se houver alguma regressão (útil como gate em scripts/CI).
+# Contraparte: Trabalho02/src/comparar_execucoes.py.
+
+# Métricas de custo (menor é melhor)
+DEFAULT_METRICS = ['execution_time', 'memory_used', 'nodes_explored', 'max_structure_size']
+
+
+def load_samples(path, group_field='algorithm'):
+    # {algoritmo: {métrica: [valores]}} a partir de um arquivo JSONL
+    samples = {}
+    for record in read_jsonl(path):
+        group = samples.setdefault(record.get(group_field, ''), {})
+        for key, value in record.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            group.setdefault(key, []).append(float(value))
+    return samples
+
+
+def compare_samples(before, after, alpha=0.05, threshold=0.05, num_resamples=2000, seed=None):
+    estimate, low, high = bootstrap_ci(before, after, 'median', num_resamples, 1 - alpha, seed)
+    _, p_value = mann_whitney_u(before, after)
+
+    significant = not math.isnan(p_value) and p_value < alpha
+    if significant and low > 0 and estimate > threshold:
+        verdict = 'regression'
+    elif significant and high < 0 and estimate < -threshold:
+        verdict = 'improvement'
+    else:
+        verdict = 'unchanged'
+
+    return {
+        'n_before': len(before),
+        'n_after': len(after),
+        'change': estimate,
+        'ci_low': low,
+        'ci_high': high,
+        'p_value': p_value,
+        'verdict': verdict
+    }
+
+
+def compare_runs(before_path, after_path, metrics=DEFAULT_METRICS, group_field='algorithm',
+                 alpha=0.05, threshold=0.05, num_resamples=2000, seed=0):
+    before = load_samples(before_path, group_field)
+    after = load_samples(after_path, group_field)
+
+    rows = []
+    for algorithm in before:
+        if algorithm not in after:
+            continue
+        for metric in metrics:
+            if metric not in before[algorithm] or metric not in after[algorithm]:
+                continue
+            row = compare_samples(before[algorithm][metric], after[algorithm][metric],
+                                  alpha, threshold, num_resamples, seed)
+            rows.append({'algorithm': algorithm, 'metric': metric, **row})
+    return rows
+
+
+def print_comparison(rows, alpha):
+
+    symbols = {'regression': '✗ REGRESSÃO', 'improvement': '✓ melhora', 'unchanged': '= igual'}
+
+    print(f"\n{'='*104}")
+    print(f"COMPARAÇÃO ENTRE EXECUÇÕES (Mann–Whitney, IC bootstrap {100 * (1 - alpha):.0f}% da mediana)")
+    print(f"{'='*104}")
+    print(f"{'Algoritmo':<30} {'Métrica':<20} {'n':>7} {'Variação':>10} "
+          f"{'IC':>21} {'p':>8}  Resultado")
+    print("-" * 104)
+    for row in rows:
+        interval = f"[{row['ci_low']:+.1%}, {row['ci_high']:+.1%}]"
+        print(f"{row['algorithm']:<30} {row['metric']:<20} "
+              f"{row['n_before']:>3}/{row['n_after']:<3} {row['change']:>+10.1%} "
+              f"{interval:>21} {row['p_value']:>8.4f}  {symbols[row['verdict']]}")
+    print("=" * 104 + "\n")
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Compara dois conjuntos de resultados (JSONL)")
+    parser.add_argument('before', help="Resultados de referência (antes da mudança)")
+    parser.add_argument('after', help="Resultados novos (depois da mudança)")
+    parser.add_argument('--metrics', nargs='+', default=DEFAULT_METRICS,
+                        help="Métricas comparadas (menor é melhor)")
+    parser.add_argument('--group-field', default='algorithm',
+                        help="Campo que identifica o algoritmo em cada linha")
+    parser.add_argument('--alpha', type=float, default=0.05, help="Nível de significância")
+    parser.add_argument('--threshold', type=float, default=0.05,
+                        help="Variação relativa mínima para contar como regressão (0.05 = 5%%)")
+    parser.add_argument('--resamples', type=int, default=2000, help="Reamostragens do bootstrap")
+    parser.add_argument('--seed', type=int, default=0, help="Semente do bootstrap")
+    args = parser.parse_args(argv)
+
+    rows = compare_runs(args.before, args.after, args.metrics, args.group_field,
+                        args.alpha, args.threshold, args.resamples, args.seed)
+    if not rows:
+        print("Nenhum algoritmo/métrica em comum entre os dois arquivos.")
+        return 2
+
+    print_comparison(rows, args.alpha)
+    regressions = [row for row in rows if row['verdict'] == 'regression']
+    if regressions:
+        print(f"{len(regressions)} regressão(ões) significativa(s) detectada(s).")
+        return 1
+    print("Nenhuma regressão significativa.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
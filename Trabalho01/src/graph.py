@@ -0,0 +1,487 @@
+import argparse
+import heapq
+import os
+import time
+from array import array
+
+from search import print_metrics, process_memory
+
+# Grafo esparso em formato CSR (compressed sparse row) para as buscas.
+#
+# search.py só anda em grades 2-D (is_valid + lista fixa de direções). Aqui o
+# grafo é genérico, com nós numerados 0..n-1:
+#   - indptr  (int64, n + 1): os vizinhos do nó u estão em indices[indptr[u]:indptr[u + 1]];
+#   - indices (int32, m):     destino de cada aresta, agrupados por origem;
+#   - weights (float64, m):   peso de cada aresta, ou None (todas com peso 1);
+#   - coords  (n x 2):        posição de cada nó, usada pelas heurísticas (opcional);
+#   - labels:                 identificador original de cada nó (lista de arestas
+#                             com ids arbitrários) ou None.
+# São 12 bytes por aresta com pesos (4 sem), contra centenas de bytes por
+# aresta em dicionários de tuplas, e os vizinhos de um nó são contíguos na
+# memória. As buscas iteram sobre memoryviews dos vetores NumPy (sem cópia).
+#
+# Construção:
+#   CSRGraph.from_grid(maze)                # células livres; vizinhos na ordem de search.py
+#   CSRGraph.from_edge_list('roads.txt')    # "origem destino [peso]" por linha
+#   CSRGraph.from_edges(origens, destinos, pesos)
+#   graph.save('roads.npz') / CSRGraph.load('roads.npz')
+#
+# As buscas recebem e devolvem ids inteiros; graph.node(chave) converte uma
+# posição da grade (ou um id original) em id, e graph.positions(caminho) faz
+# o caminho inverso. Em grafos de grade, graph_bfs/graph_dfs/graph_greedy_search
+# /graph_a_star dão os mesmos caminhos, nós explorados e tamanhos máximos que
+# as versões de search.py. Com pesos, graph_a_star e graph_dijkstra reabrem
+# nós alcançados com custo menor (menor caminho ponderado).
+#
+# Uso:
+#   python graph.py --generate 301
+#   python graph.py --edges roads.txt --source 1 --target 5000 --algorithms dijkstra
+
+
+class CSRGraph:
+
+    __slots__ = ('indptr', 'indices', 'weights', 'coords', 'labels', 'node_ids', '_points')
+
+    def __init__(self, indptr, indices, weights=None, coords=None, labels=None, node_ids=None):
+        import numpy as np
+
+        self.indptr = np.ascontiguousarray(indptr, dtype=np.int64)
+        self.indices = np.ascontiguousarray(indices, dtype=np.int32)
+        self.weights = None if weights is None else np.ascontiguousarray(weights, dtype=np.float64)
+        self.coords = None if coords is None else np.asarray(coords)
+        self.labels = labels
+        # Grade: id de cada célula (-1 = parede)
+        self.node_ids = node_ids
+        self._points = None
+        if self.indptr[-1] != len(self.indices):
+            raise ValueError(f"indptr ends at {self.indptr[-1]} but there are {len(self.indices)} edges")
+        if self.weights is not None and len(self.weights) != len(self.indices):
+            raise ValueError(f"{len(self.weights)} weights for {len(self.indices)} edges")
+
+    # --- construção ---
+
+    @classmethod
+    def from_edges(cls, sources, targets, weights=None, num_nodes=None, directed=False,
+                   coords=None, labels=None):
+        # Arestas em vetores; a ordenação é estável, então os vizinhos de cada
+        # nó mantêm a ordem em que as arestas foram dadas
+        import numpy as np
+
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+        if not directed:
+            sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+            if weights is not None:
+                weights = np.concatenate([weights, weights])
+        if num_nodes is None:
+            num_nodes = int(max(sources.max(initial=-1), targets.max(initial=-1))) + 1
+
+        order = np.argsort(sources, kind='stable')
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_nodes), out=indptr[1:])
+        return cls(indptr, targets[order], None if weights is None else weights[order],
+                   coords, labels)
+
+    @classmethod
+    def from_grid(cls, maze):
+        # Um nó por célula livre (em ordem de linha), arestas com as células
+        # livres vizinhas na ordem cima, baixo, esquerda, direita
+        import numpy as np
+
+        grid = np.asarray(maze)
+        free = grid != '#'
+        node_ids = np.full(grid.shape, -1, dtype=np.int64)
+        node_ids[free] = np.arange(np.count_nonzero(free))
+
+        padded = np.full((grid.shape[0] + 2, grid.shape[1] + 2), -1, dtype=np.int64)
+        padded[1:-1, 1:-1] = node_ids
+        neighbors = np.stack([padded[:-2, 1:-1][free], padded[2:, 1:-1][free],
+                              padded[1:-1, :-2][free], padded[1:-1, 2:][free]], axis=1)
+        valid = neighbors >= 0
+        indptr = np.zeros(len(neighbors) + 1, dtype=np.int64)
+        np.cumsum(valid.sum(axis=1), out=indptr[1:])
+        return cls(indptr, neighbors[valid], coords=np.argwhere(free), node_ids=node_ids)
+
+    @classmethod
+    def from_edge_list(cls, path, directed=False, coords_path=None):
+        # Uma aresta por linha: "origem destino [peso]" (linhas com # são
+        # ignoradas). Os ids podem ser quaisquer inteiros; viram 0..n-1 e os
+        # originais ficam em `labels`. coords_path: "id x y" por linha.
+        import numpy as np
+
+        data = np.loadtxt(path, comments='#', ndmin=2)
+        if data.shape[1] not in (2, 3):
+            raise ValueError(f"{path}: expected 2 or 3 columns, got {data.shape[1]}")
+        ids = data[:, :2].astype(np.int64)
+        labels, compact = np.unique(ids, return_inverse=True)
+        compact = compact.reshape(ids.shape)
+        weights = data[:, 2] if data.shape[1] == 3 else None
+
+        coords = None
+        if coords_path is not None:
+            points = np.loadtxt(coords_path, comments='#', ndmin=2)
+            position = np.searchsorted(labels, points[:, 0].astype(np.int64))
+            known = (position < len(labels)) & (labels[np.minimum(position, len(labels) - 1)]
+                                                == points[:, 0].astype(np.int64))
+            coords = np.full((len(labels), 2), np.nan)
+            coords[position[known]] = points[known, 1:3]
+        return cls.from_edges(compact[:, 0], compact[:, 1], weights, len(labels), directed,
+                              coords, labels)
+
+    def save(self, path):
+        import numpy as np
+
+        arrays = {'indptr': self.indptr, 'indices': self.indices}
+        for name in ('weights', 'coords', 'labels', 'node_ids'):
+            value = getattr(self, name)
+            if value is not None:
+                arrays[name] = value
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        import numpy as np
+
+        with np.load(path) as data:
+            return cls(**{name: data[name] for name in data.files})
+
+    # --- consulta ---
+
+    @property
+    def num_nodes(self):
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.indices)
+
+    @property
+    def nbytes(self):
+        return sum(value.nbytes for value in (self.indptr, self.indices, self.weights, self.coords,
+                                              self.labels, self.node_ids) if value is not None)
+
+    def node(self, key):
+        # Posição (i, j) em grafos de grade, id original em listas de arestas,
+        # ou o próprio id
+        import numpy as np
+
+        if self.node_ids is not None:
+            i, j = key
+            if not (0 <= i < self.node_ids.shape[0] and 0 <= j < self.node_ids.shape[1]) \
+                    or self.node_ids[i, j] < 0:
+                raise ValueError(f"{key} is a wall or outside the grid")
+            return int(self.node_ids[i, j])
+        if self.labels is not None:
+            position = int(np.searchsorted(self.labels, key))
+            if position == len(self.labels) or self.labels[position] != key:
+                raise ValueError(f"Unknown node {key}")
+            return position
+        if not 0 <= key < self.num_nodes:
+            raise ValueError(f"Node {key} out of range (0..{self.num_nodes - 1})")
+        return int(key)
+
+    def neighbors(self, node):
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def positions(self, path):
+        # Caminho de ids -> posições da grade (ou ids originais)
+        if path is None:
+            return None
+        if self.node_ids is not None:
+            return [tuple(int(x) for x in self.coords[node]) for node in path]
+        if self.labels is not None:
+            return [int(self.labels[node]) for node in path]
+        return list(path)
+
+    def heuristic(self, heuristic_func, target):
+        # h(nó) a partir das coordenadas: as heurísticas de heuristics.py recebem tuplas
+        if self.coords is None:
+            raise ValueError("Heuristic searches need node coordinates (coords)")
+        # Coordenadas como tuplas, montadas na primeira busca e reaproveitadas
+        if self._points is None:
+            self._points = [tuple(point) for point in self.coords.tolist()]
+        points = self._points
+        goal = points[target]
+        return lambda node: heuristic_func(points[node], goal)
+
+
+# ----------------------------------------------------------------------------
+# Buscas
+# ----------------------------------------------------------------------------
+
+def _path_to(parent, node):
+    path = []
+    while node != -1:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    return path
+
+
+def _result(algorithm_name, path, nodes_explored, max_structure_size, start_time, mem_before,
+            suppress_output):
+    end_time = time.perf_counter()
+    memory_used = process_memory() - mem_before
+    if not suppress_output:
+        print_metrics(algorithm_name, path, nodes_explored, end_time - start_time, memory_used)
+    return {
+        'path': path,
+        'nodes_explored': nodes_explored,
+        'execution_time': end_time - start_time,
+        'memory_used': memory_used,
+        'max_structure_size': max_structure_size
+    }
+
+
+def graph_bfs(graph, source, target, suppress_output=False):
+
+    start_time = time.perf_counter()
+    mem_before = process_memory()
+
+    indptr, indices = memoryview(graph.indptr), memoryview(graph.indices)
+    n = graph.num_nodes
+    visited = bytearray(n)
+    parent = array('i', [-1]) * n
+    queue = array('i', [source]) * n
+    head, tail = 0, 1
+    visited[source] = 1
+    visited_count = 1
+    nodes_explored = 0
+    max_structure_size = 2
+    path = None
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+        nodes_explored += 1
+        if current == target:
+            path = _path_to(parent, current)
+            break
+        for neighbor in indices[indptr[current]:indptr[current + 1]]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                parent[neighbor] = current
+                queue[tail] = neighbor
+                tail += 1
+                visited_count += 1
+                size = tail - head + visited_count
+                if size > max_structure_size:
+                    max_structure_size = size
+
+    return _result("BFS (grafo CSR)", path, nodes_explored, max_structure_size, start_time,
+                   mem_before, suppress_output)
+
+
+def graph_dfs(graph, source, target, suppress_output=False):
+
+    start_time = time.perf_counter()
+    mem_before = process_memory()
+
+    indptr, indices = memoryview(graph.indptr), memoryview(graph.indices)
+    n = graph.num_nodes
+    visited = bytearray(n)
+    parent = array('i', [-1]) * n
+    stack = [source]
+    visited[source] = 1
+    visited_count = 1
+    nodes_explored = 0
+    max_structure_size = 2
+    path = None
+
+    while stack:
+        current = stack.pop()
+        nodes_explored += 1
+        if current == target:
+            path = _path_to(parent, current)
+            break
+        for neighbor in indices[indptr[current]:indptr[current + 1]]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                parent[neighbor] = current
+                stack.append(neighbor)
+                visited_count += 1
+                size = len(stack) + visited_count
+                if size > max_structure_size:
+                    max_structure_size = size
+
+    return _result("DFS (grafo CSR)", path, nodes_explored, max_structure_size, start_time,
+                   mem_before, suppress_output)
+
+
+def _best_first(graph, source, target, algorithm_name, suppress_output, h, use_cost):
+
+    # Greedy (prioridade h) e A*/Dijkstra (g + h). Sem pesos, o nó é marcado ao
+    # entrar no heap, como em search.py (mesmos resultados na grade). Com
+    # pesos, A*/Dijkstra mantêm o melhor g de cada nó e reinserem quando ele
+    # melhora; um nó só é expandido uma vez (entradas velhas são puladas).
+    start_time = time.perf_counter()
+    mem_before = process_memory()
+
+    indptr, indices = memoryview(graph.indptr), memoryview(graph.indices)
+    weights = memoryview(graph.weights) if graph.weights is not None else None
+    reopen = use_cost and weights is not None
+    n = graph.num_nodes
+    visited = bytearray(n)
+    parent = array('i', [-1]) * n
+    g = array('d', [0.0]) * n
+    heappush, heappop = heapq.heappush, heapq.heappop
+
+    heap = [(h(source), 0, source)]
+    counter = 1
+    visited[source] = 1
+    visited_count = 1
+    closed = bytearray(n) if reopen else None
+    if reopen:
+        g = array('d', [float('inf')]) * n
+        g[source] = 0.0
+    nodes_explored = 0
+    max_structure_size = 2
+    path = None
+
+    while heap:
+        current = heappop(heap)[2]
+        if reopen:
+            if closed[current]:
+                continue
+            closed[current] = 1
+        nodes_explored += 1
+        if current == target:
+            path = _path_to(parent, current)
+            break
+
+        begin, end = indptr[current], indptr[current + 1]
+        for offset in range(begin, end):
+            neighbor = indices[offset]
+            if reopen:
+                cost = g[current] + weights[offset]
+                if closed[neighbor] or cost >= g[neighbor]:
+                    continue
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    visited_count += 1
+            elif visited[neighbor]:
+                continue
+            else:
+                visited[neighbor] = 1
+                visited_count += 1
+                cost = g[current] + (weights[offset] if weights is not None else 1)
+            parent[neighbor] = current
+            priority = h(neighbor)
+            if use_cost:
+                g[neighbor] = cost
+                priority += cost
+            heappush(heap, (priority, counter, neighbor))
+            counter += 1
+            size = len(heap) + visited_count
+            if size > max_structure_size:
+                max_structure_size = size
+
+    return _result(algorithm_name, path, nodes_explored, max_structure_size, start_time,
+                   mem_before, suppress_output)
+
+
+def _heuristic_name(heuristic_func):
+    return heuristic_func.__name__.replace('_', ' ').title()
+
+
+def graph_greedy_search(graph, source, target, heuristic_func, suppress_output=False):
+    return _best_first(graph, source, target, f"Greedy Search ({_heuristic_name(heuristic_func)}, CSR)",
+                       suppress_output, graph.heuristic(heuristic_func, target), use_cost=False)
+
+
+def graph_a_star(graph, source, target, heuristic_func, suppress_output=False):
+    return _best_first(graph, source, target, f"A* ({_heuristic_name(heuristic_func)}, CSR)",
+                       suppress_output, graph.heuristic(heuristic_func, target), use_cost=True)
+
+
+def graph_dijkstra(graph, source, target, suppress_output=False):
+    # A* com h = 0: menor caminho ponderado, sem precisar de coordenadas
+    return _best_first(graph, source, target, "Dijkstra (grafo CSR)", suppress_output,
+                       lambda node: 0, use_cost=True)
+
+
+def graph_algorithms():
+    # Mesmos nomes de profiling.search_algorithms (+ dijkstra)
+    from functools import partial
+    from heuristics import euclidean_distance, manhattan_distance
+    return {
+        'bfs': graph_bfs,
+        'dfs': graph_dfs,
+        'greedy_manhattan': partial(graph_greedy_search, heuristic_func=manhattan_distance),
+        'greedy_euclidean': partial(graph_greedy_search, heuristic_func=euclidean_distance),
+        'a_star_manhattan': partial(graph_a_star, heuristic_func=manhattan_distance),
+        'a_star_euclidean': partial(graph_a_star, heuristic_func=euclidean_distance),
+        'dijkstra': graph_dijkstra,
+    }
+
+
+def main(argv=None):
+    algorithms = graph_algorithms()
+    parser = argparse.ArgumentParser(description="Buscas em grafos CSR (grade ou lista de arestas)")
+    parser.add_argument('--edges', default=None, help="Lista de arestas 'origem destino [peso]'")
+    parser.add_argument('--coords', default=None, help="Coordenadas 'id x y' (para Greedy/A*)")
+    parser.add_argument('--directed', action='store_true')
+    parser.add_argument('--npz', default=None, help="Grafo salvo com CSRGraph.save")
+    parser.add_argument('--save', default=None, help="Salva o grafo construído em .npz")
+    parser.add_argument('--generate', type=int, default=None, metavar='SIZE',
+                        help="Grade gerada em vez de labirinto.txt")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--source', type=int, default=None, help="Id original do nó de origem")
+    parser.add_argument('--target', type=int, default=None, help="Id original do nó de destino")
+    parser.add_argument('--algorithms', nargs='+', default=None, choices=list(algorithms))
+    args = parser.parse_args(argv)
+
+    maze = None
+    if not (args.npz or args.edges):
+        from maze import generate_maze, load_maze
+
+        if args.generate:
+            maze = generate_maze(args.generate, seed=args.seed)
+        else:
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            maze = load_maze(os.path.join(current_dir, '..', 'data', 'labirinto.txt'))
+
+    started = time.perf_counter()
+    if args.npz:
+        graph = CSRGraph.load(args.npz)
+    elif args.edges:
+        graph = CSRGraph.from_edge_list(args.edges, args.directed, args.coords)
+    else:
+        graph = CSRGraph.from_grid(maze)
+    build_time = time.perf_counter() - started
+    if args.save:
+        graph.save(args.save)
+
+    try:
+        if maze is not None:
+            from maze import find_positions
+
+            start, goal = find_positions(maze)
+            source, target = graph.node(start), graph.node(goal)
+        else:
+            source = graph.node(args.source if args.source is not None else graph.positions([0])[0])
+            target = graph.node(args.target if args.target is not None
+                                else graph.positions([graph.num_nodes - 1])[0])
+    except ValueError as error:
+        raise SystemExit(f"Origem/destino inválido: {error}")
+
+    names = args.algorithms or [name for name in algorithms
+                                if graph.coords is not None or name in ('bfs', 'dfs', 'dijkstra')]
+    print(f"\n{'='*70}")
+    print(f"Grafo: {graph.num_nodes:,} nós, {graph.num_edges:,} arestas "
+          f"({'com' if graph.weights is not None else 'sem'} pesos), {graph.nbytes / 1024:,.1f} KB, "
+          f"construído em {build_time * 1000:.1f} ms")
+    print(f"{'-'*70}")
+    print(f"{'Algoritmo':<18} {'Nós explorados':>15} {'Tempo (ms)':>12} {'Caminho':>10}")
+    for name in names:
+        result = algorithms[name](graph, source, target, suppress_output=True)
+        length = len(result['path']) if result['path'] else 0
+        print(f"{name:<18} {result['nodes_explored']:>15,} "
+              f"{result['execution_time'] * 1000:>12.2f} {length:>10}")
+    print(f"{'='*70}")
+
+
+if __name__ == "__main__":
+    main()
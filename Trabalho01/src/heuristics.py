@@ -1,4 +1,4 @@
-import numpy as np
+import math
 
 def manhattan_distance(pos1, pos2):
   
@@ -6,4 +6,5 @@ def manhattan_distance(pos1, pos2):
 
 def euclidean_distance(pos1, pos2):
  
-    return np.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
\ No newline at end of file
+    # math.sqrt: NumPy não é necessário para um escalar (e pesa na inicialização)
+    return math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
\ No newline at end of file
@@ -1,7 +1,14 @@
-import numpy as np
+import argparse
+from functools import partial
 import os
+import random
 from search import bfs, dfs, greedy_search, a_star, run_with_cold_cache
+from stats_stream import ResultSink
+from benchmarking import MODES
 from heuristics import manhattan_distance, euclidean_distance
+from workspace import SearchWorkspace
+from search_cache import SearchCache
+from reachability import ReachabilityIndex
 
 def load_maze(filepath):
     
@@ -13,9 +20,47 @@ def load_maze(filepath):
         row = line.strip().split()
         matrix.append(row)
     
+    # NumPy só é carregado quando um labirinto é de fato lido
+    import numpy as np
     labirinto = np.array(matrix)
     return labirinto
 
+def generate_maze(size, seed=None, loop_fraction=0.1):
+    
+    # Labirinto size x size (size ímpar) gerado por DFS aleatória: as células
+    # ficam nas coordenadas pares e as paredes entre elas são derrubadas.
+    # loop_fraction derruba paredes extras para criar ciclos (senão só há um
+    # caminho e BFS/A* não se diferenciam). S no canto inferior esquerdo e G
+    # no superior direito, como em labirinto.txt.
+    if size % 2 == 0:
+        size += 1
+    rng = random.Random(seed)
+    grid = [['#'] * size for _ in range(size)]
+    grid[0][0] = '.'
+    stack = [(0, 0)]
+    while stack:
+        i, j = stack[-1]
+        neighbors = [(i + di, j + dj, i + di // 2, j + dj // 2)
+                     for di, dj in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                     if 0 <= i + di < size and 0 <= j + dj < size and grid[i + di][j + dj] == '#']
+        if not neighbors:
+            stack.pop()
+            continue
+        ni, nj, wi, wj = rng.choice(neighbors)
+        grid[wi][wj] = '.'
+        grid[ni][nj] = '.'
+        stack.append((ni, nj))
+
+    walls = [(i, j) for i in range(size) for j in range(size)
+             if grid[i][j] == '#' and (i % 2) != (j % 2)]
+    for i, j in rng.sample(walls, int(len(walls) * loop_fraction)):
+        grid[i][j] = '.'
+
+    grid[size - 1][0] = 'S'
+    grid[0][size - 1] = 'G'
+    import numpy as np
+    return np.array(grid)
+
 def find_positions(labirinto):
     
     start_pos = None
@@ -31,7 +76,25 @@ def find_positions(labirinto):
     
     return start_pos, goal_pos
 
-def main():
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Algoritmos de busca em labirintos")
+    parser.add_argument('--output', default=None,
+                        help="Grava cada execução em um arquivo JSONL conforme executa")
+    parser.add_argument('--columns', default=None, metavar='DIR',
+                        help="Também grava as métricas numéricas em arquivos colunares")
+    parser.add_argument('--mode', choices=MODES, default='default',
+                        help="Medição: default, cold (processo novo) ou warm (repetições calibradas)")
+    parser.add_argument('--workspace', action='store_true',
+                        help="Reaproveita um SearchWorkspace em todas as buscas (sem alocar por consulta)")
+    parser.add_argument('--cache', action='store_true',
+                        help="Memoiza os resultados (repetições da mesma consulta não executam a busca)")
+    parser.add_argument('--cache-db', default=None, metavar='PATH',
+                        help="Também guarda os resultados em SQLite, entre execuções (implica --cache)")
+    parser.add_argument('--cache-max-mb', type=float, default=64,
+                        help="Tamanho máximo do cache em disco")
+    args = parser.parse_args(argv)
+    sink = ResultSink(args.output, args.columns) if args.output else None
 
     current_dir = os.path.dirname(os.path.abspath(__file__))
     maze_file = os.path.join(current_dir, '..', 'data', 'labirinto.txt')
@@ -39,6 +102,32 @@ def main():
     labirinto = load_maze(maze_file)
 
     start_pos, goal_pos = find_positions(labirinto)
+
+    # Componentes conexas: valida S e G e, se não houver caminho entre eles,
+    # as buscas nem são executadas (resultado "sem caminho" em O(1))
+    reachability = ReachabilityIndex(labirinto)
+    try:
+        if not reachability.validate(start_pos, goal_pos):
+            print(f"Aviso: S e G estão em componentes diferentes ({reachability.components} "
+                  f"componentes); nenhuma busca encontrará caminho")
+    except ValueError as error:
+        raise SystemExit(f"Labirinto inválido: {error}")
+
+    # Com --workspace, todas as execuções usam as mesmas estruturas pré-alocadas
+    search_options = {'workspace': SearchWorkspace(labirinto)} if args.workspace else {}
+
+    # Com --cache, só a primeira execução de cada consulta faz a busca. Os
+    # modos cold e warm existem para medir a busca, então ignoram o cache.
+    search_cache = None
+    if args.cache or args.cache_db:
+        if args.mode != 'default':
+            print(f"Modo {args.mode}: cache de resultados ignorado (a medição é da busca)")
+        else:
+            search_cache = SearchCache(path=args.cache_db, max_disk_bytes=int(args.cache_max_mb * 1024 * 1024))
+
+    def prepare(search, **options):
+        func = partial(search, **options, **search_options)
+        return search_cache.wrap(func) if search_cache is not None else func
     
     print("Labirinto:")
     print(labirinto)
@@ -52,18 +141,18 @@ def main():
     print("EXECUTANDO ALGORITMOS DE BUSCA NÃO INFORMADA COM COLD CACHE")
     print("="*70)
 
-    bfs_results = run_with_cold_cache(bfs, start_pos, goal_pos, labirinto, "BFS (Busca em Largura)", num_runs=10)
-    dfs_results = run_with_cold_cache(dfs, start_pos, goal_pos, labirinto, "DFS (Busca em Profundidade)", num_runs=10)
+    bfs_results = run_with_cold_cache(prepare(bfs), start_pos, goal_pos, labirinto, "BFS (Busca em Largura)", num_runs=10, sink=sink, mode=args.mode, reachability=reachability)
+    dfs_results = run_with_cold_cache(prepare(dfs), start_pos, goal_pos, labirinto, "DFS (Busca em Profundidade)", num_runs=10, sink=sink, mode=args.mode, reachability=reachability)
 
     print("\n" + "="*70)
     print("COMPARAÇÃO - BUSCA NÃO INFORMADA")
     print("="*70)
-    bfs_avg_time = np.mean([r['execution_time'] for r in bfs_results])
-    dfs_avg_time = np.mean([r['execution_time'] for r in dfs_results])
-    bfs_avg_memory = np.mean([r['memory_used'] for r in bfs_results])
-    dfs_avg_memory = np.mean([r['memory_used'] for r in dfs_results])
-    bfs_avg_max_structures = np.mean([r['max_structure_size'] for r in bfs_results])
-    dfs_avg_max_structures = np.mean([r['max_structure_size'] for r in dfs_results])
+    bfs_avg_time = bfs_results.mean('execution_time')
+    dfs_avg_time = dfs_results.mean('execution_time')
+    bfs_avg_memory = bfs_results.mean('memory_used')
+    dfs_avg_memory = dfs_results.mean('memory_used')
+    bfs_avg_max_structures = bfs_results.mean('max_structure_size')
+    dfs_avg_max_structures = dfs_results.mean('max_structure_size')
     
     print(f"\nBFS:")
     print(f"  Tempo médio: {bfs_avg_time:.6f}s")
@@ -97,31 +186,37 @@ def main():
     
     # Greedy com Distância de Manhattan
     greedy_manhattan_results = run_with_cold_cache(
-        lambda s, g, m, suppress_output=False: greedy_search(s, g, m, manhattan_distance, suppress_output),
+        prepare(greedy_search, heuristic_func=manhattan_distance),
         start_pos, goal_pos, labirinto, 
         "Greedy Search (Manhattan Distance)", 
-        num_runs=10
+        num_runs=10,
+        sink=sink,
+        mode=args.mode,
+        reachability=reachability
     )
     
     # Greedy com Distância Euclidiana
     greedy_euclidean_results = run_with_cold_cache(
-        lambda s, g, m, suppress_output=False: greedy_search(s, g, m, euclidean_distance, suppress_output),
+        prepare(greedy_search, heuristic_func=euclidean_distance),
         start_pos, goal_pos, labirinto, 
         "Greedy Search (Euclidean Distance)", 
-        num_runs=10
+        num_runs=10,
+        sink=sink,
+        mode=args.mode,
+        reachability=reachability
     )
     
     print("\n" + "="*70)
     print("COMPARAÇÃO - BUSCA GULOSA (GREEDY)")
     print("="*70)
-    greedy_man_avg_time = np.mean([r['execution_time'] for r in greedy_manhattan_results])
-    greedy_euc_avg_time = np.mean([r['execution_time'] for r in greedy_euclidean_results])
-    greedy_man_avg_memory = np.mean([r['memory_used'] for r in greedy_manhattan_results])
-    greedy_euc_avg_memory = np.mean([r['memory_used'] for r in greedy_euclidean_results])
-    greedy_man_avg_max_structures = np.mean([r['max_structure_size'] for r in greedy_manhattan_results])
-    greedy_euc_avg_max_structures = np.mean([r['max_structure_size'] for r in greedy_euclidean_results])
-    greedy_man_avg_nodes = np.mean([r['nodes_explored'] for r in greedy_manhattan_results])
-    greedy_euc_avg_nodes = np.mean([r['nodes_explored'] for r in greedy_euclidean_results])
+    greedy_man_avg_time = greedy_manhattan_results.mean('execution_time')
+    greedy_euc_avg_time = greedy_euclidean_results.mean('execution_time')
+    greedy_man_avg_memory = greedy_manhattan_results.mean('memory_used')
+    greedy_euc_avg_memory = greedy_euclidean_results.mean('memory_used')
+    greedy_man_avg_max_structures = greedy_manhattan_results.mean('max_structure_size')
+    greedy_euc_avg_max_structures = greedy_euclidean_results.mean('max_structure_size')
+    greedy_man_avg_nodes = greedy_manhattan_results.mean('nodes_explored')
+    greedy_euc_avg_nodes = greedy_euclidean_results.mean('nodes_explored')
     
     print(f"\nGreedy (Manhattan):")
     print(f"  Nós explorados: {greedy_man_avg_nodes:.0f}")
@@ -148,31 +243,37 @@ def main():
     
     # A* com Distância de Manhattan
     astar_manhattan_results = run_with_cold_cache(
-        lambda s, g, m, suppress_output=False: a_star(s, g, m, manhattan_distance, suppress_output),
+        prepare(a_star, heuristic_func=manhattan_distance),
         start_pos, goal_pos, labirinto, 
         "A* (Manhattan Distance)", 
-        num_runs=10
+        num_runs=10,
+        sink=sink,
+        mode=args.mode,
+        reachability=reachability
     )
     
     # A* com Distância Euclidiana
     astar_euclidean_results = run_with_cold_cache(
-        lambda s, g, m, suppress_output=False: a_star(s, g, m, euclidean_distance, suppress_output),
+        prepare(a_star, heuristic_func=euclidean_distance),
         start_pos, goal_pos, labirinto, 
         "A* (Euclidean Distance)", 
-        num_runs=10
+        num_runs=10,
+        sink=sink,
+        mode=args.mode,
+        reachability=reachability
     )
     
     print("\n" + "="*70)
     print("COMPARAÇÃO - BUSCA A*")
     print("="*70)
-    astar_man_avg_time = np.mean([r['execution_time'] for r in astar_manhattan_results])
-    astar_euc_avg_time = np.mean([r['execution_time'] for r in astar_euclidean_results])
-    astar_man_avg_memory = np.mean([r['memory_used'] for r in astar_manhattan_results])
-    astar_euc_avg_memory = np.mean([r['memory_used'] for r in astar_euclidean_results])
-    astar_man_avg_max_structures = np.mean([r['max_structure_size'] for r in astar_manhattan_results])
-    astar_euc_avg_max_structures = np.mean([r['max_structure_size'] for r in astar_euclidean_results])
-    astar_man_avg_nodes = np.mean([r['nodes_explored'] for r in astar_manhattan_results])
-    astar_euc_avg_nodes = np.mean([r['nodes_explored'] for r in astar_euclidean_results])
+    astar_man_avg_time = astar_manhattan_results.mean('execution_time')
+    astar_euc_avg_time = astar_euclidean_results.mean('execution_time')
+    astar_man_avg_memory = astar_manhattan_results.mean('memory_used')
+    astar_euc_avg_memory = astar_euclidean_results.mean('memory_used')
+    astar_man_avg_max_structures = astar_manhattan_results.mean('max_structure_size')
+    astar_euc_avg_max_structures = astar_euclidean_results.mean('max_structure_size')
+    astar_man_avg_nodes = astar_manhattan_results.mean('nodes_explored')
+    astar_euc_avg_nodes = astar_euclidean_results.mean('nodes_explored')
     
     print(f"\nA* (Manhattan):")
     print(f"  Nós explorados: {astar_man_avg_nodes:.0f}")
@@ -198,8 +299,8 @@ def main():
     print("="*70)
     
     all_algorithms = {
-        'BFS': {'time': bfs_avg_time, 'memory': bfs_avg_memory, 'nodes': np.mean([r['nodes_explored'] for r in bfs_results])},
-        'DFS': {'time': dfs_avg_time, 'memory': dfs_avg_memory, 'nodes': np.mean([r['nodes_explored'] for r in dfs_results])},
+        'BFS': {'time': bfs_avg_time, 'memory': bfs_avg_memory, 'nodes': bfs_results.mean('nodes_explored')},
+        'DFS': {'time': dfs_avg_time, 'memory': dfs_avg_memory, 'nodes': dfs_results.mean('nodes_explored')},
         'Greedy (Manhattan)': {'time': greedy_man_avg_time, 'memory': greedy_man_avg_memory, 'nodes': greedy_man_avg_nodes},
         'Greedy (Euclidean)': {'time': greedy_euc_avg_time, 'memory': greedy_euc_avg_memory, 'nodes': greedy_euc_avg_nodes},
         'A* (Manhattan)': {'time': astar_man_avg_time, 'memory': astar_man_avg_memory, 'nodes': astar_man_avg_nodes},
@@ -224,6 +325,14 @@ def main():
     print(f"Menor número de nós explorados: {least_nodes[0]} ({least_nodes[1]['nodes']:.0f} nós)")
     print("="*70)
 
+    if search_cache is not None:
+        search_cache.print_stats()
+        search_cache.close()
+
+    if sink is not None:
+        sink.close()
+        print(f"\nResultados gravados em: {args.output}")
+
 if __name__ == "__main__":
     main()
 
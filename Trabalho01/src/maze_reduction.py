@@ -0,0 +1,362 @@
+import argparse
+import heapq
+import os
+import time
+from array import array
+
+from search import print_metrics, process_memory, visualize_path
+
+# Pré-processamento do labirinto: preenchimento de becos e colapso de corredores.
+#
+# 1. Becos sem saída: uma célula livre com no máximo um vizinho livre (que
+#    não seja S nem G) nunca está no meio de um caminho simples de S a G, então
+#    vira parede. Isso expõe novos becos, e o processo se repete até
+#    estabilizar. As contagens de vizinhos são vetorizadas em NumPy sobre a
+#    grade com borda de paredes (vizinhos = índice ± 1 e ± largura). Após a
+#    primeira passada, só os vizinhos das células removidas são recontados, e
+#    quando restam poucos candidatos (cadeias longas, uma célula por passada)
+#    o resto é feito com uma pilha em Python, sem o custo fixo do NumPy.
+#    Em labirintos perfeitos (sem ciclos) sobra apenas o caminho de S a G.
+# 2. Corredores: das células que sobram, são nós as de grau diferente de 2
+#    (junções e pontas) e S/G; cada corredor (sequência de células de grau 2)
+#    entre dois nós vira uma aresta com peso = número de passos, guardando as
+#    células do meio para reconstruir o caminho.
+#
+# As buscas abaixo (Dijkstra, DFS, Greedy e A*) rodam nesse grafo ponderado e
+# devolvem o mesmo dicionário de search.py, com o caminho já expandido célula
+# a célula. "nodes_explored" conta nós do grafo reduzido. Dijkstra e A* (com
+# Manhattan, admissível pois o peso de uma aresta nunca é menor que a
+# distância de Manhattan entre as pontas) dão caminhos mínimos, como BFS e A*
+# na grade.
+#
+# Uso:
+#   reduced = ReducedMaze(maze, keep=(start, goal))
+#   result = reduced_a_star(start, goal, maze, manhattan_distance, reduced=reduced)
+#
+#   python maze_reduction.py                       # labirinto.txt
+#   python maze_reduction.py --generate 301 --seed 1 --loop-fraction 0
+
+# Abaixo disso, uma passada NumPy custa mais do que checar célula a célula
+_VECTOR_MIN_CANDIDATES = 64
+
+
+def _padded_free(maze):
+    # Células livres em um vetor plano com borda de paredes (largura cols + 2)
+    import numpy as np
+
+    grid = np.asarray(maze)
+    rows, cols = grid.shape
+    free = np.zeros((rows + 2, cols + 2), dtype=bool)
+    free[1:-1, 1:-1] = grid != '#'
+    return free.ravel(), cols + 2
+
+
+def _fill_padded(free, width, keep):
+    # Preenche os becos em `free` (plano, com borda); devolve quantas células
+    import numpy as np
+
+    kept = np.zeros_like(free)
+    for i, j in keep:
+        kept[(i + 1) * width + j + 1] = True
+
+    offsets = np.array([-width, width, -1, 1])
+    candidates = np.flatnonzero(free & ~kept)
+    filled = 0
+    while candidates.size >= _VECTOR_MIN_CANDIDATES:
+        counts = free[candidates[:, None] + offsets].sum(axis=1)
+        dead = candidates[counts <= 1]
+        if not dead.size:
+            return filled
+        free[dead] = False
+        filled += dead.size
+        # Só os vizinhos ainda livres das células removidas podem ter virado becos
+        neighbors = np.unique((dead[:, None] + offsets).ravel())
+        candidates = neighbors[free[neighbors] & ~kept[neighbors]]
+
+    # Poucos candidatos: pilha em Python (o ponto fixo é o mesmo em qualquer ordem)
+    cells = bytearray(free.tobytes())
+    kept_cells = set(np.flatnonzero(kept).tolist())
+    stack = candidates.tolist()
+    while stack:
+        cell = stack.pop()
+        if not cells[cell] or cell in kept_cells:
+            continue
+        if cells[cell - width] + cells[cell + width] + cells[cell - 1] + cells[cell + 1] <= 1:
+            cells[cell] = 0
+            filled += 1
+            stack.extend((cell - width, cell + width, cell - 1, cell + 1))
+    free[:] = np.frombuffer(bytes(cells), dtype=bool)
+    return filled
+
+
+def fill_dead_ends(maze, keep=()):
+    # Devolve (grade booleana de células livres restantes, células preenchidas)
+    rows, cols = maze.shape
+    free, width = _padded_free(maze)
+    filled = _fill_padded(free, width, keep)
+    return free.reshape(rows + 2, width)[1:-1, 1:-1], filled
+
+
+class ReducedMaze:
+    # Grafo ponderado dos corredores. Nós: coordenadas (i, j); adjacency[n] é
+    # uma lista de (vizinho, peso, células do meio na ordem de n ao vizinho).
+    # As células do meio ficam como índices planos (array 'i') e só viram
+    # coordenadas ao expandir o caminho encontrado.
+
+    def __init__(self, maze, keep=()):
+        import numpy as np
+
+        started = time.perf_counter()
+        keep = [tuple(pos) for pos in keep if pos is not None]
+        self.shape = maze.shape
+        free, width = _padded_free(maze)
+        self.width = width
+        self.free_cells = int(np.count_nonzero(free))
+        self.filled = _fill_padded(free, width, keep)
+        self.remaining_cells = int(np.count_nonzero(free))
+
+        # Grau de cada célula livre (vizinhos livres), vetorizado no vetor plano
+        # (a borda é parede, então os deslocamentos nunca saem do vetor)
+        counts = free.astype(np.int8)
+        degree = np.zeros_like(counts)
+        degree[width:-width] = (counts[:-2 * width] + counts[2 * width:]
+                                + counts[width - 1:-width - 1] + counts[width + 1:-width + 1])
+        is_node = free & (degree != 2)
+        for i, j in keep:
+            cell = (i + 1) * width + j + 1
+            is_node[cell] = free[cell]
+
+        cells = bytearray(free.tobytes())
+        node_cells = bytearray(is_node.tobytes())
+        steps = (-width, width, -1, 1)  # cima, baixo, esquerda, direita (como search.py)
+        self.nodes = [self.coord(cell) for cell in np.flatnonzero(is_node).tolist()]
+
+        self.adjacency = {}
+        self.edges = 0
+        for node in np.flatnonzero(is_node).tolist():
+            edges = []
+            for step in steps:
+                current = node + step
+                if not cells[current]:
+                    continue
+                previous, corridor = node, array('i')
+                # Anda pelo corredor até o próximo nó (cada célula do meio tem grau 2)
+                while not node_cells[current]:
+                    corridor.append(current)
+                    for next_step in steps:
+                        following = current + next_step
+                        if cells[following] and following != previous:
+                            break
+                    previous, current = current, following
+                if current != node:
+                    edges.append((self.coord(current), len(corridor) + 1, corridor))
+            self.adjacency[self.coord(node)] = edges
+            self.edges += len(edges)
+        # Cada aresta foi vista a partir das duas pontas
+        self.edges //= 2
+        self.build_time = time.perf_counter() - started
+
+    def coord(self, cell):
+        # Índice no vetor com borda -> (linha, coluna) no labirinto
+        i, j = divmod(cell, self.width)
+        return (i - 1, j - 1)
+
+    def check(self, maze, start, goal):
+        if maze.shape != self.shape:
+            raise ValueError(f"Reduced graph built for a {self.shape} maze, got {maze.shape}")
+        for name, pos in (('start', start), ('goal', goal)):
+            if pos not in self.adjacency:
+                raise ValueError(f"{name} {pos} is not a node of the reduced graph "
+                                 f"(build it with keep=(start, goal))")
+
+    def expand(self, came_from, goal):
+        # came_from[nó] = (nó anterior, células do meio); devolve o caminho célula a célula
+        segments = []
+        current = goal
+        while current in came_from:
+            previous, cells = came_from[current]
+            segments.append((current, cells))
+            current = previous
+        coord = self.coord
+        path = [current]
+        for node, cells in reversed(segments):
+            path.extend(coord(cell) for cell in cells)
+            path.append(node)
+        return path
+
+    def to_dict(self):
+        return {
+            'free_cells': self.free_cells,
+            'filled_dead_ends': self.filled,
+            'remaining_cells': self.remaining_cells,
+            'nodes': len(self.nodes),
+            'edges': self.edges,
+            'build_time': self.build_time
+        }
+
+
+def _reduced_search(start, goal, maze, reduced, algorithm_name, suppress_output, priority,
+                    reopen=False):
+
+    # Busca de melhor escolha no grafo reduzido. priority(g, nó) -> prioridade;
+    # None = DFS (pilha). Com reopen (Dijkstra e A*), um nó já na fronteira é
+    # reinserido se for alcançado com g menor, pois as arestas têm pesos
+    # diferentes; Greedy e DFS marcam o nó ao empilhar, como em search.py.
+    if reduced is None:
+        reduced = ReducedMaze(maze, keep=(start, goal))
+    reduced.check(maze, start, goal)
+
+    start_time = time.perf_counter()
+    mem_before = process_memory()
+
+    adjacency = reduced.adjacency
+    came_from = {}
+    g_score = {start: 0}
+    counter = 0
+    frontier = [start] if priority is None else [(priority(0, start), counter, start)]
+    counter += 1
+    visited = {start}
+    closed = set()
+    nodes_explored = 0
+    max_structure_size = len(frontier) + len(visited)
+    path = None
+
+    while frontier:
+        if priority is None:
+            current = frontier.pop()
+        else:
+            current = heapq.heappop(frontier)[2]
+            if current in closed:
+                continue
+            closed.add(current)
+        nodes_explored += 1
+
+        if current == goal:
+            path = reduced.expand(came_from, goal)
+            break
+
+        for neighbor, weight, cells in adjacency[current]:
+            cost = g_score[current] + weight
+            if reopen:
+                if neighbor in closed or cost >= g_score.get(neighbor, float('inf')):
+                    continue
+            elif neighbor in visited:
+                continue
+            visited.add(neighbor)
+            g_score[neighbor] = cost
+            came_from[neighbor] = (current, cells)
+            if priority is None:
+                frontier.append(neighbor)
+            else:
+                heapq.heappush(frontier, (priority(cost, neighbor), counter, neighbor))
+                counter += 1
+
+            current_size = len(frontier) + len(visited)
+            if current_size > max_structure_size:
+                max_structure_size = current_size
+
+    end_time = time.perf_counter()
+    memory_used = process_memory() - mem_before
+    if not suppress_output:
+        print_metrics(algorithm_name, path, nodes_explored, end_time - start_time, memory_used)
+        if path:
+            visualize_path(maze, path, algorithm_name)
+    return {
+        'path': path,
+        'nodes_explored': nodes_explored,
+        'execution_time': end_time - start_time,
+        'memory_used': memory_used,
+        'max_structure_size': max_structure_size
+    }
+
+
+def reduced_dijkstra(start, goal, maze, suppress_output=False, reduced=None):
+    # Equivalente ponderado da BFS (menor caminho)
+    return _reduced_search(start, goal, maze, reduced, "Dijkstra (grafo reduzido)",
+                           suppress_output, lambda cost, node: cost, reopen=True)
+
+
+def reduced_dfs(start, goal, maze, suppress_output=False, reduced=None):
+    return _reduced_search(start, goal, maze, reduced, "DFS (grafo reduzido)", suppress_output, None)
+
+
+def reduced_greedy_search(start, goal, maze, heuristic_func, suppress_output=False, reduced=None):
+    heuristic_name = heuristic_func.__name__.replace('_', ' ').title()
+    return _reduced_search(start, goal, maze, reduced, f"Greedy ({heuristic_name}, grafo reduzido)",
+                           suppress_output, lambda cost, node: heuristic_func(node, goal))
+
+
+def reduced_a_star(start, goal, maze, heuristic_func, suppress_output=False, reduced=None):
+    heuristic_name = heuristic_func.__name__.replace('_', ' ').title()
+    return _reduced_search(start, goal, maze, reduced, f"A* ({heuristic_name}, grafo reduzido)",
+                           suppress_output, lambda cost, node: cost + heuristic_func(node, goal),
+                           reopen=True)
+
+
+def reduced_algorithms():
+    # Mesmos nomes de profiling.search_algorithms, cada um com o equivalente reduzido
+    from functools import partial
+    from heuristics import euclidean_distance, manhattan_distance
+    return {
+        'bfs': reduced_dijkstra,
+        'dfs': reduced_dfs,
+        'greedy_manhattan': partial(reduced_greedy_search, heuristic_func=manhattan_distance),
+        'greedy_euclidean': partial(reduced_greedy_search, heuristic_func=euclidean_distance),
+        'a_star_manhattan': partial(reduced_a_star, heuristic_func=manhattan_distance),
+        'a_star_euclidean': partial(reduced_a_star, heuristic_func=euclidean_distance),
+    }
+
+
+def main(argv=None):
+    from maze import find_positions, generate_maze, load_maze
+    from profiling import search_algorithms
+
+    parser = argparse.ArgumentParser(description="Preenchimento de becos e colapso de corredores")
+    parser.add_argument('--maze', default=None, help="Arquivo do labirinto (padrão: labirinto.txt)")
+    parser.add_argument('--generate', type=int, default=None, metavar='SIZE',
+                        help="Gera um labirinto SIZE x SIZE em vez de ler um arquivo")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--loop-fraction', type=float, default=0.1,
+                        help="Paredes extras derrubadas no labirinto gerado (0 = labirinto perfeito)")
+    parser.add_argument('--show', action='store_true', help="Mostra o labirinto após o preenchimento")
+    args = parser.parse_args(argv)
+
+    if args.generate:
+        maze = generate_maze(args.generate, seed=args.seed, loop_fraction=args.loop_fraction)
+    else:
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        maze = load_maze(args.maze or os.path.join(current_dir, '..', 'data', 'labirinto.txt'))
+    start, goal = find_positions(maze)
+
+    reduced = ReducedMaze(maze, keep=(start, goal))
+    info = reduced.to_dict()
+    print(f"\n{'='*78}")
+    print(f"Labirinto {maze.shape[0]}x{maze.shape[1]}: {info['free_cells']} células livres")
+    print(f"Becos preenchidos: {info['filled_dead_ends']} "
+          f"({info['filled_dead_ends'] / max(info['free_cells'], 1) * 100:.1f}%), "
+          f"restam {info['remaining_cells']} células")
+    print(f"Grafo reduzido: {info['nodes']} nós, {info['edges']} arestas "
+          f"(pré-processamento {info['build_time'] * 1000:.1f} ms)")
+
+    if args.show:
+        import numpy as np
+
+        free, _ = fill_dead_ends(maze, (start, goal))
+        print(np.where(free | (maze == 'S') | (maze == 'G'), maze, '#'))
+
+    print(f"{'-'*78}")
+    print(f"{'Algoritmo':<18} {'Nós (grade)':>12} {'Nós (red.)':>11} {'Tempo grade':>12} "
+          f"{'Tempo red.':>11} {'Caminho':>12}")
+    grid_searches = search_algorithms()
+    for name, reduced_search in reduced_algorithms().items():
+        on_grid = grid_searches[name](start, goal, maze, suppress_output=True)
+        on_graph = reduced_search(start, goal, maze, suppress_output=True, reduced=reduced)
+        lengths = [len(result['path']) if result['path'] else 0 for result in (on_grid, on_graph)]
+        print(f"{name:<18} {on_grid['nodes_explored']:>12} {on_graph['nodes_explored']:>11} "
+              f"{on_grid['execution_time'] * 1000:>10.2f}ms {on_graph['execution_time'] * 1000:>9.2f}ms "
+              f"{lengths[0]:>5} → {lengths[1]:<5}")
+    print(f"{'='*78}")
+
+
+if __name__ == "__main__":
+    main()
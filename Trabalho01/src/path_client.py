@@ -0,0 +1,190 @@
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+import time
+from array import array
+
+from path_server import DEFAULT_ALGORITHM, DEFAULT_PORT
+
+# Gerador de carga para o path_server.py: mede vazão e latência (p50/p99).
+#
+# Abre --connections conexões e mantém --concurrency requisições em voo no
+# total (divididas entre as conexões, em pipeline: cada conexão envia sem
+# esperar as respostas anteriores). As consultas são --distinct pares
+# (início, objetivo) sorteados entre células livres do labirinto. Poucos pares
+# distintos exercitam o cache do servidor; muitos exercitam as buscas.
+# As latências são medidas no cliente (envio até resposta) e guardadas todas,
+# para quantis exatos.
+#
+# Uso:
+#   python path_client.py --requests 20000 --concurrency 64
+#   python path_client.py --maze big --distinct 100000 --algorithm bfs --duration 10
+#   python path_client.py --unix /tmp/paths.sock --distinct 50
+
+
+class Connection:
+    # Conexão com pipeline: respostas casadas com as requisições pelo "id"
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.waiting = {}
+        self.ids = itertools.count()
+        self.reader_task = asyncio.get_running_loop().create_task(self._read())
+
+    @classmethod
+    async def open(cls, host, port, unix_path=None):
+        # Respostas podem ser grandes (caminhos longos)
+        if unix_path:
+            reader, writer = await asyncio.open_unix_connection(unix_path, limit=1 << 26)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=1 << 26)
+        return cls(reader, writer)
+
+    async def _read(self):
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self.waiting.pop(response.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            error = ConnectionError("connection closed by the server")
+            for future in self.waiting.values():
+                if not future.done():
+                    future.set_exception(error)
+            self.waiting.clear()
+
+    async def request(self, op, **fields):
+        request_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[request_id] = future
+        self.writer.write(json.dumps({'id': request_id, 'op': op, **fields}).encode() + b'\n')
+        await self.writer.drain()
+        return await future
+
+    async def close(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+        self.reader_task.cancel()
+
+
+def percentile(ordered, p):
+    # Quantil exato com interpolação linear (como np.percentile)
+    if not ordered:
+        return math.nan
+    position = p * (len(ordered) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+async def run_load(args):
+    connections = [await Connection.open(args.host, args.port, args.unix)
+                   for _ in range(args.connections)]
+    control = connections[0]
+
+    info = await control.request('mazes')
+    if args.maze not in info['mazes']:
+        raise SystemExit(f"Labirinto {args.maze!r} não existe no servidor "
+                         f"(disponíveis: {', '.join(info['mazes'])})")
+    sample = await control.request('sample', maze=args.maze, count=2 * args.distinct, seed=args.seed)
+    cells = sample['cells']
+    rng = random.Random(args.seed)
+    queries = [(cells[2 * k], cells[2 * k + 1]) for k in range(len(cells) // 2)]
+    if not queries:
+        raise SystemExit("Sem células livres para montar consultas")
+
+    latencies = array('d')
+    counts = {'ok': 0, 'errors': 0, 'cached': 0, 'found': 0}
+    total = args.requests
+    deadline = time.perf_counter() + args.duration if args.duration else None
+    issued = itertools.count()
+
+    async def worker(connection):
+        while True:
+            number = next(issued)
+            if deadline is None and number >= total + args.warmup:
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            start, goal = queries[rng.randrange(len(queries))]
+            sent = time.perf_counter()
+            response = await connection.request('shortest_path', maze=args.maze, start=start,
+                                                goal=goal, algorithm=args.algorithm)
+            if number < args.warmup:
+                continue
+            latencies.append(time.perf_counter() - sent)
+            if response.get('ok'):
+                counts['ok'] += 1
+                counts['cached'] += bool(response.get('cached'))
+                counts['found'] += response.get('length', 0) > 0
+            else:
+                counts['errors'] += 1
+                if counts['errors'] == 1:
+                    print(f"Erro do servidor: {response.get('error')}")
+
+    began = time.perf_counter()
+    await asyncio.gather(*(worker(connections[k % len(connections)])
+                           for k in range(args.concurrency)))
+    elapsed = time.perf_counter() - began
+
+    stats = (await control.request('stats'))['stats']
+    for connection in connections:
+        await connection.close()
+    return latencies, counts, elapsed, stats
+
+
+def print_report(args, latencies, counts, elapsed, stats):
+    ordered = sorted(latencies)
+    done = len(ordered)
+    print(f"\n{'='*70}")
+    print(f"Carga: {args.algorithm} em {args.maze!r}, {args.concurrency} em voo, "
+          f"{args.connections} conexão(ões), {args.distinct} pares distintos")
+    print(f"{'='*70}")
+    print(f"Requisições: {done} em {elapsed:.2f}s → {done / elapsed:,.0f} req/s")
+    print(f"Respostas: {counts['ok']} ok, {counts['errors']} erro(s), "
+          f"{counts['cached']} do cache, {counts['found']} com caminho")
+    print(f"Latência (ms): p50 {percentile(ordered, 0.5)*1000:.3f}  "
+          f"p90 {percentile(ordered, 0.9)*1000:.3f}  p99 {percentile(ordered, 0.99)*1000:.3f}  "
+          f"p99.9 {percentile(ordered, 0.999)*1000:.3f}  máx {ordered[-1]*1000 if ordered else math.nan:.3f}")
+    cache = stats['cache']
+    batches = stats['batch_size']
+    print(f"Servidor: cache {cache['hit_rate']*100:.1f}% de acertos, "
+          f"{stats['coalesced']} agrupada(s) em voo, lote médio {batches['mean']:.1f} "
+          f"(máx. {batches['max']:.0f})")
+    print(f"{'='*70}")
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Gerador de carga para o path_server.py")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', default=None, metavar='PATH', help="Socket Unix em vez de TCP")
+    parser.add_argument('--maze', default='default', help="Labirinto no servidor")
+    parser.add_argument('--algorithm', default=DEFAULT_ALGORITHM)
+    parser.add_argument('--requests', type=int, default=10000, help="Total de requisições medidas")
+    parser.add_argument('--duration', type=float, default=None,
+                        help="Duração em segundos (em vez de --requests)")
+    parser.add_argument('--warmup', type=int, default=200, help="Requisições iniciais não medidas")
+    parser.add_argument('--concurrency', type=int, default=32, help="Requisições em voo no total")
+    parser.add_argument('--connections', type=int, default=4)
+    parser.add_argument('--distinct', type=int, default=1000, help="Pares (início, objetivo) distintos")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print_report(args, *asyncio.run(run_load(args)))
+
+
+if __name__ == "__main__":
+    main()
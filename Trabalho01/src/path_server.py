@@ -0,0 +1,573 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import time
+
+from heuristics import euclidean_distance, manhattan_distance
+from reachability import ReachabilityIndex
+from search_cache import LRUCache
+from stats_stream import LogHistogram, MetricSummary, RunningStats
+from workspace import SearchWorkspace
+
+# Servidor de consultas de caminho (asyncio, protocolo JSON-lines).
+#
+# Os labirintos são carregados uma vez e copiados para blocos de memória
+# compartilhada (um byte ASCII por célula). Os workers de um
+# ProcessPoolExecutor se conectam a esses blocos pelo nome e montam, uma vez
+# por labirinto, um SearchWorkspace (workspace.py), então nenhuma consulta
+# serializa o labirinto nem aloca as estruturas de busca.
+#
+# Cada requisição "shortest_path":
+#   0. se início e objetivo estão em componentes diferentes (ReachabilityIndex,
+#      calculado uma vez por labirinto), responde "sem caminho" na hora;
+#   1. procura a chave (labirinto, início, objetivo, algoritmo) no cache LRU;
+#   2. se a mesma chave já está em execução, espera o mesmo resultado
+#      (requisições idênticas simultâneas viram uma só busca);
+#   3. senão entra na fila; o agrupador junta até --batch-size requisições
+#      (esperando no máximo --batch-wait-ms) e manda o lote inteiro a um
+#      worker, diluindo o custo de ida e volta entre processos.
+# O worker já devolve o trecho JSON da resposta (caminho, comprimento, nós),
+# que é o que trafega entre processos e fica no cache: um acerto não
+# serializa o caminho de novo.
+# A latência de cada requisição (da leitura da linha até a resposta) vai para
+# um LatencySummary por algoritmo.
+#
+# Protocolo: uma requisição JSON por linha; as respostas saem na ordem em que
+# ficam prontas e trazem o mesmo "id".
+#   {"id": 1, "op": "shortest_path", "maze": "default", "start": [10, 0],
+#    "goal": [0, 10], "algorithm": "a_star_manhattan"}
+#   -> {"id": 1, "ok": true, "cached": false, "path": [[10, 0], ...],
+#       "length": 21, "nodes_explored": 53}
+#   {"id": 2, "op": "mazes"}                       -> labirintos carregados
+#   {"id": 3, "op": "sample", "maze": "default", "count": 100, "seed": 0}
+#                                                  -> células livres sorteadas
+#   {"id": 4, "op": "stats"}                       -> cache, lotes e latências
+#   {"id": 5, "op": "ping"}
+# Erros: {"id": ..., "ok": false, "error": "..."}.
+#
+# Uso:
+#   python path_server.py                                    # labirinto.txt em 127.0.0.1:8765
+#   python path_server.py --generate big=301:1 --workers 4
+#   python path_server.py --unix /tmp/paths.sock
+#   python path_client.py --maze big --requests 20000       # gerador de carga
+
+# Nome -> (método do SearchWorkspace, argumentos extras)
+ALGORITHMS = {
+    'bfs': (SearchWorkspace.bfs, ()),
+    'dfs': (SearchWorkspace.dfs, ()),
+    'greedy_manhattan': (SearchWorkspace.greedy_search, (manhattan_distance,)),
+    'greedy_euclidean': (SearchWorkspace.greedy_search, (euclidean_distance,)),
+    'a_star_manhattan': (SearchWorkspace.a_star, (manhattan_distance,)),
+    'a_star_euclidean': (SearchWorkspace.a_star, (euclidean_distance,)),
+}
+
+# BFS e A* garantem o menor caminho (custo unitário)
+DEFAULT_ALGORITHM = 'a_star_manhattan'
+
+DEFAULT_PORT = 8765
+
+# Linhas de requisição maiores que isso são recusadas
+MAX_LINE = 1 << 20
+
+# Requisições em andamento por conexão (controle de fluxo)
+MAX_PENDING_PER_CONNECTION = 1024
+
+# Máximo de células por requisição "sample"
+MAX_SAMPLE = 1_000_000
+
+# Resposta de "sem caminho" da pré-checagem (nenhum nó explorado)
+UNREACHABLE_BODY = b'"path":null,"length":0,"nodes_explored":0'
+
+# Classes por década do histograma de latências (erro relativo < 1,2%)
+LATENCY_BINS_PER_DECADE = 100
+
+
+# ----------------------------------------------------------------------------
+# Labirintos em memória compartilhada
+# ----------------------------------------------------------------------------
+
+class SharedMaze:
+    # Grade em um bloco de memória compartilhada; o servidor cria e remove,
+    # os workers só se conectam pelo nome (ver _worker_workspace)
+
+    def __init__(self, name, maze):
+        from multiprocessing import shared_memory
+
+        self.name = name
+        self.rows, self.cols = maze.shape
+        data = ''.join(''.join(row) for row in maze.tolist()).encode('ascii')
+        if len(data) != self.rows * self.cols:
+            raise ValueError(f"Maze {name!r}: every cell must be a single character")
+        self.shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        self.shm.buf[:len(data)] = data
+        self.open_cells = len(data) - data.count(b'#')
+        self.reachability = ReachabilityIndex(maze)
+
+    def spec(self):
+        return (self.shm.name, self.rows, self.cols)
+
+    def is_open(self, i, j):
+        return 0 <= i < self.rows and 0 <= j < self.cols and self.shm.buf[i * self.cols + j] != 35
+
+    def sample(self, count, seed=None):
+        # Células livres sorteadas (para o gerador de carga montar consultas)
+        rng = random.Random(seed)
+        cells = []
+        attempts = 0
+        while len(cells) < count and attempts < 100 * count:
+            attempts += 1
+            i, j = rng.randrange(self.rows), rng.randrange(self.cols)
+            if self.is_open(i, j):
+                cells.append([i, j])
+        return cells
+
+    def info(self):
+        return {'rows': self.rows, 'cols': self.cols, 'open_cells': self.open_cells,
+                'components': self.reachability.components}
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+# ----------------------------------------------------------------------------
+# Workers
+# ----------------------------------------------------------------------------
+
+_SPECS = {}
+_WORKSPACES = {}
+
+
+def _init_worker(specs):
+    global _SPECS
+    _SPECS = specs
+
+
+def _worker_workspace(maze_name):
+    # Montado na primeira consulta de cada labirinto e mantido no worker
+    workspace = _WORKSPACES.get(maze_name)
+    if workspace is None:
+        from multiprocessing import shared_memory
+
+        shm_name, rows, cols = _SPECS[maze_name]
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            workspace = SearchWorkspace.from_bytes(rows, cols, shm.buf)
+        finally:
+            shm.close()
+        _WORKSPACES[maze_name] = workspace
+    return workspace
+
+
+def run_batch(queries):
+    # Executa um lote de (labirinto, início, objetivo, algoritmo) no worker.
+    # O resultado é o trecho JSON '"path":...,"length":...,"nodes_explored":...'
+    # já codificado: uma string atravessa o pipe bem mais rápido que uma lista
+    # de tuplas, e o servidor só a cola na resposta.
+    results = []
+    for maze_name, start, goal, algorithm in queries:
+        started = time.perf_counter()
+        try:
+            method, extra = ALGORITHMS[algorithm]
+            path, nodes_explored, _ = method(_worker_workspace(maze_name), start, goal, *extra)
+        except Exception as error:
+            results.append({'error': f"{type(error).__name__}: {error}"})
+            continue
+        body = json.dumps({'path': path, 'length': len(path) if path else 0,
+                           'nodes_explored': nodes_explored}, separators=(',', ':'))[1:-1]
+        results.append({'body': body.encode(), 'service_time': time.perf_counter() - started})
+    return results
+
+
+# ----------------------------------------------------------------------------
+# Latências
+# ----------------------------------------------------------------------------
+
+class LatencySummary:
+    # Média/extremos (Welford) e quantis de um histograma logarítmico fino.
+    # Os quantis P² do MetricSummary não servem aqui: a distribuição é
+    # bimodal (acertos do cache em µs, buscas em dezenas de ms) e muda com o
+    # aquecimento do cache, e o P² chega a dar p90 < p50.
+
+    __slots__ = ('stats', 'histogram')
+
+    def __init__(self):
+        self.stats = RunningStats()
+        self.histogram = LogHistogram(LATENCY_BINS_PER_DECADE)
+
+    def add(self, value):
+        self.stats.add(value)
+        self.histogram.add(value)
+
+    def quantile(self, p):
+        # Centro da classe, limitado aos extremos observados
+        if not self.stats.count:
+            return float('nan')
+        return min(max(self.histogram.quantile(p), self.stats.min), self.stats.max)
+
+    def to_dict(self):
+        return {
+            'count': self.stats.count,
+            'mean': self.stats.mean,
+            'min': self.stats.min,
+            'max': self.stats.max,
+            'quantiles': {str(p): self.quantile(p) for p in (0.5, 0.9, 0.99, 0.999)},
+            'histogram': self.histogram.to_dict()
+        }
+
+
+# ----------------------------------------------------------------------------
+# Servidor
+# ----------------------------------------------------------------------------
+
+class RequestError(Exception):
+    pass
+
+
+class PathServer:
+
+    def __init__(self, mazes, workers=None, batch_size=32, batch_wait=0.001, cache_size=10000):
+        self.mazes = {}
+        try:
+            for name, maze in mazes.items():
+                self.mazes[name] = SharedMaze(name, maze)
+        except Exception:
+            self.close_mazes()
+            raise
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.cache = LRUCache(cache_size)
+        self.pending = {}
+        self.coalesced = 0
+        self.unreachable = 0
+        self.requests = 0
+        self.errors = 0
+        self.latency = {}
+        self.service = MetricSummary()
+        self.batch_sizes = MetricSummary()
+        self.pool = None
+        self._queue = None
+        self._slots = None
+        self._tasks = set()
+        self._server = None
+
+    # --- ciclo de vida ---
+
+    async def start(self, host='127.0.0.1', port=DEFAULT_PORT, unix_path=None):
+        from concurrent.futures import ProcessPoolExecutor
+
+        specs = {name: maze.spec() for name, maze in self.mazes.items()}
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                        initargs=(specs,))
+        self._queue = asyncio.Queue()
+        # Dois lotes por worker em voo: um executando e um já na fila do pool
+        self._slots = asyncio.Semaphore(2 * self.workers)
+        self._spawn(self._batcher())
+        if unix_path:
+            self._server = await asyncio.start_unix_server(self._handle_client, unix_path,
+                                                           limit=MAX_LINE)
+        else:
+            self._server = await asyncio.start_server(self._handle_client, host, port,
+                                                      limit=MAX_LINE)
+        return self._server
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in list(self._tasks):
+            task.cancel()
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+        self.close_mazes()
+
+    def close_mazes(self):
+        for maze in self.mazes.values():
+            maze.close()
+        self.mazes = {}
+
+    def _spawn(self, coroutine):
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    # --- conexões ---
+
+    async def _handle_client(self, reader, writer):
+        pending = asyncio.Semaphore(MAX_PENDING_PER_CONNECTION)
+        answers = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Linha maior que MAX_LINE: a conexão é encerrada
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                await pending.acquire()
+                task = self._spawn(self._answer(line, writer, pending))
+                answers.add(task)
+                task.add_done_callback(answers.discard)
+            # Fim da entrada (o cliente pode ter fechado só a escrita): responde
+            # o que já foi lido antes de fechar
+            if answers:
+                await asyncio.wait(answers)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def _answer(self, line, writer, pending):
+        received = time.perf_counter()
+        request_id = None
+        try:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise RequestError("request must be a JSON object")
+                request_id = request.get('id')
+                response = await self.dispatch(request)
+                response = {'id': request_id, 'ok': True, **response}
+            except (RequestError, ValueError) as error:
+                self.errors += 1
+                response = {'id': request_id, 'ok': False, 'error': str(error)}
+            except Exception as error:
+                # Falha inesperada: o cliente ainda recebe a resposta do seu id
+                self.errors += 1
+                response = {'id': request_id, 'ok': False,
+                            'error': f"internal error: {type(error).__name__}: {error}"}
+
+            label = response.pop('_label', None)
+            body = response.pop('_body', None)
+            encoded = json.dumps(response, separators=(',', ':')).encode()
+            if body is not None:
+                encoded = encoded[:-1] + b',' + body + b'}'
+            if label is not None:
+                metric = self.latency.get(label)
+                if metric is None:
+                    metric = self.latency[label] = LatencySummary()
+                metric.add(time.perf_counter() - received)
+            if not writer.is_closing():
+                writer.write(encoded + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            pending.release()
+
+    async def dispatch(self, request):
+        op = request.get('op', 'shortest_path')
+        if op == 'shortest_path':
+            return await self.shortest_path(request)
+        if op == 'mazes':
+            return {'mazes': {name: maze.info() for name, maze in self.mazes.items()},
+                    'algorithms': list(ALGORITHMS)}
+        if op == 'sample':
+            maze = self._maze(request)
+            count = request.get('count', 1)
+            seed = request.get('seed')
+            if not (isinstance(count, int) and not isinstance(count, bool) and 0 <= count <= MAX_SAMPLE):
+                raise RequestError(f"count must be an integer between 0 and {MAX_SAMPLE}")
+            if not (seed is None or (isinstance(seed, int) and not isinstance(seed, bool))):
+                raise RequestError("seed must be an integer or null")
+            return {'cells': maze.sample(count, seed)}
+        if op == 'stats':
+            return {'stats': self.stats()}
+        if op == 'ping':
+            return {}
+        raise RequestError(f"unknown op: {op!r}")
+
+    def _maze(self, request):
+        name = request.get('maze', 'default')
+        if not isinstance(name, str):
+            raise RequestError("maze must be a string")
+        maze = self.mazes.get(name)
+        if maze is None:
+            raise RequestError(f"unknown maze: {name!r}")
+        return maze
+
+    def _cell(self, maze, request, field):
+        value = request.get(field)
+        if not (isinstance(value, (list, tuple)) and len(value) == 2
+                and all(isinstance(x, int) for x in value)):
+            raise RequestError(f"{field} must be [row, col]")
+        if not maze.is_open(*value):
+            raise RequestError(f"{field} {list(value)} is a wall or outside the maze")
+        return tuple(value)
+
+    # --- consultas ---
+
+    async def shortest_path(self, request):
+        self.requests += 1
+        maze = self._maze(request)
+        start = self._cell(maze, request, 'start')
+        goal = self._cell(maze, request, 'goal')
+        algorithm = request.get('algorithm', DEFAULT_ALGORITHM)
+        if not isinstance(algorithm, str) or algorithm not in ALGORITHMS:
+            raise RequestError(f"unknown algorithm: {algorithm!r}")
+
+        if not maze.reachability.reachable(start, goal):
+            self.unreachable += 1
+            return {'_label': algorithm, '_body': UNREACHABLE_BODY, 'cached': False}
+
+        key = (maze.name, start, goal, algorithm)
+        result = self.cache.get(key)
+        cached = result is not None
+        if not cached:
+            future = self.pending.get(key)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self.pending[key] = future
+                self._queue.put_nowait((key, future))
+            else:
+                self.coalesced += 1
+            result = await asyncio.shield(future)
+
+        if 'error' in result:
+            raise RequestError(result['error'])
+        return {'_label': algorithm, '_body': result['body'], 'cached': cached}
+
+    def _drain(self, batch):
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    async def _batcher(self):
+        while True:
+            batch = [await self._queue.get()]
+            self._drain(batch)
+            if len(batch) < self.batch_size and self.batch_wait > 0:
+                await asyncio.sleep(self.batch_wait)
+                self._drain(batch)
+            await self._slots.acquire()
+            self._spawn(self._run_batch(batch))
+
+    async def _run_batch(self, batch):
+        try:
+            self.batch_sizes.add(len(batch))
+            loop = asyncio.get_running_loop()
+            try:
+                results = await loop.run_in_executor(self.pool, run_batch,
+                                                     [key for key, _ in batch])
+            except Exception as error:
+                results = [{'error': f"{type(error).__name__}: {error}"}] * len(batch)
+            for (key, future), result in zip(batch, results):
+                self.pending.pop(key, None)
+                if 'error' not in result:
+                    self.service.add(result['service_time'])
+                    self.cache.put(key, result)
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._slots.release()
+
+    def stats(self):
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'coalesced': self.coalesced,
+            'unreachable': self.unreachable,
+            'cache': self.cache.to_dict(),
+            'batch_size': self.batch_sizes.to_dict(),
+            'service_time': self.service.to_dict(),
+            'latency': {label: metric.to_dict() for label, metric in self.latency.items()},
+        }
+
+    def print_stats(self):
+        cache = self.cache.to_dict()
+        print(f"\n{'='*78}")
+        print(f"Requisições: {self.requests}  Erros: {self.errors}  "
+              f"Agrupadas em voo: {self.coalesced}  Sem caminho (pré-checagem): {self.unreachable}")
+        print(f"Cache: {cache['hits']} acertos, {cache['misses']} faltas "
+              f"({cache['hit_rate']*100:.1f}%), {cache['size']}/{cache['capacity']} entradas")
+        if self.batch_sizes.stats.count:
+            print(f"Lotes: {self.batch_sizes.stats.count} (tamanho médio {self.batch_sizes.mean:.1f}, "
+                  f"máx. {self.batch_sizes.max:.0f})")
+        print(f"{'-'*78}")
+        print(f"{'Latência (ms)':<22} {'n':>8} {'p50':>9} {'p90':>9} {'p99':>9} {'máx':>9}")
+        for label, metric in sorted(self.latency.items()):
+            print(f"{label:<22} {metric.stats.count:>8} {metric.quantile(0.5)*1000:>9.3f} "
+                  f"{metric.quantile(0.9)*1000:>9.3f} {metric.quantile(0.99)*1000:>9.3f} "
+                  f"{metric.stats.max*1000:>9.3f}")
+        print(f"{'='*78}")
+
+
+# ----------------------------------------------------------------------------
+# Linha de comando
+# ----------------------------------------------------------------------------
+
+def _parse_mazes(args):
+    # --maze nome=arquivo e --generate nome=lado[:semente]
+    from maze import generate_maze, load_maze
+
+    mazes = {}
+    for spec in args.maze:
+        name, _, path = spec.partition('=')
+        if not path:
+            raise SystemExit(f"--maze expects name=path, got {spec!r}")
+        mazes[name] = load_maze(path)
+    for spec in args.generate:
+        name, _, params = spec.partition('=')
+        size, _, seed = params.partition(':')
+        if not size.isdigit():
+            raise SystemExit(f"--generate expects name=size[:seed], got {spec!r}")
+        mazes[name] = generate_maze(int(size), seed=int(seed) if seed else None)
+    if not mazes:
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        mazes['default'] = load_maze(os.path.join(current_dir, '..', 'data', 'labirinto.txt'))
+    return mazes
+
+
+async def serve(args):
+    server = PathServer(_parse_mazes(args), args.workers, args.batch_size,
+                        args.batch_wait_ms / 1000, args.cache_size)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass
+
+    try:
+        await server.start(args.host, args.port, args.unix)
+        where = args.unix or f"{args.host}:{args.port}"
+        mazes = ', '.join(f"{name} ({maze.rows}x{maze.cols})" for name, maze in server.mazes.items())
+        print(f"Servindo em {where} com {server.workers} worker(s); labirintos: {mazes}", flush=True)
+        await stop.wait()
+    finally:
+        await server.close()
+        if args.unix and os.path.exists(args.unix):
+            os.remove(args.unix)
+        server.print_stats()
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Servidor de consultas de caminho (JSON-lines)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', default=None, metavar='PATH', help="Socket Unix em vez de TCP")
+    parser.add_argument('--maze', action='append', default=[], metavar='NAME=PATH',
+                        help="Labirinto em arquivo (repetível; padrão: default=labirinto.txt)")
+    parser.add_argument('--generate', action='append', default=[], metavar='NAME=SIZE[:SEED]',
+                        help="Labirinto gerado (repetível)")
+    parser.add_argument('--workers', type=int, default=None, help="Processos de busca (padrão: núcleos)")
+    parser.add_argument('--batch-size', type=int, default=32, help="Máximo de consultas por lote")
+    parser.add_argument('--batch-wait-ms', type=float, default=1.0,
+                        help="Espera para completar um lote (0 = só o que já está na fila)")
+    parser.add_argument('--cache-size', type=int, default=10000,
+                        help="Entradas do cache LRU (0 = sem cache)")
+    args = parser.parse_args(argv)
+    asyncio.run(serve(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+import argparse
+import math
+import os
+
+from stats_stream import ResultSink, read_jsonl, summarize_by
+
+# Gráficos de escalabilidade das buscas a partir de resumos em fluxo.
+#
+# Cada execução (algoritmo × tamanho × semente do labirinto) vai direto para
+# um AlgorithmSummary do seu grupo (e, se pedido, para um JSONL); os gráficos
+# só recebem quartis e extremos, então o custo de desenhar e a memória não
+# dependem do número de execuções. Um JSONL gravado antes também pode ser
+# resumido em uma passada (--from-jsonl).
+#
+# Gera, para cada métrica, a mediana × lado do labirinto em eixos log–log
+# (faixa do 1º ao 3º quartil e expoente k do ajuste y ∝ lado^k) e o boxplot
+# da métrica no maior labirinto.
+#
+# Uso:
+#   python plots.py --sizes 21 41 81 161 321 --seeds 5
+#   python plots.py --from-jsonl ../data/scaling.jsonl --metrics nodes_explored
+
+DEFAULT_SIZES = [21, 41, 81, 161, 321]
+
+# Métrica -> rótulo do eixo
+METRICS = {
+    'nodes_explored': 'Nós explorados',
+    'execution_time': 'Tempo (s)',
+    'max_structure_size': 'Tamanho máximo das estruturas',
+    'path_length': 'Comprimento do caminho',
+}
+
+COLORS = ['#ff6b6b', '#ffd93d', '#6bcf7f', '#4ecdc4', '#4d96ff', '#9b5de5']
+MARKERS = ['o', 's', 'D', '^', 'v', 'P', 'X', '*']
+
+
+def colors(count):
+    # Cores fixas para os 6 algoritmos; os demais seguem a paleta tab10
+    import matplotlib
+    palette = matplotlib.colormaps['tab10']
+    return [COLORS[i] if i < len(COLORS) else palette(i % 10) for i in range(count)]
+
+
+def run_scaling_study(algorithms, sizes, seeds, sink=None, verbose=True):
+    # Executa algoritmo × tamanho × semente e devolve {(algoritmo, lado): AlgorithmSummary}.
+    # O lado é o do labirinto gerado (generate_maze arredonda para ímpar).
+    from maze import find_positions, generate_maze
+    from profiling import search_algorithms
+
+    functions = search_algorithms()
+
+    def results():
+        for size in sizes:
+            for seed in seeds:
+                maze = generate_maze(size, seed=seed)
+                start, goal = find_positions(maze)
+                for name in algorithms:
+                    result = functions[name](start, goal, maze, suppress_output=True)
+                    # path_length explícito: o caminho não vai para o JSONL
+                    record = {'algorithm': name, 'size': maze.shape[0], 'seed': seed, **result,
+                              'path_length': len(result['path']) if result['path'] else None}
+                    if sink is not None:
+                        sink.write(record)
+                    if verbose:
+                        print(f"{name:<18} lado={maze.shape[0]:<5} semente={seed:<4} "
+                              f"{result['nodes_explored']} nós, {result['execution_time']:.6f}s")
+                    yield record
+
+    return summarize_by(results(), ('algorithm', 'size'))
+
+
+def scaling_series(summaries, metric):
+    # {algoritmo: {'size', 'q1', 'median', 'q3'}} de uma métrica, por lado crescente
+    series = {}
+    for (name, size), summary in sorted(summaries.items(), key=lambda item: (item[0][0], item[0][1])):
+        if metric not in summary:
+            continue
+        values = summary[metric]
+        entry = series.setdefault(name, {'size': [], 'q1': [], 'median': [], 'q3': []})
+        entry['size'].append(size)
+        entry['q1'].append(values.quantile(0.25))
+        entry['median'].append(values.median)
+        entry['q3'].append(values.quantile(0.75))
+    return series
+
+
+def fit_exponent(xs, ys):
+    # Inclinação da reta de mínimos quadrados em log–log (y ≈ c·x^k -> k);
+    # ignora pontos não positivos e devolve NaN com menos de dois
+    points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len(points) < 2:
+        return math.nan
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    if sxx == 0:
+        return math.nan
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / sxx
+
+
+def plot_scaling(ax, series, ylabel):
+    from matplotlib.ticker import NullLocator, ScalarFormatter
+
+    palette = colors(len(series))
+    for i, (name, entry) in enumerate(series.items()):
+        exponent = fit_exponent(entry['size'], entry['median'])
+        label = name if math.isnan(exponent) else f"{name} (∝ lado^{exponent:.2f})"
+        ax.plot(entry['size'], entry['median'], color=palette[i], marker=MARKERS[i % len(MARKERS)],
+                linewidth=2, label=label)
+        ax.fill_between(entry['size'], entry['q1'], entry['q3'], color=palette[i], alpha=0.2)
+
+    # Eixos log–log, com as marcas do eixo x nos próprios lados
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    sizes = sorted({size for entry in series.values() for size in entry['size']})
+    ax.set_xticks(sizes)
+    ax.xaxis.set_major_formatter(ScalarFormatter())
+    ax.xaxis.set_minor_locator(NullLocator())
+    ax.set_xlabel('Lado do labirinto (células)', fontweight='bold')
+    ax.set_ylabel(ylabel, fontweight='bold')
+    ax.set_title(f"Escalabilidade: {ylabel} (log–log)", fontweight='bold')
+    ax.grid(True, which='both', alpha=0.3, linestyle='--')
+    ax.legend(loc='upper left', fontsize=8)
+
+
+def plot_distribution(ax, summaries, metric, ylabel):
+    # Boxplot montado a partir dos quantis: caixa do 1º ao 3º quartil,
+    # bigodes do mínimo ao P99 e o máximo como ponto isolado
+    names = list(summaries)
+    stats = []
+    for name in names:
+        values = summaries[name][metric]
+        stats.append({'label': name, 'whislo': values.min, 'q1': values.quantile(0.25),
+                      'med': values.median, 'q3': values.quantile(0.75),
+                      'whishi': values.quantile(0.99), 'fliers': [values.max]})
+
+    boxes = ax.bxp(stats, patch_artist=True, medianprops=dict(color='black', linewidth=2),
+                   flierprops=dict(marker='x', markersize=6))
+    for box, color in zip(boxes['boxes'], colors(len(names))):
+        box.set_facecolor(color)
+        box.set_alpha(0.7)
+
+    ax.set_yscale('log')
+    ax.set_ylabel(ylabel, fontweight='bold')
+    ax.tick_params(axis='x', labelrotation=15, labelsize=9)
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+
+
+def save_figure(draw, path, dpi=150):
+    # Figure + canvas Agg (sem pyplot); grava em arquivo temporário e troca
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    draw(fig.subplots())
+    fig.tight_layout()
+    temporary = path + '.tmp.png'
+    fig.savefig(temporary, dpi=dpi)
+    os.replace(temporary, path)
+    return path
+
+
+def plot_summaries(summaries, output_dir, metrics=('nodes_explored', 'execution_time'), dpi=150):
+    # Um gráfico de escalabilidade por métrica e o boxplot no maior labirinto
+    os.makedirs(output_dir, exist_ok=True)
+    largest = max(size for _, size in summaries)
+    at_largest = {name: summary for (name, size), summary in summaries.items() if size == largest}
+
+    saved = []
+    for metric in metrics:
+        ylabel = METRICS.get(metric, metric)
+        series = scaling_series(summaries, metric)
+        if not series:
+            continue
+        saved.append(save_figure(lambda ax: plot_scaling(ax, series, ylabel),
+                                 os.path.join(output_dir, f'scaling_{metric}.png'), dpi))
+
+        def draw(ax):
+            plot_distribution(ax, {name: summary for name, summary in at_largest.items()
+                                   if metric in summary}, metric, ylabel)
+            ax.set_title(f"{ylabel}: distribuição no labirinto {largest}x{largest}", fontweight='bold')
+
+        saved.append(save_figure(draw, os.path.join(output_dir, f'distribution_{metric}.png'), dpi))
+    return saved
+
+
+def print_exponents(summaries, metrics):
+    print(f"\n{'='*60}")
+    print(f"{'Algoritmo':<20} " + ' '.join(f"{'k ' + metric:>18}" for metric in metrics))
+    print(f"{'-'*60}")
+    per_metric = {metric: scaling_series(summaries, metric) for metric in metrics}
+    for name in sorted({name for name, _ in summaries}):
+        row = []
+        for metric in metrics:
+            entry = per_metric[metric].get(name)
+            exponent = fit_exponent(entry['size'], entry['median']) if entry else math.nan
+            row.append(f"{exponent:>18.2f}")
+        print(f"{name:<20} " + ' '.join(row))
+    print(f"{'='*60}")
+
+
+def main(argv=None):
+    from profiling import search_algorithms
+
+    names = list(search_algorithms())
+    parser = argparse.ArgumentParser(description="Gráficos de escalabilidade das buscas (log–log)")
+    parser.add_argument('--algorithms', nargs='+', default=names, choices=names)
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES,
+                        help="Lados dos labirintos gerados (ímpares)")
+    parser.add_argument('--seeds', type=int, default=5, help="Labirintos por tamanho (sementes 0..k-1)")
+    parser.add_argument('--metrics', nargs='+', default=['nodes_explored', 'execution_time'],
+                        help=f"Métricas ({', '.join(METRICS)})")
+    parser.add_argument('--from-jsonl', default=None,
+                        help="Resume um JSONL gravado antes em vez de executar as buscas")
+    parser.add_argument('--jsonl', default=None, help="Grava cada execução neste JSONL")
+    parser.add_argument('--output', default=os.path.join('..', 'data', 'plots'),
+                        help="Diretório dos gráficos")
+    parser.add_argument('--dpi', type=int, default=150)
+    args = parser.parse_args(argv)
+
+    if args.from_jsonl:
+        summaries = summarize_by(read_jsonl(args.from_jsonl), ('algorithm', 'size'))
+    elif args.jsonl:
+        with ResultSink(args.jsonl, exclude=('path',)) as sink:
+            summaries = run_scaling_study(args.algorithms, args.sizes, range(args.seeds), sink)
+    else:
+        summaries = run_scaling_study(args.algorithms, args.sizes, range(args.seeds))
+
+    print_exponents(summaries, args.metrics)
+    for path in plot_summaries(summaries, args.output, args.metrics, args.dpi):
+        print(f"✅ Salvo: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+import argparse
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from functools import partial, wraps
+
+# Perfilamento das buscas sem instrumentar o código à mão.
+#
+# profile_call() executa qualquer função sob cProfile (determinístico) ou sob
+# um profiler por amostragem (thread que lê sys._current_frames() a cada
+# `interval` segundos). O resultado é um Profile com:
+#   - stacks: pilha (tupla de frames, da raiz para a folha) -> segundos;
+#   - functions: frame -> chamadas, tempo próprio e tempo total.
+# As pilhas são gravadas em formato "collapsed" (flamegraph.pl, speedscope,
+# inferno) e em JSON do speedscope; HotFunctionTable agrega as funções mais
+# caras de várias execuções. Contraparte: Trabalho02/src/perfilamento.py.
+#
+# Uso:
+#   python profiling.py --algorithms a_star_manhattan bfs --sizes 101 301 --runs 5
+#   python profiling.py --profiler sampling --interval 0.0005 --sizes 501
+
+PROFILERS = ('cprofile', 'sampling')
+
+# Pilhas do cProfile mais profundas que isso são truncadas
+MAX_DEPTH = 64
+
+
+def frame_label(filename, line, name):
+    # Nome de frame sem ';' (separador do formato collapsed)
+    if filename == '~':
+        return name.replace(';', ',')
+    return f"{name} ({os.path.basename(filename)}:{line})".replace(';', ',')
+
+
+def _code_label(code):
+    return frame_label(code.co_filename, code.co_firstlineno, code.co_name)
+
+
+class Profile:
+
+    def __init__(self, label='', profiler='cprofile'):
+        self.label = label
+        self.profiler = profiler
+        self.stacks = Counter()
+        self.functions = {}
+        self.elapsed = 0.0
+        self.runs = 0
+
+    def merge(self, other):
+        self.stacks.update(other.stacks)
+        for name, row in other.functions.items():
+            mine = self.functions.setdefault(name, {'calls': 0, 'self': 0.0, 'total': 0.0})
+            for key in mine:
+                mine[key] += row[key]
+        self.elapsed += other.elapsed
+        self.runs += other.runs
+
+
+# ----------------------------------------------------------------------------
+# cProfile
+# ----------------------------------------------------------------------------
+
+def _profile_from_pstats(stats, profile):
+    # O cProfile só guarda arestas chamador -> chamado. As pilhas são
+    # reconstruídas a partir das raízes: o tempo de cada função é dividido
+    # entre os chamadores na proporção do tempo acumulado de cada aresta.
+    entries = stats.stats
+    labels = {key: frame_label(*key) for key in entries}
+
+    callees = defaultdict(list)
+    for key, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees[caller].append((key, edge[3]))
+
+    def walk(key, path, keys, fraction):
+        _, _, tottime, cumtime, _ = entries[key]
+        if tottime * fraction > 0:
+            profile.stacks[path] += tottime * fraction
+        if len(path) >= MAX_DEPTH:
+            return
+        for child, edge_cumtime in callees.get(key, ()):
+            child_cumtime = entries[child][3]
+            if child in keys or not child_cumtime:
+                continue
+            share = fraction * edge_cumtime / child_cumtime
+            if share > 1e-9:
+                walk(child, path + (labels[child],), keys | {child}, share)
+
+    for key, (_, _, _, _, callers) in entries.items():
+        if not callers:
+            walk(key, (labels[key],), frozenset([key]), 1.0)
+
+    for key, (_, calls, tottime, cumtime, _) in entries.items():
+        profile.functions[labels[key]] = {'calls': calls, 'self': tottime, 'total': cumtime}
+
+
+def _run_cprofile(func, args, kwargs, profile):
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args, **kwargs)
+    stats = pstats.Stats(profiler)
+    # Remove o próprio profiler.disable() que o runcall registra
+    stats.stats = {key: value for key, value in stats.stats.items()
+                   if "_lsprof.Profiler" not in key[2]}
+    for key, (cc, nc, tt, ct, callers) in stats.stats.items():
+        stats.stats[key] = (cc, nc, tt, ct,
+                            {c: e for c, e in callers.items() if c in stats.stats})
+    _profile_from_pstats(stats, profile)
+    return result
+
+
+# ----------------------------------------------------------------------------
+# Amostragem
+# ----------------------------------------------------------------------------
+
+class SamplingProfiler:
+    # Lê a pilha da thread alvo a cada `interval` segundos. Custo quase nulo
+    # para o código medido, mas só vê o que dura mais que o intervalo.
+
+    def __init__(self, interval=0.001, skip=0):
+        self.interval = interval
+        self.skip = skip
+        self.samples = Counter()
+        self._target = None
+        self.active = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None:
+                stack.append(_code_label(frame.f_code))
+                frame = frame.f_back
+            stack.reverse()
+            if self.active and len(stack) > self.skip:
+                self.samples[tuple(stack[self.skip:])] += 1
+
+    def start(self):
+        self._target = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+def _stack_depth(frame):
+    depth = 0
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+def _run_sampling(func, args, kwargs, profile, interval):
+    # Descarta os frames até este (inclusive): as pilhas começam em `func`
+    sampler = SamplingProfiler(interval, skip=_stack_depth(sys._getframe()))
+    sampler.start()
+    start = time.perf_counter()
+    sampler.active = True
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        sampler.active = False
+        elapsed = time.perf_counter() - start
+        sampler.stop()
+
+    total = sum(sampler.samples.values())
+    if total:
+        # Cada amostra vale o tempo real dividido pelo número de amostras
+        weight = elapsed / total
+        for stack, count in sampler.samples.items():
+            profile.stacks[stack] += count * weight
+            for name in set(stack):
+                row = profile.functions.setdefault(name, {'calls': 0, 'self': 0.0, 'total': 0.0})
+                row['total'] += count * weight
+            profile.functions[stack[-1]]['self'] += count * weight
+    return result
+
+
+def profile_call(func, args=(), kwargs=None, profiler='cprofile', interval=0.001, label=None):
+    # Executa func(*args, **kwargs) sob o profiler escolhido.
+    # Retorna (resultado, Profile).
+    kwargs = kwargs or {}
+    profile = Profile(label or getattr(func, '__name__', 'profile'), profiler)
+    start = time.perf_counter()
+    if profiler == 'cprofile':
+        result = _run_cprofile(func, args, kwargs, profile)
+    elif profiler == 'sampling':
+        result = _run_sampling(func, args, kwargs, profile, interval)
+    else:
+        raise ValueError(f"Profiler desconhecido: {profiler!r} (use {PROFILERS})")
+    profile.elapsed = time.perf_counter() - start
+    profile.runs = 1
+    return result, profile
+
+
+# ----------------------------------------------------------------------------
+# Exportação e agregação
+# ----------------------------------------------------------------------------
+
+def write_collapsed(profile, path):
+    # Uma linha por pilha: "raiz;...;folha <microssegundos>"
+    with open(path, 'w', encoding='utf-8') as file:
+        for stack, seconds in sorted(profile.stacks.items()):
+            weight = round(seconds * 1e6)
+            if weight > 0:
+                file.write(f"{';'.join(stack)} {weight}\n")
+
+
+def write_speedscope(profile, path):
+    frames, index = [], {}
+    samples, weights = [], []
+    for stack, seconds in profile.stacks.items():
+        for name in stack:
+            if name not in index:
+                index[name] = len(frames)
+                frames.append({'name': name})
+        samples.append([index[name] for name in stack])
+        weights.append(seconds)
+
+    document = {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'shared': {'frames': frames},
+        'profiles': [{
+            'type': 'sampled',
+            'name': f"{profile.label} ({profile.profiler}, {profile.runs} execuções)",
+            'unit': 'seconds',
+            'startValue': 0,
+            'endValue': sum(weights),
+            'samples': samples,
+            'weights': weights
+        }],
+        'name': profile.label,
+        'exporter': 'profiling.py'
+    }
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(document, file)
+
+
+def save_profile(profile, output_dir):
+    # Grava <label>.folded e <label>.speedscope.json; retorna os caminhos
+    os.makedirs(output_dir, exist_ok=True)
+    base = os.path.join(output_dir, profile.label.replace(os.sep, '_'))
+    write_collapsed(profile, base + '.folded')
+    write_speedscope(profile, base + '.speedscope.json')
+    return base + '.folded', base + '.speedscope.json'
+
+
+class HotFunctionTable:
+    # Agrega as funções de vários Profiles (execuções, tamanhos...)
+
+    def __init__(self):
+        self.rows = {}
+        self.runs = 0
+        self.elapsed = 0.0
+
+    def add(self, profile):
+        self.runs += profile.runs
+        self.elapsed += profile.elapsed
+        for name, row in profile.functions.items():
+            mine = self.rows.setdefault(name, {'calls': 0, 'self': 0.0, 'total': 0.0})
+            for key in mine:
+                mine[key] += row[key]
+
+    def top(self, count=15, key='self'):
+        return sorted(self.rows.items(), key=lambda item: item[1][key], reverse=True)[:count]
+
+    def print(self, title='', count=15, key='self'):
+        print(f"\n{'='*100}")
+        print(f"FUNÇÕES MAIS CARAS{' - ' + title if title else ''} "
+              f"({self.runs} execuções, {self.elapsed:.4f}s)")
+        print(f"{'='*100}")
+        print(f"{'Próprio (s)':>12} {'%':>6} {'Total (s)':>12} {'Chamadas':>10}  Função")
+        print("-" * 100)
+        for name, row in self.top(count, key):
+            share = row['self'] / self.elapsed * 100 if self.elapsed else 0.0
+            calls = row['calls'] if row['calls'] else '-'
+            print(f"{row['self']:>12.6f} {share:>5.1f}% {row['total']:>12.6f} {calls:>10}  {name}")
+        print("=" * 100)
+
+
+def profile(func=None, *, profiler='cprofile', output_dir=None, interval=0.001, table=None):
+    # Decorador: @profile ou @profile(profiler='sampling', output_dir='../data/profiles').
+    # Sem output_dir/table, imprime as funções mais caras de cada chamada.
+    if func is None:
+        return partial(profile, profiler=profiler, output_dir=output_dir,
+                       interval=interval, table=table)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        result, data = profile_call(func, args, kwargs, profiler, interval)
+        if output_dir:
+            save_profile(data, output_dir)
+        if table is not None:
+            table.add(data)
+        elif not output_dir:
+            report = HotFunctionTable()
+            report.add(data)
+            report.print(func.__name__, count=10)
+        return result
+    return wrapper
+
+
+# ----------------------------------------------------------------------------
+# Linha de comando: algoritmos × tamanhos de labirinto
+# ----------------------------------------------------------------------------
+
+def search_algorithms():
+    from heuristics import euclidean_distance, manhattan_distance
+    from search import a_star, bfs, bfs_vectorized, dfs, greedy_search
+    return {
+        'bfs': bfs,
+        'bfs_vectorized': bfs_vectorized,
+        'dfs': dfs,
+        'greedy_manhattan': partial(greedy_search, heuristic_func=manhattan_distance),
+        'greedy_euclidean': partial(greedy_search, heuristic_func=euclidean_distance),
+        'a_star_manhattan': partial(a_star, heuristic_func=manhattan_distance),
+        'a_star_euclidean': partial(a_star, heuristic_func=euclidean_distance),
+    }
+
+
+def main(argv=None):
+    from maze import find_positions, generate_maze
+
+    algorithms = search_algorithms()
+    parser = argparse.ArgumentParser(description="Perfilamento dos algoritmos de busca")
+    parser.add_argument('--algorithms', nargs='+', default=['bfs', 'a_star_manhattan'],
+                        choices=list(algorithms))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[101, 301],
+                        help="Lados dos labirintos gerados (ímpares)")
+    parser.add_argument('--runs', type=int, default=3, help="Execuções por algoritmo e tamanho")
+    parser.add_argument('--profiler', choices=PROFILERS, default='cprofile')
+    parser.add_argument('--interval', type=float, default=0.001,
+                        help="Intervalo de amostragem em segundos (profiler 'sampling')")
+    parser.add_argument('--seed', type=int, default=0, help="Semente dos labirintos")
+    parser.add_argument('--top', type=int, default=15, help="Linhas da tabela de funções")
+    parser.add_argument('--output', default=os.path.join('..', 'data', 'profiles'),
+                        help="Diretório dos arquivos .folded e .speedscope.json")
+    args = parser.parse_args(argv)
+
+    for size in args.sizes:
+        maze = generate_maze(size, seed=args.seed)
+        start, goal = find_positions(maze)
+        for name in args.algorithms:
+            label = f"{name}_{maze.shape[0]}x{maze.shape[1]}"
+            merged = Profile(label, args.profiler)
+            for _ in range(args.runs):
+                _, data = profile_call(algorithms[name], (start, goal, maze),
+                                       {'suppress_output': True}, args.profiler, args.interval)
+                merged.merge(data)
+
+            table = HotFunctionTable()
+            table.add(merged)
+            table.print(label, args.top)
+            for path in save_profile(merged, args.output):
+                print(f"✅ Salvo: {path}")
+
+
+if __name__ == "__main__":
+    main()
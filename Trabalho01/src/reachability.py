@@ -0,0 +1,99 @@
+# Índice de alcançabilidade: componentes conexas das células livres.
+#
+# Quando o objetivo não é alcançável, qualquer busca (BFS, DFS, Greedy, A*)
+# explora toda a região do início antes de devolver 'path': None, o pior caso
+# possível em labirintos grandes. Com as componentes rotuladas uma vez por
+# labirinto, "há caminho?" vira comparar dois rótulos: O(1).
+#
+# Rotulação vetorizada (union-find em NumPy, sem laço por célula):
+#   - as arestas são os pares de células livres vizinhas (direita e abaixo);
+#   - cada rodada liga a raiz maior de cada aresta à menor (np.minimum.at) e
+#     depois comprime os ponteiros (labels = labels[labels]) até estabilizar;
+#   - termina quando as duas pontas de toda aresta têm o mesmo rótulo.
+# O rótulo final de uma componente é o menor índice de célula dela; paredes
+# ficam com -1. Para labirintos 301x301 leva poucos milissegundos.
+#
+# Uso:
+#   reachability = ReachabilityIndex(maze)
+#   reachability.reachable(start, goal)
+#   a_star(start, goal, maze, manhattan_distance, reachability=reachability)
+
+
+def component_labels(free):
+    # free: matriz booleana (True = livre) -> rótulos int64 de mesmo formato
+    import numpy as np
+
+    rows, cols = free.shape
+    flat = free.ravel()
+    index = np.arange(rows * cols, dtype=np.int64).reshape(rows, cols)
+
+    # Pares de células livres vizinhas (cada aresta uma vez)
+    horizontal = free[:, :-1] & free[:, 1:]
+    vertical = free[:-1, :] & free[1:, :]
+    u = np.concatenate([index[:, :-1][horizontal], index[:-1, :][vertical]])
+    v = np.concatenate([index[:, 1:][horizontal], index[1:, :][vertical]])
+
+    labels = index.ravel().copy()
+    while True:
+        lu, lv = labels[u], labels[v]
+        differ = lu != lv
+        if not differ.any():
+            break
+        u, v, lu, lv = u[differ], v[differ], lu[differ], lv[differ]
+        # Liga as raízes: a maior passa a apontar para a menor
+        np.minimum.at(labels, np.maximum(lu, lv), np.minimum(lu, lv))
+        # Compressão de caminho até cada célula apontar para a sua raiz
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+    labels[~flat] = -1
+    return labels.reshape(rows, cols)
+
+
+class ReachabilityIndex:
+
+    __slots__ = ('shape', 'labels', 'sizes', 'components')
+
+    def __init__(self, maze):
+        import numpy as np
+
+        grid = np.asarray(maze)
+        self.shape = grid.shape
+        self.labels = component_labels(grid != '#')
+        # Células por componente (indexado pelo rótulo)
+        free_labels = self.labels[self.labels >= 0]
+        self.sizes = np.bincount(free_labels, minlength=grid.size) if free_labels.size else np.zeros(0, int)
+        self.components = int(np.count_nonzero(self.sizes))
+
+    def check(self, maze):
+        # O índice só vale para o labirinto com que foi criado
+        if maze.shape != self.shape:
+            raise ValueError(f"Reachability index created for a {self.shape} maze, got {maze.shape}")
+
+    def component(self, pos):
+        # Rótulo da componente da célula, ou -1 para parede/fora da grade
+        i, j = pos
+        if 0 <= i < self.shape[0] and 0 <= j < self.shape[1]:
+            return int(self.labels[i, j])
+        return -1
+
+    def reachable(self, start, goal):
+        label = self.component(start)
+        return label >= 0 and label == self.component(goal)
+
+    def component_size(self, pos):
+        label = self.component(pos)
+        return int(self.sizes[label]) if label >= 0 else 0
+
+    def validate(self, start, goal):
+        # Confere as posições de find_positions: ambas precisam existir e ser
+        # livres. Devolve se há caminho entre elas.
+        for name, pos in (('Start (S)', start), ('Goal (G)', goal)):
+            if pos is None:
+                raise ValueError(f"{name} not found in the maze")
+            if self.component(pos) < 0:
+                raise ValueError(f"{name} at {pos} is a wall or outside the maze")
+        return self.reachable(start, goal)
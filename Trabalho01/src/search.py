@@ -1,16 +1,22 @@
-import numpy as np
 from collections import deque
 import time
 import os
-import psutil
 import gc
-import ctypes
 from heuristics import euclidean_distance, manhattan_distance
+from stats_stream import AlgorithmSummary, summarize_results
+from benchmarking import measure_warm, robust_summary, run_in_fresh_process
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
 
 def process_memory():
-    process = psutil.Process(os.getpid())
-    mem_info = process.memory_info()
-    return mem_info.rss
+    # RSS do processo. No Linux lê /proc/self/statm direto (o psutil custa
+    # dezenas de ms para importar e só é carregado nos outros sistemas)
+    try:
+        with open('/proc/self/statm', 'rb') as file:
+            return int(file.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss
 
 def clear_cache():
 
@@ -22,23 +28,11 @@ def clear_cache():
 
     try:
         if os.name == 'nt': 
+            import ctypes
             ctypes.windll.kernel32.SetProcessWorkingSetSize(-1, -1, -1)
     except:
         pass
 
-# decorator function
-def profile(func):
-    def wrapper(*args, **kwargs):
-        mem_before = process_memory()
-        result = func(*args, **kwargs)
-        mem_after = process_memory()
-        print("{}:consumed memory: {:,} bytes".format(
-            func.__name__,
-            mem_after - mem_before))
-
-        return result
-    return wrapper
-
 def is_valid(pos, maze, visited):
 
     i, j = pos
@@ -79,44 +73,33 @@ def print_metrics(algorithm_name, path, nodes_explored, execution_time, memory_u
 
 def print_statistics(algorithm_name, results):
  
-    times = [r['execution_time'] for r in results]
-    memories = [r['memory_used'] for r in results]
-    nodes = [r['nodes_explored'] for r in results]
-    max_structures = [r['max_structure_size'] for r in results]
-    
-    avg_time = np.mean(times)
-    std_time = np.std(times)
-    min_time = np.min(times)
-    max_time = np.max(times)
-    
-    avg_memory = np.mean(memories)
-    std_memory = np.std(memories)
-    min_memory = np.min(memories)
-    max_memory = np.max(memories)
-    
-    avg_nodes = np.mean(nodes)
-    avg_max_structures = np.mean(max_structures)
+    # Aceita lista de resultados ou um AlgorithmSummary acumulado em fluxo
+    summary = summarize_results(results, algorithm_name)
+    times = summary['execution_time']
+    memories = summary['memory_used']
     
     print(f"\n{'='*70}")
-    print(f"ESTATÍSTICAS - {algorithm_name} (10 execuções em Cold Cache)")
+    print(f"ESTATÍSTICAS - {algorithm_name} ({summary.runs} execuções em Cold Cache)")
     print(f"{'='*70}")
-    print(f"Nós explorados (média): {avg_nodes:.0f}")
-    print(f"Máximo de elementos nas estruturas (média): {avg_max_structures:.0f}")
+    print(f"Nós explorados (média): {summary.mean('nodes_explored'):.0f}")
+    print(f"Máximo de elementos nas estruturas (média): {summary.mean('max_structure_size'):.0f}")
     print(f"  (fronteira + visitados simultaneamente)")
     print(f"\nTempo de execução:")
-    print(f"  Média: {avg_time:.6f} segundos")
-    print(f"  Desvio padrão: {std_time:.6f} segundos")
-    print(f"  Mínimo: {min_time:.6f} segundos")
-    print(f"  Máximo: {max_time:.6f} segundos")
+    print(f"  Média: {times.mean:.6f} segundos")
+    print(f"  Desvio padrão: {times.std:.6f} segundos")
+    print(f"  Mediana: {times.median:.6f} segundos")
+    print(f"  Mínimo: {times.min:.6f} segundos")
+    print(f"  Máximo: {times.max:.6f} segundos")
     print(f"\nMemória consumida:")
-    print(f"  Média: {avg_memory:,.0f} bytes ({avg_memory / 1024:.2f} KB)")
-    print(f"  Desvio padrão: {std_memory:,.0f} bytes ({std_memory / 1024:.2f} KB)")
-    print(f"  Mínimo: {min_memory:,.0f} bytes ({min_memory / 1024:.2f} KB)")
-    print(f"  Máximo: {max_memory:,.0f} bytes ({max_memory / 1024:.2f} KB)")
+    print(f"  Média: {memories.mean:,.0f} bytes ({memories.mean / 1024:.2f} KB)")
+    print(f"  Desvio padrão: {memories.std:,.0f} bytes ({memories.std / 1024:.2f} KB)")
+    print(f"  Mínimo: {memories.min:,.0f} bytes ({memories.min / 1024:.2f} KB)")
+    print(f"  Máximo: {memories.max:,.0f} bytes ({memories.max / 1024:.2f} KB)")
     
-    if results[0]['path']:
-        print(f"\nTamanho do caminho: {len(results[0]['path'])}")
-        print(f"Caminho: {' -> '.join([str(p) for p in results[0]['path']])}")
+    first_path = summary.first_result['path'] if summary.first_result else None
+    if first_path:
+        print(f"\nTamanho do caminho: {len(first_path)}")
+        print(f"Caminho: {' -> '.join([str(p) for p in first_path])}")
     
     print(f"{'='*70}\n")
 
@@ -134,34 +117,124 @@ def visualize_path(maze, path, algorithm_name):
     print(f"\nCaminho encontrado pelo {algorithm_name}:")
     print(visual)
 
-def run_with_cold_cache(algorithm_func, start, goal, maze, algorithm_name, num_runs=10):
+def run_with_cold_cache(algorithm_func, start, goal, maze, algorithm_name, num_runs=10, sink=None,
+                        mode='default', reachability=None):
    
-    results = []
+    # Os resultados não ficam em lista: vão para o resumo em fluxo e,
+    # se houver, para o sink (JSONL/colunas) assim que cada execução termina.
+    # mode (ver benchmarking.py):
+    #   'default': gc.collect() + pausa no próprio processo
+    #   'cold': cada execução em um processo novo, após descartar o cache de páginas
+    #   'warm': aquecimento + repetições calibradas; cada execução vira uma amostra
+    #           (tempo por chamada) e o resumo robusto é impresso ao final
+    # Com um ReachabilityIndex e objetivo inalcançável, nenhuma execução chega
+    # a buscar: todas recebem o resultado "sem caminho" da pré-checagem.
+    summary = AlgorithmSummary(algorithm_name)
+    mode_label = {'default': 'Cold Cache', 'cold': 'Cold Cache (processo novo)',
+                  'warm': 'Warm Cache'}[mode]
     
     print(f"\n{'='*70}")
-    print(f"Executando {algorithm_name} com Cold Cache ({num_runs} execuções)")
+    print(f"Executando {algorithm_name} com {mode_label} ({num_runs} execuções)")
     print(f"{'='*70}")
+
+    unreachable = unreachable_result(start, goal, maze, reachability, algorithm_name, True)
+    if unreachable is not None:
+        print("Início e objetivo em componentes diferentes: sem caminho (busca não executada)")
+        mode = 'unreachable'
+
+    if mode == 'warm':
+        last_result, times, loops = measure_warm(algorithm_func, start, goal, maze,
+                                                 samples=num_runs, suppress_output=True)
+        print(f"Calibração: {loops} chamada(s) por amostra")
     
     for i in range(num_runs):
         print(f"\nExecução {i+1}/{num_runs}...", end=" ")
         
-        clear_cache()
-
-        result = algorithm_func(start, goal, maze, suppress_output=True)
-        results.append(result)
+        if mode == 'cold':
+            result, elapsed = run_in_fresh_process(algorithm_func, start, goal, maze,
+                                                   suppress_output=True)
+            result['execution_time'] = elapsed
+        elif mode == 'warm':
+            result = {**last_result, 'execution_time': times[i]}
+        elif mode == 'unreachable':
+            result = dict(unreachable)
+        else:
+            clear_cache()
+            result = algorithm_func(start, goal, maze, suppress_output=True)
+
+        summary.add(result)
+        if sink is not None:
+            sink.write({'algorithm': algorithm_name, 'run': i, **result})
         
         print(f"✓ (Tempo: {result['execution_time']:.6f}s, Memória: {result['memory_used']/1024:.2f} KB, Max estruturas: {result['max_structure_size']})")
 
-    print_statistics(algorithm_name, results)
+    print_statistics(algorithm_name, summary)
+
+    if mode == 'warm':
+        robust = robust_summary(times)
+        print(f"   • Mediana robusta: {robust['median']*1e6:.2f} µs "
+              f"(IQR {robust['iqr']*1e6:.2f} µs, {robust['outliers']} outlier(s) descartado(s))")
 
-    if results[0]['path']:
-        visualize_path(maze, results[0]['path'], algorithm_name)
+    if summary.first_result['path']:
+        visualize_path(maze, summary.first_result['path'], algorithm_name)
     
-    return results
+    return summary
 
-def bfs(start, goal, maze, suppress_output=False):
+def run_in_workspace(search, algorithm_name, short_name, start, goal, maze, suppress_output, *args):
 
-    start_time = time.time()
+    # Versão das buscas sobre um SearchWorkspace (workspace.py): mesma medição,
+    # saída e dicionário de resultado, sem alocar as estruturas por consulta
+    start_time = time.perf_counter()
+    mem_before = process_memory()
+    path, nodes_explored, max_structure_size = search(start, goal, *args)
+    end_time = time.perf_counter()
+    memory_used = process_memory() - mem_before
+    if not suppress_output:
+        print_metrics(algorithm_name, path, nodes_explored, end_time - start_time, memory_used)
+        if path:
+            visualize_path(maze, path, short_name)
+    return {
+        'path': path,
+        'nodes_explored': nodes_explored,
+        'execution_time': end_time - start_time,
+        'memory_used': memory_used,
+        'max_structure_size': max_structure_size
+    }
+
+def unreachable_result(start, goal, maze, reachability, algorithm_name, suppress_output):
+
+    # Pré-checagem O(1) com o ReachabilityIndex (reachability.py): com início e
+    # objetivo em componentes diferentes, devolve "sem caminho" sem explorar
+    # nada (nós explorados e estruturas = 0). None se a busca deve seguir.
+    if reachability is None:
+        return None
+    reachability.check(maze)
+    start_time = time.perf_counter()
+    if reachability.reachable(start, goal):
+        return None
+    execution_time = time.perf_counter() - start_time
+    if not suppress_output:
+        print_metrics(algorithm_name, None, 0, execution_time, 0)
+    return {
+        'path': None,
+        'nodes_explored': 0,
+        'execution_time': execution_time,
+        'memory_used': 0,
+        'max_structure_size': 0
+    }
+
+def bfs(start, goal, maze, suppress_output=False, workspace=None, reachability=None):
+
+    unreachable = unreachable_result(start, goal, maze, reachability, "BFS (Busca em Largura)", suppress_output)
+    if unreachable is not None:
+        return unreachable
+
+    if workspace is not None:
+        workspace.check(maze)
+        return run_in_workspace(workspace.bfs, "BFS (Busca em Largura)", "BFS",
+                                start, goal, maze, suppress_output)
+
+    start_time = time.perf_counter()
     mem_before = process_memory()
 
     directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
@@ -176,7 +249,7 @@ def bfs(start, goal, maze, suppress_output=False):
         nodes_explored += 1
 
         if current == goal:
-            end_time = time.time()
+            end_time = time.perf_counter()
             mem_after = process_memory()
             memory_used = mem_after - mem_before
             path = reconstruct_path(came_from, current)
@@ -203,7 +276,7 @@ def bfs(start, goal, maze, suppress_output=False):
                 if current_size > max_structure_size:
                     max_structure_size = current_size
 
-    end_time = time.time()
+    end_time = time.perf_counter()
     mem_after = process_memory()
     memory_used = mem_after - mem_before
     if not suppress_output:
@@ -216,9 +289,120 @@ def bfs(start, goal, maze, suppress_output=False):
         'max_structure_size': max_structure_size
     }
 
-def dfs(start, goal, maze, suppress_output=False):
+def _bfs_levels(maze, start):
+
+    # Níveis da BFS em NumPy, sobre a grade plana com borda de paredes
+    # (vizinhos = índice ± largura e ± 1, sem checar limites). Cada nível
+    # expande a fronteira inteira de uma vez: candidatos na ordem
+    # (célula da fronteira, direção cima/baixo/esquerda/direita), paredes e
+    # visitados descartados por máscara e, entre repetidos, vale a primeira
+    # ocorrência. Essa é exatamente a ordem em que a BFS com deque enfileira
+    # as células, então pais e caminhos são os mesmos.
+    # Gera (fronteira, descobertas por célula da fronteira, pais, largura).
+    import numpy as np
+
+    grid = np.asarray(maze)
+    rows, cols = grid.shape
+    width = cols + 2
+    free = np.zeros((rows + 2, width), dtype=bool)
+    free[1:-1, 1:-1] = grid != '#'
+    unvisited = free.ravel()
+    parent = np.full(unvisited.size, -1, dtype=np.int64)
+    offsets = np.array([-width, width, -1, 1])
+
+    frontier = np.array([(start[0] + 1) * width + start[1] + 1])
+    unvisited[frontier] = False
+    while frontier.size:
+        candidates = (frontier[:, None] + offsets).ravel()
+        slots = np.flatnonzero(unvisited[candidates])
+        candidates = candidates[slots]
+        _, first = np.unique(candidates, return_index=True)
+        first.sort()
+        discovered = candidates[first]
+        owners = slots[first] // 4
+        parent[discovered] = frontier[owners]
+        unvisited[discovered] = False
+        yield frontier, np.bincount(owners, minlength=frontier.size), parent, width
+        frontier = discovered
+
+def bfs_vectorized(start, goal, maze, suppress_output=False, reachability=None):
+
+    # BFS síncrona por níveis (fronteira inteira em um vetor NumPy). Mesmo
+    # caminho, nós explorados e tamanho máximo das estruturas da bfs():
+    #   - nós explorados = células de níveis anteriores + posição de G no nível + 1;
+    #   - após expandir a k-ésima célula desenfileirada, com T células já
+    #     enfileiradas, fila + visitados = (T - k) + T; o máximo disso é o da bfs().
+    import numpy as np
+
+    unreachable = unreachable_result(start, goal, maze, reachability, "BFS vetorizada", suppress_output)
+    if unreachable is not None:
+        return unreachable
+
+    start_time = time.perf_counter()
+    mem_before = process_memory()
+
+    goal_index = (goal[0] + 1) * (maze.shape[1] + 2) + goal[1] + 1
+    explored = 0
+    enqueued = 1
+    max_structure_size = 2
+    path = None
+
+    for frontier, discoveries, parent, width in _bfs_levels(maze, start):
+        hits = np.flatnonzero(frontier == goal_index)
+        expanded = hits[0] if hits.size else frontier.size
+        if expanded:
+            totals = enqueued + np.cumsum(discoveries[:expanded])
+            popped = explored + np.arange(1, expanded + 1)
+            max_structure_size = max(max_structure_size, int((2 * totals - popped).max()))
+        if hits.size:
+            explored += int(hits[0]) + 1
+            path = []
+            cell = goal_index
+            while cell != -1:
+                path.append((int(cell) // width - 1, int(cell) % width - 1))
+                cell = parent[cell]
+            path.reverse()
+            break
+        explored += frontier.size
+        enqueued += int(discoveries.sum())
+
+    end_time = time.perf_counter()
+    memory_used = process_memory() - mem_before
+    if not suppress_output:
+        print_metrics("BFS vetorizada", path, explored, end_time - start_time, memory_used)
+        if path:
+            visualize_path(maze, path, "BFS vetorizada")
+    return {
+        'path': path,
+        'nodes_explored': explored,
+        'execution_time': end_time - start_time,
+        'memory_used': memory_used,
+        'max_structure_size': max_structure_size
+    }
+
+def distance_map(maze, start):
+
+    # Distância (em passos) de start a todas as células; -1 = parede ou inalcançável
+    import numpy as np
+
+    rows, cols = maze.shape
+    distances = np.full((rows + 2) * (cols + 2), -1, dtype=np.int32)
+    for level, (frontier, _, _, _) in enumerate(_bfs_levels(maze, start)):
+        distances[frontier] = level
+    return distances.reshape(rows + 2, cols + 2)[1:-1, 1:-1].copy()
+
+def dfs(start, goal, maze, suppress_output=False, workspace=None, reachability=None):
 
-    start_time = time.time()
+    unreachable = unreachable_result(start, goal, maze, reachability, "DFS (Busca em Profundidade)", suppress_output)
+    if unreachable is not None:
+        return unreachable
+
+    if workspace is not None:
+        workspace.check(maze)
+        return run_in_workspace(workspace.dfs, "DFS (Busca em Profundidade)", "DFS",
+                                start, goal, maze, suppress_output)
+
+    start_time = time.perf_counter()
     mem_before = process_memory()
 
     directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
@@ -233,7 +417,7 @@ def dfs(start, goal, maze, suppress_output=False):
         nodes_explored += 1
 
         if current == goal:
-            end_time = time.time()
+            end_time = time.perf_counter()
             mem_after = process_memory()
             memory_used = mem_after - mem_before
             path = reconstruct_path(came_from, current)
@@ -261,7 +445,7 @@ def dfs(start, goal, maze, suppress_output=False):
                 if current_size > max_structure_size:
                     max_structure_size = current_size
 
-    end_time = time.time()
+    end_time = time.perf_counter()
     mem_after = process_memory()
     memory_used = mem_after - mem_before
     if not suppress_output:
@@ -274,11 +458,24 @@ def dfs(start, goal, maze, suppress_output=False):
         'max_structure_size': max_structure_size
     }
     
-def greedy_search(start, goal, maze, heuristic_func, suppress_output=False):
+def greedy_search(start, goal, maze, heuristic_func, suppress_output=False, workspace=None,
+                  reachability=None):
+
+    heuristic_name = heuristic_func.__name__.replace('_', ' ').title()
+    unreachable = unreachable_result(start, goal, maze, reachability,
+                                     f"Greedy Search ({heuristic_name})", suppress_output)
+    if unreachable is not None:
+        return unreachable
+
+    if workspace is not None:
+        workspace.check(maze)
+        return run_in_workspace(workspace.greedy_search, f"Greedy Search ({heuristic_name})",
+                                f"Greedy ({heuristic_name})", start, goal, maze, suppress_output,
+                                heuristic_func)
 
     import heapq
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     mem_before = process_memory()
 
     directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
@@ -297,7 +494,7 @@ def greedy_search(start, goal, maze, heuristic_func, suppress_output=False):
         nodes_explored += 1
 
         if current == goal:
-            end_time = time.time()
+            end_time = time.perf_counter()
             mem_after = process_memory()
             memory_used = mem_after - mem_before
             path = reconstruct_path(came_from, current)
@@ -328,7 +525,7 @@ def greedy_search(start, goal, maze, heuristic_func, suppress_output=False):
                 if current_size > max_structure_size:
                     max_structure_size = current_size
 
-    end_time = time.time()
+    end_time = time.perf_counter()
     mem_after = process_memory()
     memory_used = mem_after - mem_before
     if not suppress_output:
@@ -342,11 +539,24 @@ def greedy_search(start, goal, maze, heuristic_func, suppress_output=False):
         'max_structure_size': max_structure_size
     }
 
-def a_star(start, goal, maze, heuristic_func, suppress_output=False):
+def a_star(start, goal, maze, heuristic_func, suppress_output=False, workspace=None,
+           reachability=None):
   
+    heuristic_name = heuristic_func.__name__.replace('_', ' ').title()
+    unreachable = unreachable_result(start, goal, maze, reachability, f"A* ({heuristic_name})",
+                                     suppress_output)
+    if unreachable is not None:
+        return unreachable
+
+    if workspace is not None:
+        workspace.check(maze)
+        return run_in_workspace(workspace.a_star, f"A* ({heuristic_name})",
+                                f"A* ({heuristic_name})", start, goal, maze, suppress_output,
+                                heuristic_func)
+
     import heapq
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     mem_before = process_memory()
 
     directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
@@ -367,7 +577,7 @@ def a_star(start, goal, maze, heuristic_func, suppress_output=False):
         nodes_explored += 1
 
         if current == goal:
-            end_time = time.time()
+            end_time = time.perf_counter()
             mem_after = process_memory()
             memory_used = mem_after - mem_before
             path = reconstruct_path(came_from, current)
@@ -406,7 +616,7 @@ def a_star(start, goal, maze, heuristic_func, suppress_output=False):
                 if current_size > max_structure_size:
                     max_structure_size = current_size
 
-    end_time = time.time()
+    end_time = time.perf_counter()
     mem_after = process_memory()
     memory_used = mem_after - mem_before
     if not suppress_output:
@@ -0,0 +1,413 @@
+import hashlib
+import inspect
+import json
+import os
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial, wraps
+
+# Memoização dos resultados das buscas de search.py.
+#
+# A chave é um hash do conteúdo do labirinto (formato + células), dos pontos
+# de início e objetivo, do algoritmo e da heurística. Labirintos iguais dão a
+# mesma chave mesmo em processos diferentes, e qualquer célula alterada muda a
+# chave (não há invalidação a fazer).
+#
+# Dois níveis:
+#   - memória: LRU com `capacity` entradas, dentro do processo;
+#   - disco (opcional): SQLite em `path`, compartilhado entre execuções e
+#     processos, com remoção das entradas acessadas há mais tempo quando a
+#     soma dos resultados (JSON comprimido) passa de `max_disk_bytes`.
+# Só o que a busca determina é guardado: caminho, nós explorados e tamanho
+# máximo das estruturas. Em um acerto, execution_time é o tempo da consulta
+# ao cache, memory_used é 0 e o resultado traz 'cached': True.
+#
+# O cache é sempre opcional. Para medir a execução de verdade (benchmarks),
+# basta não usá-lo, chamar dentro de `with cache.bypass():` ou definir
+# SEARCH_CACHE=off no ambiente (desliga todos os caches do processo).
+#
+# Uso:
+#   cache = SearchCache(capacity=1024, path='../data/search_cache.sqlite')
+#   cached_a_star = cache.wrap(a_star)
+#   result = cached_a_star(start, goal, maze, manhattan_distance, suppress_output=True)
+
+# Incrementar quando a semântica de algum resultado mudar (invalida o disco)
+CACHE_VERSION = 2
+
+DEFAULT_CAPACITY = 1024
+DEFAULT_MAX_DISK_BYTES = 64 * 1024 * 1024
+
+# Ao passar do limite, o disco é reduzido até esta fração dele (evita remover
+# a cada inserção)
+_LOW_WATERMARK = 0.9
+
+# Argumentos que não mudam o resultado da busca
+_IGNORED_KWARGS = {'suppress_output', 'workspace'}
+
+# Argumentos que só mudam o resultado por estarem presentes (a pré-checagem
+# de alcançabilidade zera os nós explorados quando não há caminho)
+_PRESENCE_KWARGS = {'reachability'}
+
+
+def cache_disabled_by_env():
+    return os.environ.get('SEARCH_CACHE', '').strip().lower() in ('0', 'off', 'false', 'no')
+
+
+def maze_digest(maze):
+    # Hash do conteúdo da grade (formato, tipo e células)
+    import numpy as np
+
+    grid = np.ascontiguousarray(maze)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{grid.shape}|{grid.dtype.str}|".encode())
+    digest.update(grid.tobytes())
+    return digest.hexdigest()
+
+
+def _qualified_name(func):
+    while isinstance(func, partial):
+        func = func.func
+    return f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+
+
+def _describe(value):
+    # Funções (heurísticas) entram na chave pelo nome; o resto pelo valor
+    if callable(value):
+        return _qualified_name(value)
+    return repr(value)
+
+
+def _named_arguments(func, fixed_args, args, options):
+    # Argumentos da chamada pelo nome do parâmetro (posição ou nome dão a mesma
+    # chave), com os valores padrão preenchidos; início, objetivo e labirinto
+    # ficam de fora (entram na chave separadamente)
+    placeholders = (object(), object(), object())
+    try:
+        bound = inspect.signature(func).bind_partial(*fixed_args, *placeholders, *args, **options)
+    except (TypeError, ValueError):
+        # Assinatura desconhecida ou incompatível: chave pela forma da chamada
+        return [('*', value) for value in fixed_args + tuple(args)] + sorted(options.items())
+    bound.apply_defaults()
+    named = []
+    for name, value in bound.arguments.items():
+        parameter = bound.signature.parameters[name]
+        if parameter.kind is parameter.VAR_KEYWORD:
+            named.extend(value.items())
+        elif parameter.kind is parameter.VAR_POSITIONAL:
+            named.extend((f'*{name}', item) for item in value
+                         if not any(item is placeholder for placeholder in placeholders))
+        elif not any(value is placeholder for placeholder in placeholders):
+            named.append((name, value))
+    return sorted(named, key=lambda item: item[0])
+
+
+class _SearchSignature:
+    # O que a chave precisa saber da função (nome, argumentos fixados com
+    # partial, nomes e valores padrão dos parâmetros), lido uma vez por função
+    # embrulhada: cada consulta só monta um dicionário nome -> valor
+
+    def __init__(self, search_func):
+        fixed_args, fixed_kwargs = (), {}
+        func = search_func
+        while isinstance(func, partial):
+            fixed_args = func.args + fixed_args
+            fixed_kwargs = {**func.keywords, **fixed_kwargs}
+            func = func.func
+        self.func = func
+        self.name = _qualified_name(func)
+        self.fixed_args = fixed_args
+        self.fixed_kwargs = fixed_kwargs
+        self.fast = False
+        try:
+            parameters = list(inspect.signature(func).parameters.values())
+        except (TypeError, ValueError):
+            return
+        # Caminho rápido só para parâmetros comuns (sem *args, **kwargs ou
+        # só-posicionais); o resto passa por bind_partial a cada chamada
+        kinds = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        positional = [p.name for p in parameters if p.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD]
+        leading = len(fixed_args) + 3
+        if not all(p.kind in kinds for p in parameters) or len(positional) < leading:
+            return
+        self.fast = True
+        self.fixed_names = positional[:len(fixed_args)]
+        self.positional = positional[leading:]
+        # Início, objetivo e labirinto entram na chave separadamente
+        self.skipped = set(positional[len(fixed_args):leading])
+        self.keywords = {p.name for p in parameters} - self.skipped - set(self.fixed_names)
+        self.defaults = {p.name: p.default for p in parameters
+                         if p.default is not p.empty and p.name not in self.skipped}
+
+    def arguments(self, args, kwargs):
+        # Argumentos pelo nome do parâmetro (posição ou nome dão a mesma
+        # chave), com os valores padrão preenchidos
+        options = {**self.fixed_kwargs, **kwargs}
+        if (self.fast and len(args) <= len(self.positional)
+                and options.keys() <= self.keywords - set(self.positional[:len(args)])):
+            named = dict(self.defaults)
+            named.update(zip(self.fixed_names, self.fixed_args))
+            named.update(zip(self.positional, args))
+            named.update(options)
+            return sorted(named.items())
+        return _named_arguments(self.func, self.fixed_args, args, options)
+
+    def key(self, digest, start, goal, args=(), kwargs=None):
+        parts = [
+            f"v{CACHE_VERSION}",
+            self.name,
+            digest,
+            repr(tuple(start)),
+            repr(tuple(goal)),
+            *(f"{name}={value is not None if name in _PRESENCE_KWARGS else _describe(value)}"
+              for name, value in self.arguments(args, kwargs or {})
+              if name not in _IGNORED_KWARGS),
+        ]
+        return hashlib.blake2b('\0'.join(parts).encode(), digest_size=16).hexdigest()
+
+
+def search_key(search_func, maze, start, goal, args=(), kwargs=None, digest=None):
+    # Argumentos fixados com partial (ex.: heuristic_func) também fazem parte da chave
+    return _SearchSignature(search_func).key(digest or maze_digest(maze), start, goal, args, kwargs)
+
+
+class LRUCache:
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        if self.capacity <= 0:
+            return
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def to_dict(self):
+        total = self.hits + self.misses
+        return {'size': len(self.entries), 'capacity': self.capacity, 'hits': self.hits,
+                'misses': self.misses, 'hit_rate': self.hits / total if total else 0.0}
+
+
+class DiskCache:
+    # Tabela SQLite chave -> JSON comprimido; `accessed` ordena a remoção (LRU)
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_DISK_BYTES):
+        import sqlite3
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        # Autocommit + WAL: vários processos podem ler e gravar o mesmo arquivo
+        self.db = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, "
+                        "value BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+
+    def get(self, key):
+        row = self.db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.db.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+        self.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, key, value):
+        data = zlib.compress(json.dumps(value, separators=(',', ':')).encode())
+        self.db.execute("INSERT OR REPLACE INTO results (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                        (key, data, len(data), time.time()))
+        self._evict()
+
+    def size_bytes(self):
+        return self.db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def _evict(self):
+        total = self.size_bytes()
+        if total <= self.max_bytes:
+            return
+        # Remove as menos acessadas até ficar abaixo de _LOW_WATERMARK do limite
+        target = total - self.max_bytes * _LOW_WATERMARK
+        freed = 0
+        doomed = []
+        for key, size in self.db.execute("SELECT key, size FROM results ORDER BY accessed"):
+            doomed.append((key,))
+            freed += size
+            if freed >= target:
+                break
+        self.db.executemany("DELETE FROM results WHERE key = ?", doomed)
+        self.evicted += len(doomed)
+
+    def clear(self):
+        self.db.execute("DELETE FROM results")
+        self.db.execute("VACUUM")
+
+    def close(self):
+        self.db.close()
+
+    def to_dict(self):
+        entries = self.db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return {'path': self.path, 'entries': entries, 'bytes': self.size_bytes(),
+                'max_bytes': self.max_bytes, 'hits': self.hits, 'misses': self.misses,
+                'evicted': self.evicted}
+
+
+class SearchCache:
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, path=None, max_disk_bytes=DEFAULT_MAX_DISK_BYTES,
+                 enabled=True):
+        self.memory = LRUCache(capacity)
+        self.disk = DiskCache(path, max_disk_bytes) if path else None
+        self.enabled = enabled and not cache_disabled_by_env()
+        self.saved_time = 0.0
+        self.lookup_time = 0.0
+        # id(labirinto) -> (referência fraca, formato, hash): o hash percorre a
+        # grade inteira, então é calculado uma vez por objeto. Os labirintos são
+        # tratados como imutáveis enquanto estão em uso com o cache.
+        self._digests = {}
+
+    def get(self, key):
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.put(key, value)
+        return value
+
+    def put(self, key, value):
+        self.memory.put(key, value)
+        if self.disk is not None:
+            self.disk.put(key, value)
+
+    def maze_digest(self, maze):
+        key = id(maze)
+        known = self._digests.get(key)
+        if known is not None and known[0]() is maze and known[1] == maze.shape:
+            return known[2]
+        digest = maze_digest(maze)
+        try:
+            reference = weakref.ref(maze, lambda ref, key=key: self._forget_digest(key, ref))
+        except TypeError:
+            # Objeto sem suporte a referência fraca: recalcula a cada consulta
+            return digest
+        self._digests[key] = (reference, maze.shape, digest)
+        return digest
+
+    def _forget_digest(self, key, reference):
+        known = self._digests.get(key)
+        if known is not None and known[0] is reference:
+            del self._digests[key]
+
+    @contextmanager
+    def bypass(self):
+        # Desliga o cache dentro do bloco (as buscas executam e nada é gravado)
+        enabled, self.enabled = self.enabled, False
+        try:
+            yield self
+        finally:
+            self.enabled = enabled
+
+    def wrap(self, search_func):
+        # Versão da busca (mesma assinatura de search.py) que consulta o cache antes
+        signature = _SearchSignature(search_func)
+
+        @wraps(search_func)
+        def cached_search(start, goal, maze, *args, suppress_output=False, **kwargs):
+            if not self.enabled:
+                return search_func(start, goal, maze, *args, suppress_output=suppress_output, **kwargs)
+
+            lookup_start = time.perf_counter()
+            key = signature.key(self.maze_digest(maze), start, goal, args, kwargs)
+            entry = self.get(key)
+            if entry is None:
+                result = search_func(start, goal, maze, *args, suppress_output=suppress_output, **kwargs)
+                self.put(key, {
+                    'path': [list(pos) for pos in result['path']] if result['path'] else None,
+                    'nodes_explored': result['nodes_explored'],
+                    'max_structure_size': result['max_structure_size'],
+                    'execution_time': result['execution_time'],
+                })
+                return result
+
+            elapsed = time.perf_counter() - lookup_start
+            # A consulta pode custar mais que a busca original (labirintos
+            # pequenos): o custo vai para lookup_time, e a economia não fica negativa
+            self.lookup_time += elapsed
+            self.saved_time += max(entry['execution_time'] - elapsed, 0.0)
+            path = [tuple(pos) for pos in entry['path']] if entry['path'] else None
+            if not suppress_output:
+                from search import print_metrics
+
+                print_metrics(f"{signature.name} (cache)", path,
+                              entry['nodes_explored'], elapsed, 0)
+            return {
+                'path': path,
+                'nodes_explored': entry['nodes_explored'],
+                'execution_time': elapsed,
+                'memory_used': 0,
+                'max_structure_size': entry['max_structure_size'],
+                'cached': True
+            }
+
+        return cached_search
+
+    def clear(self):
+        self.memory.clear()
+        self._digests.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def close(self):
+        if self.disk is not None:
+            self.disk.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def to_dict(self):
+        return {'enabled': self.enabled, 'memory': self.memory.to_dict(),
+                'disk': self.disk.to_dict() if self.disk is not None else None,
+                'saved_time': self.saved_time, 'lookup_time': self.lookup_time}
+
+    def print_stats(self):
+        stats = self.to_dict()
+        memory = stats['memory']
+        print(f"\n{'='*70}")
+        print(f"Cache de resultados{'' if self.enabled else ' (desligado)'}")
+        print(f"  Memória: {memory['hits']} acertos, {memory['misses']} faltas, "
+              f"{memory['size']}/{memory['capacity']} entradas")
+        if stats['disk'] is not None:
+            disk = stats['disk']
+            print(f"  Disco ({disk['path']}): {disk['hits']} acertos, {disk['misses']} faltas, "
+                  f"{disk['entries']} entradas, {disk['bytes']/1024:.1f}/{disk['max_bytes']/1024:.0f} KB, "
+                  f"{disk['evicted']} removida(s)")
+        print(f"  Tempo de busca economizado: {self.saved_time:.6f}s "
+              f"(consultas com acerto: {self.lookup_time:.6f}s)")
+        print(f"{'='*70}")
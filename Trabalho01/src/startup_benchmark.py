@@ -0,0 +1,124 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Tempo de inicialização dos pontos de entrada, medido com `python -X importtime`.
+#
+# Cada módulo é importado em um interpretador novo (várias vezes, mediana) e a
+# saída do -X importtime dá o tempo acumulado de cada import. Serve de gate:
+# sai com código 1 se um módulo pesado proibido for carregado só pelo import
+# do ponto de entrada, ou se a mediana passar de --limit-ms.
+# Contraparte: Trabalho02/src/tempo_inicializacao.py.
+
+ENTRY_POINTS = ['maze', 'search', 'profiling', 'compare_runs', 'plots', 'path_server', 'path_client',
+                'maze_reduction', 'graph']
+
+# Só podem ser carregados quando usados (dentro das funções)
+HEAVY_MODULES = ['numpy', 'matplotlib', 'psutil', 'pandas', 'scipy']
+
+
+def parse_importtime(stderr):
+    # Linhas "import time: self [us] | cumulative | imported package", em
+    # pós-ordem (os filhos vêm antes do pai, com mais indentação).
+    # Retorna a lista [(módulo, self_us, cumulative_us, profundidade)]
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' '))) // 2
+        imports.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return imports
+
+
+def measure_entry_point(module, runs=5, cwd=None):
+    # Mediana do tempo de import (µs, pelo -X importtime) e do processo inteiro
+    # (s, inclui o próprio interpretador), e os imports da última execução
+    import_times = []
+    wall_times = []
+    imports = {}
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                                   cwd=cwd, capture_output=True, text=True)
+        wall_times.append(time.perf_counter() - start)
+        if completed.returncode != 0:
+            raise RuntimeError(f"Falha ao importar {module}:\n{completed.stderr}")
+        imports = parse_importtime(completed.stderr)
+        import_times.append(next(cumulative for name, _, cumulative, depth in imports
+                                 if name == module and depth == 0))
+    return statistics.median(import_times), statistics.median(wall_times), imports
+
+
+def measure_interpreter(runs=5):
+    # Mediana do processo sem import nenhum (custo fixo do interpretador)
+    wall_times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        wall_times.append(time.perf_counter() - start)
+    return statistics.median(wall_times)
+
+
+def heaviest_imports(imports, module, top=5):
+    # Imports diretos do módulo: as entradas de profundidade 1 logo antes da
+    # linha do próprio módulo (até a entrada de profundidade 0 anterior)
+    end = next(i for i, (name, _, _, depth) in enumerate(imports)
+               if name == module and depth == 0)
+    children = []
+    for name, _, cumulative, depth in reversed(imports[:end]):
+        if depth == 0:
+            break
+        if depth == 1:
+            children.append((cumulative, name))
+    return sorted(children, reverse=True)[:top]
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Benchmark de inicialização (-X importtime)")
+    parser.add_argument('--modules', nargs='+', default=ENTRY_POINTS, help="Módulos a importar")
+    parser.add_argument('--runs', type=int, default=5, help="Execuções por módulo (mediana)")
+    parser.add_argument('--top', type=int, default=5, help="Imports mais caros mostrados")
+    parser.add_argument('--limit-ms', type=float, default=None,
+                        help="Falha se a mediana de import de algum módulo passar disto")
+    parser.add_argument('--allow', nargs='*', default=[],
+                        help="Módulos pesados permitidos no import")
+    args = parser.parse_args(argv)
+
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    forbidden = [name for name in HEAVY_MODULES if name not in args.allow]
+    failures = []
+
+    interpreter_wall = measure_interpreter(args.runs)
+    print(f"\nInterpretador vazio: {interpreter_wall * 1000:.1f} ms")
+    print(f"{'='*70}")
+    print(f"{'Módulo':<16} {'Import (ms)':>12} {'Processo (ms)':>14}   Imports mais caros")
+    print(f"{'-'*70}")
+
+    for module in args.modules:
+        import_us, wall, imports = measure_entry_point(module, args.runs, cwd)
+        heavy = ', '.join(f"{name} {cumulative / 1000:.1f}"
+                          for cumulative, name in heaviest_imports(imports, module, args.top))
+        print(f"{module:<16} {import_us / 1000:>12.1f} {wall * 1000:>14.1f}   {heavy}")
+
+        names = {name for name, _, _, _ in imports}
+        loaded = [name for name in forbidden if name in names]
+        if loaded:
+            failures.append(f"{module} carrega {', '.join(loaded)} na importação")
+        if args.limit_ms is not None and import_us / 1000 > args.limit_ms:
+            failures.append(f"{module} leva {import_us / 1000:.1f} ms (limite {args.limit_ms} ms)")
+
+    print(f"{'='*70}")
+    if failures:
+        for failure in failures:
+            print(f"✗ {failure}")
+        sys.exit(1)
+    print("✓ Nenhum módulo pesado carregado na inicialização")
+
+
+if __name__ == "__main__":
+    main()
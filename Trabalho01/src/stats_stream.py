@@ -0,0 +1,466 @@
+import json
+import math
+import os
+from array import array
+
+# Estatísticas em fluxo: cada resultado é gravado em disco (JSONL e, se
+# desejado, arquivos colunares) e acumulado em memória constante
+# (Welford para média/variância/min/max, P² para quantis e um histograma
+# com classes logarítmicas).
+# Contraparte em Trabalho02/src/estatisticas.py (ver README da raiz).
+
+
+class RunningStats:
+    # Média, variância populacional (como np.std), mínimo e máximo (Welford)
+
+    __slots__ = ('count', 'mean', '_m2', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self):
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+
+class P2Quantile:
+    # Estimador P² (Jain & Chlamtac, 1985): 5 marcadores por quantil.
+    # Com menos de 5 amostras devolve o quantil exato (como np.percentile).
+
+    __slots__ = ('p', '_initial', '_heights', '_positions', '_desired', '_increments')
+
+    def __init__(self, p):
+        self.p = p
+        self._initial = []
+        self._heights = None
+
+    def add(self, value):
+        if self._heights is None:
+            self._initial.append(value)
+            if len(self._initial) == 5:
+                p = self.p
+                self._heights = sorted(self._initial)
+                self._positions = [0, 1, 2, 3, 4]
+                self._desired = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+                self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+                self._initial = None
+            return
+
+        q, n = self._heights, self._positions
+        if value < q[0]:
+            q[0] = value
+            k = 0
+        elif value >= q[4]:
+            q[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                parabolic = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if q[i - 1] < parabolic < q[i + 1]:
+                    q[i] = parabolic
+                else:
+                    q[i] += d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    @property
+    def value(self):
+        if self._heights is not None:
+            return self._heights[2]
+        if not self._initial:
+            return math.nan
+        ordered = sorted(self._initial)
+        position = self.p * (len(ordered) - 1)
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class LogHistogram:
+    # Histograma com `bins_per_decade` classes por potência de 10; só as
+    # classes não vazias são guardadas, então a memória depende da faixa de
+    # valores e não do número de amostras. Valores <= 0 (e NaN) são contados
+    # à parte. Histogramas com o mesmo bins_per_decade podem ser combinados.
+
+    __slots__ = ('bins_per_decade', 'counts', 'non_positive')
+
+    def __init__(self, bins_per_decade=10):
+        self.bins_per_decade = bins_per_decade
+        self.counts = {}
+        self.non_positive = 0
+
+    def add(self, value):
+        if value > 0:
+            index = math.floor(math.log10(value) * self.bins_per_decade)
+            self.counts[index] = self.counts.get(index, 0) + 1
+        else:
+            self.non_positive += 1
+
+    def merge(self, other):
+        if other.bins_per_decade != self.bins_per_decade:
+            raise ValueError(f"Incompatible histograms: {self.bins_per_decade} and "
+                             f"{other.bins_per_decade} bins per decade")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.non_positive += other.non_positive
+
+    @property
+    def total(self):
+        return sum(self.counts.values()) + self.non_positive
+
+    def quantile(self, p):
+        # Quantil aproximado: centro geométrico da classe que contém a posição
+        # p * total (erro relativo de no máximo meia classe). Ao contrário do
+        # P², não depende da ordem de chegada e vale para histogramas combinados.
+        total = self.total
+        if total == 0:
+            return math.nan
+        rank = p * total
+        seen = self.non_positive
+        if seen and rank <= seen:
+            return 0.0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return 10 ** ((index + 0.5) / self.bins_per_decade)
+        return 10 ** ((max(self.counts) + 0.5) / self.bins_per_decade)
+
+    def bins(self):
+        # [início, fim, contagem] da menor à maior classe não vazia, com as
+        # classes vazias do meio (para desenhar em degraus)
+        if not self.counts:
+            return []
+        return [[10 ** (index / self.bins_per_decade),
+                 10 ** ((index + 1) / self.bins_per_decade),
+                 self.counts.get(index, 0)]
+                for index in range(min(self.counts), max(self.counts) + 1)]
+
+    def to_dict(self):
+        return {
+            'bins_per_decade': self.bins_per_decade,
+            'non_positive': self.non_positive,
+            'bins': self.bins()
+        }
+
+
+class MetricSummary:
+
+    __slots__ = ('stats', 'quantiles', 'histogram')
+
+    DEFAULT_QUANTILES = (0.25, 0.5, 0.75, 0.9, 0.99)
+
+    def __init__(self, quantiles=DEFAULT_QUANTILES):
+        self.stats = RunningStats()
+        self.quantiles = {p: P2Quantile(p) for p in quantiles}
+        self.histogram = LogHistogram()
+
+    def add(self, value):
+        self.stats.add(value)
+        for estimator in self.quantiles.values():
+            estimator.add(value)
+        self.histogram.add(value)
+
+    def quantile(self, p):
+        return self.quantiles[p].value
+
+    @property
+    def mean(self):
+        return self.stats.mean
+
+    @property
+    def std(self):
+        return self.stats.std
+
+    @property
+    def min(self):
+        return self.stats.min
+
+    @property
+    def max(self):
+        return self.stats.max
+
+    @property
+    def median(self):
+        return self.quantile(0.5)
+
+    def to_dict(self):
+        return {
+            'count': self.stats.count,
+            'mean': self.mean,
+            'std': self.std,
+            'min': self.min,
+            'max': self.max,
+            'quantiles': {str(p): estimator.value for p, estimator in self.quantiles.items()},
+            'histogram': self.histogram.to_dict()
+        }
+
+
+class AlgorithmSummary:
+    # Resumo em fluxo das execuções de um algoritmo de busca. Toda métrica
+    # numérica do resultado vira um MetricSummary; 'path_length' é derivada
+    # do caminho. Só o primeiro resultado é guardado (para exibir o caminho).
+
+    IGNORED = {'run'}
+
+    def __init__(self, name=''):
+        self.name = name
+        self.runs = 0
+        self.paths_found = 0
+        self.metrics = {}
+        self.first_result = None
+
+    def add(self, result):
+        self.runs += 1
+        if self.first_result is None:
+            self.first_result = result
+
+        values = {}
+        if result.get('path') is not None:
+            self.paths_found += 1
+            values['path_length'] = len(result['path'])
+        for key, value in result.items():
+            if key in self.IGNORED or isinstance(value, bool):
+                continue
+            if isinstance(value, (int, float)):
+                values[key] = value
+
+        for key, value in values.items():
+            metric = self.metrics.get(key)
+            if metric is None:
+                metric = self.metrics[key] = MetricSummary()
+            metric.add(value)
+
+    def __contains__(self, metric):
+        return metric in self.metrics
+
+    def __getitem__(self, metric):
+        return self.metrics[metric]
+
+    def mean(self, metric):
+        return self.metrics[metric].mean
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'runs': self.runs,
+            'paths_found': self.paths_found,
+            'metrics': {key: metric.to_dict() for key, metric in self.metrics.items()}
+        }
+
+
+def summarize_results(results, name=''):
+    # Aceita lista/gerador de resultados ou um AlgorithmSummary pronto
+    if isinstance(results, AlgorithmSummary):
+        return results
+    summary = AlgorithmSummary(name)
+    for result in results:
+        summary.add(result)
+    return summary
+
+
+def summarize_by(results, keys=('algorithm',)):
+    # Resume em uma passada, separando pelos campos em `keys` (ausentes valem
+    # None): {tupla de valores: AlgorithmSummary}. Com read_jsonl() resume um
+    # estudo inteiro sem carregar os resultados na memória.
+    groups = {}
+    for result in results:
+        group = tuple(result.get(key) for key in keys)
+        summary = groups.get(group)
+        if summary is None:
+            summary = groups[group] = AlgorithmSummary(str(group[0]))
+        summary.add(result)
+    return groups
+
+
+class ResultSink:
+    # Destino append-only: um resultado por linha em JSONL (descarregado a
+    # cada gravação) e, opcionalmente, um arquivo '<campo>.f64' por métrica
+    # numérica em columns_dir (float64 nativo, legível com np.fromfile).
+    # Campos em 'exclude' (ex.: 'path') não vão para o JSONL.
+
+    def __init__(self, jsonl_path, columns_dir=None, exclude=()):
+        directory = os.path.dirname(jsonl_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._jsonl = open(jsonl_path, 'a', encoding='utf-8')
+        self._exclude = set(exclude)
+        self._columns_dir = columns_dir
+        self._columns = {}
+        self._rows = 0
+        if columns_dir:
+            os.makedirs(columns_dir, exist_ok=True)
+
+    def write(self, result):
+        record = {k: v for k, v in result.items() if k not in self._exclude}
+        self._jsonl.write(json.dumps(record, default=list) + '\n')
+        self._jsonl.flush()
+
+        if self._columns_dir:
+            numeric = {k: float(v) for k, v in result.items()
+                       if isinstance(v, (int, float)) and k not in self._exclude}
+            for field in numeric.keys() - self._columns.keys():
+                handle = open(os.path.join(self._columns_dir, f'{field}.f64'), 'ab')
+                # Completa com NaN as linhas anteriores à primeira aparição do campo
+                array('d', [math.nan] * self._rows).tofile(handle)
+                self._columns[field] = handle
+            for field, handle in self._columns.items():
+                array('d', [numeric.get(field, math.nan)]).tofile(handle)
+                handle.flush()
+        self._rows += 1
+
+    def close(self):
+        self._jsonl.close()
+        for handle in self._columns.values():
+            handle.close()
+        self._columns = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def read_jsonl(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def read_column(columns_dir, field):
+    column = array('d')
+    with open(os.path.join(columns_dir, f'{field}.f64'), 'rb') as file:
+        column.frombytes(file.read())
+    return column
+
+
+# Comparação entre dois conjuntos de amostras (antes/depois de uma mudança)
+
+def _relative_change(base, current):
+    # current / base - 1; com base 0, qualquer variação é ±infinita
+    # (ex.: memory_used que era 0 em todas as execuções e passou a ser > 0)
+    if base == current:
+        return 0.0
+    if base == 0:
+        return math.copysign(math.inf, current)
+    return current / base - 1
+
+
+def _quantiles(values, probabilities):
+    # Quantis com interpolação linear (como np.quantile), mas aceitando ±inf:
+    # entre dois infinitos iguais o resultado é o próprio infinito (np.quantile
+    # calcularia inf - inf = nan)
+    import numpy as np
+
+    ordered = np.sort(values)
+    result = []
+    for p in probabilities:
+        position = p * (len(ordered) - 1)
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        a, b = ordered[lower], ordered[upper]
+        result.append(float(a if a == b else a + (b - a) * (position - lower)))
+    return result
+
+
+def bootstrap_ci(before, after, statistic='median', num_resamples=2000, confidence=0.95, seed=None):
+    # Intervalo de confiança bootstrap da variação relativa
+    # (estatística(after) / estatística(before) - 1). Reamostragens com
+    # estatística(before) = 0 entram como ±inf, então uma métrica que sai de 0
+    # tem intervalo [inf, inf] e ainda pode ser marcada como regressão.
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    before = np.asarray(before, dtype=float)
+    after = np.asarray(after, dtype=float)
+    func = np.median if statistic == 'median' else np.mean
+
+    samples_before = before[rng.integers(0, len(before), size=(num_resamples, len(before)))]
+    samples_after = after[rng.integers(0, len(after), size=(num_resamples, len(after)))]
+    stat_before = func(samples_before, axis=1)
+    stat_after = func(samples_after, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        changes = np.where(stat_after == stat_before, 0.0, stat_after / stat_before - 1)
+
+    # Só descarta o que não tem valor definido (NaN nas amostras)
+    changes = changes[~np.isnan(changes)]
+    estimate = float(_relative_change(func(before), func(after)))
+    if len(changes) == 0:
+        return estimate, math.nan, math.nan
+    alpha = (1 - confidence) / 2
+    low, high = _quantiles(changes, [alpha, 1 - alpha])
+    return estimate, low, high
+
+
+def mann_whitney_u(before, after):
+    # Teste U de Mann–Whitney bilateral (aproximação normal com correção
+    # de empates e de continuidade). Retorna (U, p-valor).
+    import numpy as np
+
+    before = np.asarray(before, dtype=float)
+    after = np.asarray(after, dtype=float)
+    n1, n2 = len(before), len(after)
+    if n1 == 0 or n2 == 0:
+        return math.nan, math.nan
+
+    combined = np.concatenate([before, after])
+    order = np.argsort(combined, kind='mergesort')
+    ranks = np.empty(len(combined))
+    # Posto médio para valores empatados
+    _, first, counts = np.unique(combined[order], return_index=True, return_counts=True)
+    ranks[order] = np.repeat(first + (counts + 1) / 2, counts)
+
+    u = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    mean_u = n1 * n2 / 2
+    tie_term = (counts ** 3 - counts).sum() / (n * (n - 1)) if n > 1 else 0.0
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term))
+    if sigma == 0:
+        return float(u), 1.0
+    z = (abs(u - mean_u) - 0.5) / sigma
+    p_value = math.erfc(max(z, 0.0) / math.sqrt(2))
+    return float(u), min(p_value, 1.0)
@@ -0,0 +1,218 @@
+import heapq
+from array import array
+
+# Área de trabalho reutilizável para buscas repetidas no mesmo labirinto.
+#
+# As buscas de search.py criam a cada chamada uma deque/heap, o conjunto
+# `visited`, o dicionário `came_from` e (no A*) o `g_score`. Um serviço que
+# responde milhares de consultas por segundo no mesmo labirinto passa boa
+# parte do tempo alocando e liberando essas estruturas (e acionando o GC).
+#
+# SearchWorkspace é criado uma vez por labirinto e guarda tudo em vetores
+# planos indexados pela célula (i * cols + j):
+#   - neighbors: vizinhos livres de cada célula, na ordem das buscas
+#     (cima, baixo, esquerda, direita), calculados uma única vez;
+#   - stamp: marca de visita por geração. Cada consulta incrementa
+#     `generation`, e uma célula está visitada se stamp[c] == generation,
+#     então "limpar" o visited é O(1) em vez de O(células);
+#   - parent / g: came_from e g_score (só valem para células da geração atual);
+#   - frontier: fila da BFS e pilha da DFS (cada célula entra no máximo uma
+#     vez, então `cells` posições bastam); o heap é uma lista reaproveitada.
+#
+# Os resultados (caminho, nós explorados, tamanho máximo das estruturas) são
+# idênticos aos das versões com dicionários. Um workspace não pode ser usado
+# por duas buscas ao mesmo tempo: use um por thread.
+#
+# Uso:
+#   workspace = SearchWorkspace(maze)
+#   for start, goal in consultas:
+#       result = a_star(start, goal, maze, manhattan_distance, suppress_output=True,
+#                       workspace=workspace)
+
+# Gerações cabem em 32 bits; ao estourar, as marcas são zeradas
+_MAX_GENERATION = 2 ** 32 - 1
+
+
+class SearchWorkspace:
+
+    __slots__ = ('shape', 'rows', 'cols', 'cells', 'coords', 'neighbors',
+                 'generation', 'stamp', 'parent', 'g', 'frontier', 'heap')
+
+    def __init__(self, maze):
+        rows, cols = maze.shape
+        self._build(rows, cols, [maze[i][j] != '#' for i in range(rows) for j in range(cols)])
+
+    @classmethod
+    def from_bytes(cls, rows, cols, data):
+        # Grade como bytes ASCII, uma célula por byte ('#' = parede), linha a
+        # linha; ex.: um bloco de memória compartilhada (path_server.py)
+        workspace = cls.__new__(cls)
+        wall = ord('#')
+        workspace._build(rows, cols, [byte != wall for byte in bytes(data[:rows * cols])])
+        return workspace
+
+    def _build(self, rows, cols, free):
+        self.shape = (rows, cols)
+        self.rows, self.cols = rows, cols
+        self.cells = rows * cols
+
+        # Coordenadas de cada célula (tuplas criadas uma vez e reaproveitadas nos caminhos)
+        self.coords = [(i, j) for i in range(rows) for j in range(cols)]
+        neighbors = []
+        for i in range(rows):
+            for j in range(cols):
+                cell = []
+                for ni, nj in ((i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)):
+                    if 0 <= ni < rows and 0 <= nj < cols and free[ni * cols + nj]:
+                        cell.append(ni * cols + nj)
+                neighbors.append(tuple(cell))
+        self.neighbors = neighbors
+
+        self.generation = 0
+        self.stamp = array('I', bytes(4 * self.cells))
+        self.parent = array('i', bytes(4 * self.cells))
+        self.g = array('i', bytes(4 * self.cells))
+        self.frontier = array('i', bytes(4 * self.cells))
+        self.heap = []
+
+    def check(self, maze):
+        # O workspace só vale para o labirinto com que foi criado
+        if maze.shape != self.shape:
+            raise ValueError(f"Workspace created for a {self.shape} maze, got {maze.shape}")
+
+    def reset(self):
+        # Nova geração: todas as células passam a "não visitadas" em O(1)
+        self.generation += 1
+        if self.generation > _MAX_GENERATION:
+            self.stamp = array('I', bytes(4 * self.cells))
+            self.generation = 1
+        self.heap.clear()
+        return self.generation
+
+    def index(self, pos):
+        return pos[0] * self.cols + pos[1]
+
+    def path_to(self, cell):
+        coords, parent = self.coords, self.parent
+        path = []
+        while cell != -1:
+            path.append(coords[cell])
+            cell = parent[cell]
+        path.reverse()
+        return path
+
+    # Cada busca devolve (caminho ou None, nós explorados, máx. de elementos
+    # na fronteira + visitados), com a mesma semântica de search.py
+
+    def bfs(self, start, goal):
+        generation = self.reset()
+        stamp, parent, queue, neighbors = self.stamp, self.parent, self.frontier, self.neighbors
+        source, target = self.index(start), self.index(goal)
+
+        stamp[source] = generation
+        parent[source] = -1
+        queue[0] = source
+        head, tail = 0, 1
+        visited = 1
+        nodes_explored = 0
+        max_structure_size = 2
+
+        while head < tail:
+            current = queue[head]
+            head += 1
+            nodes_explored += 1
+            if current == target:
+                return self.path_to(current), nodes_explored, max_structure_size
+
+            for neighbor in neighbors[current]:
+                if stamp[neighbor] != generation:
+                    stamp[neighbor] = generation
+                    parent[neighbor] = current
+                    queue[tail] = neighbor
+                    tail += 1
+                    visited += 1
+                    size = tail - head + visited
+                    if size > max_structure_size:
+                        max_structure_size = size
+
+        return None, nodes_explored, max_structure_size
+
+    def dfs(self, start, goal):
+        generation = self.reset()
+        stamp, parent, stack, neighbors = self.stamp, self.parent, self.frontier, self.neighbors
+        source, target = self.index(start), self.index(goal)
+
+        stamp[source] = generation
+        parent[source] = -1
+        stack[0] = source
+        top = 1
+        visited = 1
+        nodes_explored = 0
+        max_structure_size = 2
+
+        while top:
+            top -= 1
+            current = stack[top]
+            nodes_explored += 1
+            if current == target:
+                return self.path_to(current), nodes_explored, max_structure_size
+
+            for neighbor in neighbors[current]:
+                if stamp[neighbor] != generation:
+                    stamp[neighbor] = generation
+                    parent[neighbor] = current
+                    stack[top] = neighbor
+                    top += 1
+                    visited += 1
+                    size = top + visited
+                    if size > max_structure_size:
+                        max_structure_size = size
+
+        return None, nodes_explored, max_structure_size
+
+    def best_first(self, start, goal, heuristic_func, use_cost):
+        # Greedy (use_cost=False, prioridade h) e A* (use_cost=True, prioridade g + h),
+        # com o mesmo desempate por ordem de inserção das versões originais
+        generation = self.reset()
+        stamp, parent, g, heap = self.stamp, self.parent, self.g, self.heap
+        neighbors, coords = self.neighbors, self.coords
+        source, target = self.index(start), self.index(goal)
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        stamp[source] = generation
+        parent[source] = -1
+        g[source] = 0
+        heap.append((heuristic_func(start, goal), 0, source))
+        counter = 1
+        visited = 1
+        nodes_explored = 0
+        max_structure_size = 2
+
+        while heap:
+            current = heappop(heap)[2]
+            nodes_explored += 1
+            if current == target:
+                return self.path_to(current), nodes_explored, max_structure_size
+
+            for neighbor in neighbors[current]:
+                if stamp[neighbor] != generation:
+                    stamp[neighbor] = generation
+                    parent[neighbor] = current
+                    priority = heuristic_func(coords[neighbor], goal)
+                    if use_cost:
+                        cost = g[neighbor] = g[current] + 1
+                        priority = cost + priority
+                    heappush(heap, (priority, counter, neighbor))
+                    counter += 1
+                    visited += 1
+                    size = len(heap) + visited
+                    if size > max_structure_size:
+                        max_structure_size = size
+
+        return None, nodes_explored, max_structure_size
+
+    def greedy_search(self, start, goal, heuristic_func):
+        return self.best_first(start, goal, heuristic_func, use_cost=False)
+
+    def a_star(self, start, goal, heuristic_func):
+        return self.best_first(start, goal, heuristic_func, use_cost=True)
@@ -0,0 +1,127 @@
+"""
+Geradores de números aleatórios reprodutíveis para as buscas locais.
+
+Todos os algoritmos aceitam o parâmetro `semente`, que pode ser:
+- None: usa o módulo `random` global (comportamento original)
+- int: cria um `random.Random` próprio com essa semente
+- random.Random: usado diretamente
+- numpy.random.Generator: adaptado para a interface de `random.Random`
+
+Para execuções em paralelo, `gerar_sementes`/`gerar_fluxos` derivam fluxos
+independentes a partir de uma semente mestre (SeedSequence do NumPy), de
+forma que cada worker tenha o seu próprio gerador sem colisões.
+
+Autor: Matheus Emanuel
+Disciplina: Inteligência Artificial - CEFET-MG
+Data: 2025
+"""
+
+import random
+from typing import List, Optional
+
+
+class _AdaptadorNumPy:
+    """Expõe um numpy.random.Generator com a interface usada de random.Random."""
+
+    __slots__ = ('gerador',)
+
+    def __init__(self, gerador):
+        self.gerador = gerador
+
+    def random(self) -> float:
+        return float(self.gerador.random())
+
+    def randint(self, a: int, b: int) -> int:
+        return int(self.gerador.integers(a, b + 1))
+
+    def randrange(self, inicio: int, fim: Optional[int] = None) -> int:
+        if fim is None:
+            inicio, fim = 0, inicio
+        return int(self.gerador.integers(inicio, fim))
+
+    def choice(self, sequencia):
+        return sequencia[int(self.gerador.integers(0, len(sequencia)))]
+
+    def shuffle(self, sequencia):
+        for i in range(len(sequencia) - 1, 0, -1):
+            j = int(self.gerador.integers(0, i + 1))
+            sequencia[i], sequencia[j] = sequencia[j], sequencia[i]
+
+
+def _eh_gerador_numpy(objeto) -> bool:
+    # Evita importar NumPy só para o isinstance
+    return hasattr(objeto, 'bit_generator') and hasattr(objeto, 'integers')
+
+
+def obter_rng(semente=None):
+    """
+    Resolve o parâmetro `semente` dos algoritmos em um gerador.
+
+    Args:
+        semente: None, int, random.Random ou numpy.random.Generator
+
+    Returns:
+        Objeto com random(), randint(), randrange() e choice()
+    """
+    if semente is None:
+        return random
+    if semente is random or isinstance(semente, (random.Random, _AdaptadorNumPy)):
+        return semente
+    if _eh_gerador_numpy(semente):
+        return _AdaptadorNumPy(semente)
+    return random.Random(semente)
+
+
+def obter_gerador_numpy(semente=None):
+    """
+    Resolve o parâmetro `semente` em um numpy.random.Generator.
+
+    Usado pelas versões vetorizadas. Um random.Random é convertido sorteando
+    uma semente de 64 bits a partir dele (o fluxo continua reprodutível).
+
+    Args:
+        semente: None, int, SeedSequence, random.Random ou numpy.random.Generator
+
+    Returns:
+        numpy.random.Generator
+    """
+    import numpy as np
+
+    if isinstance(semente, np.random.Generator):
+        return semente
+    if isinstance(semente, _AdaptadorNumPy):
+        return semente.gerador
+    if isinstance(semente, random.Random):
+        return np.random.default_rng(semente.getrandbits(64))
+    return np.random.default_rng(semente)
+
+
+def gerar_sementes(semente: Optional[int], quantidade: int) -> List[int]:
+    """
+    Deriva `quantidade` sementes independentes a partir de uma semente mestre.
+
+    Args:
+        semente: Semente mestre (None = entropia do sistema)
+        quantidade: Número de fluxos
+
+    Returns:
+        Lista de inteiros de 64 bits, um por fluxo
+    """
+    import numpy as np
+
+    filhas = np.random.SeedSequence(semente).spawn(quantidade)
+    return [int(filha.generate_state(1, dtype=np.uint64)[0]) for filha in filhas]
+
+
+def gerar_fluxos(semente: Optional[int], quantidade: int) -> List[random.Random]:
+    """
+    Cria `quantidade` geradores random.Random independentes (um por worker).
+
+    Args:
+        semente: Semente mestre
+        quantidade: Número de fluxos
+
+    Returns:
+        Lista de random.Random
+    """
+    return [random.Random(s) for s in gerar_sementes(semente, quantidade)]
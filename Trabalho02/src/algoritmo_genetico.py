@@ -0,0 +1,321 @@
+"""
+Algoritmo Genético para o problema das N Rainhas.
+
+A população é uma matriz NumPy (P, n) de permutações (uma rainha por linha
+e por coluna), então o cruzamento preserva a validade dos indivíduos e só
+há conflitos nas diagonais. Cada geração é toda vetorizada:
+- aptidão de toda a população de uma vez a partir dos histogramas de
+  linhas e diagonais (`calcular_conflitos_lote`);
+- seleção por torneio vetorizada;
+- cruzamento OX (order crossover) ou PMX (partially mapped crossover),
+  aplicados a todos os pares simultaneamente;
+- mutação por troca de duas posições e elitismo.
+
+Opcionalmente a população é dividida em ilhas que evoluem separadamente
+(em processos, se `processos > 0`) e trocam os melhores indivíduos em anel
+a cada `intervalo_migracao` gerações.
+
+Autor: Matheus Emanuel
+Disciplina: Inteligência Artificial - CEFET-MG
+Data: 2025
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Tuple
+
+import numpy as np
+
+from aleatoriedade import gerar_sementes, obter_gerador_numpy
+from annealing_vetorizado import calcular_conflitos_lote
+
+
+CRUZAMENTOS = ('ox', 'pmx')
+
+
+# ============================================================================
+# OPERADORES GENÉTICOS (VETORIZADOS)
+# ============================================================================
+
+def populacao_aleatoria(tamanho: int, n: int, rng: np.random.Generator) -> np.ndarray:
+    """Matriz (tamanho, n) de permutações aleatórias."""
+    return rng.permuted(np.tile(np.arange(n, dtype=np.int64), (tamanho, 1)), axis=1)
+
+
+def selecao_torneio(aptidoes: np.ndarray, quantidade: int, tamanho_torneio: int,
+                    rng: np.random.Generator) -> np.ndarray:
+    """
+    Sorteia `quantidade` torneios de uma vez e devolve o índice do vencedor
+    (menos conflitos) de cada um.
+    """
+    competidores = rng.integers(0, len(aptidoes), size=(quantidade, tamanho_torneio))
+    vencedores = np.argmin(aptidoes[competidores], axis=1)
+    return competidores[np.arange(quantidade), vencedores]
+
+
+def _cortes(m: int, n: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    # Segmento [a, b) com pelo menos um gene, um por par
+    pontos = np.sort(rng.integers(0, n + 1, size=(m, 2)), axis=1)
+    a, b = pontos[:, 0], pontos[:, 1]
+    iguais = a == b
+    b[iguais] = np.minimum(a[iguais] + 1, n)
+    a[iguais] = b[iguais] - 1
+    return a, b
+
+
+def cruzamento_ox(pais1: np.ndarray, pais2: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Order crossover (OX) em todos os pares de uma vez.
+
+    O filho copia o segmento [a, b) do primeiro pai; as demais posições,
+    a partir de b e dando a volta, recebem os genes do segundo pai (também
+    lidos a partir de b) que não estão no segmento, na ordem em que aparecem.
+    """
+    m, n = pais1.shape
+    a, b = _cortes(m, n, rng)
+    posicoes = np.arange(n)
+    segmento = (posicoes >= a[:, None]) & (posicoes < b[:, None])
+
+    # no_segmento[i, g]: o gene g está no segmento copiado do pai 1
+    no_segmento = np.zeros((m, n), dtype=bool)
+    linhas = np.repeat(np.arange(m), n).reshape(m, n)
+    no_segmento[linhas[segmento], pais1[segmento]] = True
+
+    # Genes do pai 2 e posições do filho, ambos a partir de b
+    rotacao = (posicoes + b[:, None]) % n
+    genes = np.take_along_axis(pais2, rotacao, axis=1)
+    genes_livres = ~no_segmento[linhas, genes]
+    posicoes_livres = ~np.take_along_axis(segmento, rotacao, axis=1)
+
+    # Mesma quantidade de genes e posições por linha: a ordem por linha se mantém
+    filhos = np.where(segmento, pais1, 0)
+    filhos[linhas[posicoes_livres], rotacao[posicoes_livres]] = genes[genes_livres]
+    return filhos
+
+
+def cruzamento_pmx(pais1: np.ndarray, pais2: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Partially mapped crossover (PMX) em todos os pares de uma vez.
+
+    O filho copia o segmento [a, b) do primeiro pai e o resto do segundo;
+    genes repetidos fora do segmento são trocados pelo mapeamento
+    pai1[i] → pai2[i] do segmento até saírem dele (no máximo n passos).
+    """
+    m, n = pais1.shape
+    a, b = _cortes(m, n, rng)
+    posicoes = np.arange(n)
+    segmento = (posicoes >= a[:, None]) & (posicoes < b[:, None])
+    linhas = np.repeat(np.arange(m), n).reshape(m, n)
+
+    no_segmento = np.zeros((m, n), dtype=bool)
+    no_segmento[linhas[segmento], pais1[segmento]] = True
+    mapeamento = np.tile(posicoes, (m, 1))
+    mapeamento[linhas[segmento], pais1[segmento]] = pais2[segmento]
+
+    filhos = np.where(segmento, pais1, pais2)
+    fora = ~segmento
+    for _ in range(n):
+        repetidos = fora & no_segmento[linhas, filhos]
+        if not repetidos.any():
+            break
+        filhos[repetidos] = mapeamento[linhas[repetidos], filhos[repetidos]]
+    return filhos
+
+
+def mutacao_troca(populacao: np.ndarray, taxa: float, rng: np.random.Generator):
+    """Troca duas posições aleatórias de cada indivíduo com probabilidade `taxa` (in-place)."""
+    m, n = populacao.shape
+    mutantes = np.flatnonzero(rng.random(m) < taxa)
+    if len(mutantes) == 0:
+        return
+    i = rng.integers(0, n, size=len(mutantes))
+    j = rng.integers(0, n, size=len(mutantes))
+    populacao[mutantes, i], populacao[mutantes, j] = populacao[mutantes, j], populacao[mutantes, i]
+
+
+def proxima_geracao(populacao: np.ndarray, aptidoes: np.ndarray, rng: np.random.Generator,
+                    taxa_cruzamento: float, taxa_mutacao: float, tamanho_torneio: int,
+                    elitismo: int, cruzamento: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Seleção, cruzamento, mutação e elitismo de uma geração inteira.
+
+    Returns:
+        Tupla (nova população, aptidões da nova população)
+    """
+    tamanho = len(populacao)
+    num_filhos = tamanho - elitismo
+    num_pares = (num_filhos + 1) // 2
+
+    pais = populacao[selecao_torneio(aptidoes, 2 * num_pares, tamanho_torneio, rng)]
+    pais1, pais2 = pais[:num_pares], pais[num_pares:]
+
+    operador = cruzamento_ox if cruzamento == 'ox' else cruzamento_pmx
+    filhos = np.concatenate([operador(pais1, pais2, rng), operador(pais2, pais1, rng)])[:num_filhos]
+    # Pares que não cruzam passam adiante como cópias dos pais
+    sem_cruzamento = np.flatnonzero(rng.random(num_filhos) >= taxa_cruzamento)
+    filhos[sem_cruzamento] = np.concatenate([pais1, pais2])[sem_cruzamento]
+    mutacao_troca(filhos, taxa_mutacao, rng)
+
+    elite = np.argsort(aptidoes, kind='stable')[:elitismo]
+    nova = np.concatenate([populacao[elite], filhos])
+    return nova, np.concatenate([aptidoes[elite], calcular_conflitos_lote(filhos)])
+
+
+# ============================================================================
+# ILHAS
+# ============================================================================
+
+def _evoluir_ilha(tarefa: Tuple) -> Tuple:
+    """
+    Evolui uma ilha por até `geracoes` gerações (roda no worker).
+
+    Returns:
+        Tupla (população, aptidões, gerador, gerações executadas, avaliações)
+    """
+    populacao, aptidoes, rng, geracoes, parametros = tarefa
+    executadas = avaliacoes = 0
+    while executadas < geracoes and aptidoes.min() > 0:
+        populacao, aptidoes = proxima_geracao(populacao, aptidoes, rng, **parametros)
+        executadas += 1
+        avaliacoes += len(populacao) - parametros['elitismo']
+    return populacao, aptidoes, rng, executadas, avaliacoes
+
+
+def _migrar(ilhas, migrantes: int):
+    """Os `migrantes` melhores de cada ilha substituem os piores da próxima (anel)."""
+    emigrantes = []
+    for populacao, aptidoes in ilhas:
+        melhores = np.argsort(aptidoes, kind='stable')[:migrantes]
+        emigrantes.append((populacao[melhores].copy(), aptidoes[melhores].copy()))
+    for i, (populacao, aptidoes) in enumerate(ilhas):
+        chegada, aptidoes_chegada = emigrantes[i - 1]
+        piores = np.argsort(aptidoes, kind='stable')[len(aptidoes) - migrantes:]
+        populacao[piores] = chegada
+        aptidoes[piores] = aptidoes_chegada
+
+
+# ============================================================================
+# ALGORITMO GENÉTICO
+# ============================================================================
+
+def algoritmo_genetico(tamanho_populacao: int = 100,
+                       max_geracoes: int = 1000,
+                       taxa_cruzamento: float = 0.9,
+                       taxa_mutacao: float = 0.2,
+                       tamanho_torneio: int = 3,
+                       elitismo: int = 2,
+                       cruzamento: str = 'ox',
+                       num_ilhas: int = 1,
+                       intervalo_migracao: int = 20,
+                       migrantes: int = 2,
+                       processos: int = 0,
+                       verbose: bool = False,
+                       n: int = 8,
+                       semente=None) -> Dict:
+    """
+    Algoritmo Genético com população vetorizada e modelo de ilhas opcional.
+
+    Args:
+        tamanho_populacao: Indivíduos por ilha
+        max_geracoes: Limite de gerações
+        taxa_cruzamento: Probabilidade de um filho vir do cruzamento
+        taxa_mutacao: Probabilidade de mutação (troca) por indivíduo
+        tamanho_torneio: Competidores por torneio
+        elitismo: Melhores indivíduos copiados para a geração seguinte
+        cruzamento: 'ox' ou 'pmx'
+        num_ilhas: Número de subpopulações (1 = população única)
+        intervalo_migracao: Gerações entre migrações
+        migrantes: Indivíduos enviados por ilha a cada migração
+        processos: Workers para as ilhas (0 = tudo no processo atual)
+        verbose: Se True, imprime o progresso
+        n: Tamanho do tabuleiro
+        semente: None, int, random.Random ou numpy.random.Generator
+
+    Returns:
+        Dicionário com estado_final, conflitos, iteracoes (gerações),
+        avaliacoes, tempo e sucesso
+    """
+    if cruzamento not in CRUZAMENTOS:
+        raise ValueError(f"Cruzamento desconhecido: {cruzamento!r} (use {CRUZAMENTOS})")
+    elitismo = min(elitismo, tamanho_populacao - 1)
+    migrantes = min(migrantes, tamanho_populacao // 2)
+
+    rng = obter_gerador_numpy(semente)
+    # Um fluxo independente por ilha, derivado do gerador principal
+    geradores = [np.random.default_rng(s) for s in
+                 gerar_sementes(int(rng.integers(2**63)), num_ilhas)] if num_ilhas > 1 else [rng]
+    parametros = {
+        'taxa_cruzamento': taxa_cruzamento,
+        'taxa_mutacao': taxa_mutacao,
+        'tamanho_torneio': tamanho_torneio,
+        'elitismo': elitismo,
+        'cruzamento': cruzamento
+    }
+
+    tempo_inicio = time.perf_counter()
+    ilhas = []
+    for gerador in geradores:
+        populacao = populacao_aleatoria(tamanho_populacao, n, gerador)
+        ilhas.append((populacao, calcular_conflitos_lote(populacao)))
+    avaliacoes = tamanho_populacao * num_ilhas
+    geracoes = 0
+
+    if verbose:
+        print("\n" + "="*60)
+        print("ALGORITMO GENÉTICO")
+        print("="*60)
+        print(f"População: {tamanho_populacao} × {num_ilhas} ilha(s), cruzamento {cruzamento.upper()}")
+        print(f"Max gerações: {max_geracoes}")
+
+    pool = ProcessPoolExecutor(max_workers=processos) if processos > 0 and num_ilhas > 1 else None
+    try:
+        while geracoes < max_geracoes and min(a.min() for _, a in ilhas) > 0:
+            # Cada época evolui todas as ilhas até a próxima migração
+            epoca = min(intervalo_migracao if num_ilhas > 1 else max_geracoes,
+                        max_geracoes - geracoes)
+            tarefas = [(p, a, g, epoca, parametros) for (p, a), g in zip(ilhas, geradores)]
+            saidas = list(pool.map(_evoluir_ilha, tarefas)) if pool else map(_evoluir_ilha, tarefas)
+
+            ilhas, geradores, executadas = [], [], 0
+            for populacao, aptidoes, gerador, epoca_ilha, avaliacoes_ilha in saidas:
+                ilhas.append((populacao, aptidoes))
+                geradores.append(gerador)
+                executadas = max(executadas, epoca_ilha)
+                avaliacoes += avaliacoes_ilha
+            geracoes += executadas
+
+            melhor_atual = min(int(a.min()) for _, a in ilhas)
+            if verbose:
+                print(f"Geração {geracoes}: melhor = {melhor_atual} conflitos")
+            if num_ilhas > 1 and melhor_atual > 0:
+                _migrar(ilhas, migrantes)
+    finally:
+        if pool:
+            pool.shutdown()
+
+    # Melhor indivíduo entre todas as ilhas
+    ilha, (populacao, aptidoes) = min(enumerate(ilhas), key=lambda item: item[1][1].min())
+    indice = int(np.argmin(aptidoes))
+    melhor_estado = populacao[indice].tolist()
+    melhor_conflitos = int(aptidoes[indice])
+    tempo_total = time.perf_counter() - tempo_inicio
+    sucesso = (melhor_conflitos == 0)
+
+    if verbose:
+        print("\n" + "="*60)
+        print("RESULTADO FINAL")
+        print("="*60)
+        print(f"Melhor estado: {melhor_estado} (ilha {ilha + 1})")
+        print(f"\nStatus: {'SUCESSO! ✓' if sucesso else 'FALHA'}")
+        print(f"Gerações: {geracoes}")
+        print(f"Avaliações: {avaliacoes}")
+        print(f"Tempo total: {tempo_total:.6f} segundos")
+
+    return {
+        'estado_final': melhor_estado,
+        'conflitos': melhor_conflitos,
+        'iteracoes': geracoes,
+        'avaliacoes': avaliacoes,
+        'tempo': tempo_total,
+        'sucesso': sucesso
+    }
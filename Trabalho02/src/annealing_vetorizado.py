@@ -0,0 +1,241 @@
+"""
+Simulated Annealing vetorizado com NumPy para o problema das N Rainhas.
+
+Avança K cadeias independentes em paralelo (lockstep): cada iteração sorteia
+um movimento por cadeia, calcula todos os deltas de conflito de uma vez a
+partir de contadores de linhas e diagonais e aplica o teste de Metropolis
+vetorizado.
+
+Autor: Matheus Emanuel
+Disciplina: Inteligência Artificial - CEFET-MG
+Data: 2025
+"""
+
+import time
+from typing import Dict, Union
+
+import numpy as np
+
+from aleatoriedade import obter_gerador_numpy
+from resfriamento import EsquemaResfriamento, resolver_esquema
+
+
+# ============================================================================
+# CONTADORES DE LINHAS E DIAGONAIS
+# ============================================================================
+
+def _pares(contagens: np.ndarray) -> np.ndarray:
+    """
+    Soma, por cadeia, o número de pares C(k, 2) em cada linha/diagonal.
+
+    Args:
+        contagens: Matriz (K, m) com a quantidade de rainhas por linha/diagonal
+
+    Returns:
+        Vetor (K,) com o total de pares em conflito
+    """
+    return (contagens * (contagens - 1) // 2).sum(axis=1)
+
+
+def _montar_contadores(tabuleiros: np.ndarray):
+    """
+    Monta os histogramas de linhas, diagonais principais e secundárias.
+
+    Para a rainha da coluna c na linha r:
+    - diagonal principal: c - r + (n - 1)
+    - diagonal secundária: c + r
+
+    Args:
+        tabuleiros: Matriz (K, n) com a linha de cada rainha por cadeia
+
+    Returns:
+        Tupla (linhas, diag1, diag2) com matrizes de contagem
+    """
+    k, n = tabuleiros.shape
+    colunas = np.arange(n)
+    deslocamento_linhas = (np.arange(k) * n)[:, None]
+    deslocamento_diag = (np.arange(k) * (2 * n - 1))[:, None]
+
+    linhas = np.bincount((tabuleiros + deslocamento_linhas).ravel(),
+                         minlength=k * n).reshape(k, n)
+    diag1 = np.bincount((colunas - tabuleiros + n - 1 + deslocamento_diag).ravel(),
+                        minlength=k * (2 * n - 1)).reshape(k, 2 * n - 1)
+    diag2 = np.bincount((colunas + tabuleiros + deslocamento_diag).ravel(),
+                        minlength=k * (2 * n - 1)).reshape(k, 2 * n - 1)
+    return linhas, diag1, diag2
+
+
+def calcular_conflitos_lote(tabuleiros: np.ndarray) -> np.ndarray:
+    """
+    Calcula os conflitos de vários tabuleiros de uma vez.
+
+    Equivalente a aplicar `calcular_conflitos` em cada linha da matriz.
+
+    Args:
+        tabuleiros: Matriz (K, n) com um tabuleiro por linha
+
+    Returns:
+        Vetor (K,) com o número de pares em conflito de cada tabuleiro
+    """
+    tabuleiros = np.asarray(tabuleiros)
+    linhas, diag1, diag2 = _montar_contadores(tabuleiros)
+    return _pares(linhas) + _pares(diag1) + _pares(diag2)
+
+
+# ============================================================================
+# SIMULATED ANNEALING EM LOTE
+# ============================================================================
+
+def simulated_annealing_vetorizado(num_cadeias: int = 256,
+                                   n: int = 8,
+                                   temperatura_inicial: float = 2000.0,
+                                   taxa_resfriamento: float = 0.995,
+                                   max_iteracoes: int = 100000,
+                                   semente=None,
+                                   verbose: bool = False,
+                                   esquema_resfriamento: Union[str, EsquemaResfriamento] = 'geometrico',
+                                   temperatura_minima: float = 0.01) -> Dict:
+    """
+    Executa K cadeias de Simulated Annealing em paralelo.
+
+    Cada cadeia segue exatamente as regras de `simulated_annealing`: vizinho
+    aleatório (uma rainha movida para outra linha), melhora e lateral sempre
+    aceitas e piora aceita com probabilidade e^(-ΔE/T). A temperatura é
+    compartilhada e cada cadeia congela ao atingir 0 conflitos.
+
+    Args:
+        num_cadeias: Quantidade de cadeias independentes (K)
+        n: Tamanho do tabuleiro
+        temperatura_inicial: Temperatura inicial T₀
+        taxa_resfriamento: Fator α do resfriamento geométrico
+        max_iteracoes: Limite de iterações
+        semente: None, int, random.Random ou numpy.random.Generator
+        verbose: Imprime o progresso
+        esquema_resfriamento: Nome ou objeto de `resfriamento` (a taxa de
+            aceitação usada pelos esquemas adaptativos é a média das cadeias;
+            "melhorou" indica melhora do melhor estado de todo o lote)
+        temperatura_minima: Temperatura de parada
+
+    Returns:
+        Dicionário no formato de `simulated_annealing` referente à melhor
+        cadeia, acrescido de 'num_cadeias', 'taxa_sucesso_cadeias' e
+        'cadeias' (estatísticas por cadeia)
+    """
+    esquema = resolver_esquema(esquema_resfriamento, taxa_resfriamento, temperatura_minima)
+    rng = obter_gerador_numpy(semente)
+    indices = np.arange(num_cadeias)
+
+    tabuleiros = rng.integers(0, n, size=(num_cadeias, n))
+    linhas, diag1, diag2 = _montar_contadores(tabuleiros)
+    conflitos = _pares(linhas) + _pares(diag1) + _pares(diag2)
+
+    melhor_estado = tabuleiros.copy()
+    melhor_conflitos = conflitos.copy()
+    melhor_global = int(melhor_conflitos.min())
+
+    iteracoes_cadeia = np.zeros(num_cadeias, dtype=np.int64)
+    pioras_aceitas = np.zeros(num_cadeias, dtype=np.int64)
+
+    temperatura = esquema.iniciar(temperatura_inicial)
+    tempo_inicio = time.perf_counter()
+    iteracoes = 0
+
+    if verbose:
+        print("\n" + "="*60)
+        print("SIMULATED ANNEALING VETORIZADO")
+        print("="*60)
+        print(f"Cadeias: {num_cadeias} | N: {n}")
+        print(f"Temperatura inicial: {temperatura_inicial}")
+        print(f"Esquema de resfriamento: {esquema!r}")
+
+    while iteracoes < max_iteracoes and not esquema.terminou(temperatura):
+        ativas = conflitos > 0
+        if not ativas.any():
+            break
+        iteracoes += 1
+        iteracoes_cadeia += ativas
+
+        # Vizinho aleatório por cadeia: coluna qualquer, linha diferente da atual
+        coluna = rng.integers(0, n, size=num_cadeias)
+        linha_antiga = tabuleiros[indices, coluna]
+        linha_nova = (linha_antiga + rng.integers(1, n, size=num_cadeias)) % n
+
+        d1_antiga = coluna - linha_antiga + n - 1
+        d1_nova = coluna - linha_nova + n - 1
+        d2_antiga = coluna + linha_antiga
+        d2_nova = coluna + linha_nova
+
+        # Delta E: a rainha sai das contagens antigas e entra nas novas
+        delta_e = ((linhas[indices, linha_nova] - linhas[indices, linha_antiga] + 1)
+                   + (diag1[indices, d1_nova] - diag1[indices, d1_antiga] + 1)
+                   + (diag2[indices, d2_nova] - diag2[indices, d2_antiga] + 1))
+
+        # Teste de Metropolis vetorizado
+        sorteio = rng.random(num_cadeias)
+        with np.errstate(over='ignore'):
+            probabilidade = np.exp(-np.maximum(delta_e, 0) / temperatura)
+        aceita = ativas & ((delta_e <= 0) | (sorteio < probabilidade))
+        pioras_aceitas += aceita & (delta_e > 0)
+
+        k = indices[aceita]
+        c = coluna[aceita]
+        linhas[k, linha_antiga[aceita]] -= 1
+        linhas[k, linha_nova[aceita]] += 1
+        diag1[k, d1_antiga[aceita]] -= 1
+        diag1[k, d1_nova[aceita]] += 1
+        diag2[k, d2_antiga[aceita]] -= 1
+        diag2[k, d2_nova[aceita]] += 1
+        tabuleiros[k, c] = linha_nova[aceita]
+        conflitos[aceita] += delta_e[aceita]
+
+        # Atualiza a melhor solução de cada cadeia
+        melhorou = conflitos < melhor_conflitos
+        if melhorou.any():
+            melhor_estado[melhorou] = tabuleiros[melhorou]
+            melhor_conflitos[melhorou] = conflitos[melhorou]
+
+        # O esquema recebe a melhora do melhor do lote (e não "alguma cadeia
+        # melhorou", quase sempre verdade com centenas de cadeias, o que
+        # impediria o reaquecimento por estagnação de disparar)
+        minimo = int(melhor_conflitos.min())
+        melhorou_global = minimo < melhor_global
+        melhor_global = min(melhor_global, minimo)
+
+        taxa_aceitos = aceita.sum() / ativas.sum()
+        temperatura = esquema.atualizar(temperatura, iteracoes, float(taxa_aceitos), melhorou_global)
+
+        if verbose and iteracoes % 1000 == 0:
+            print(f"Iter {iteracoes}: Resolvidas={int((melhor_conflitos == 0).sum())}/{num_cadeias}, "
+                  f"Melhor={int(melhor_conflitos.min())}, T={temperatura:.2f}")
+
+    tempo_total = time.perf_counter() - tempo_inicio
+
+    # Melhor cadeia: menos conflitos e, em caso de empate, menos iterações
+    melhor = int(np.lexsort((iteracoes_cadeia, melhor_conflitos))[0])
+    sucessos = melhor_conflitos == 0
+    sucesso = bool(sucessos[melhor])
+
+    if verbose:
+        print(f"\nStatus: {'SUCESSO! ✓' if sucesso else 'FALHA'}")
+        print(f"Cadeias resolvidas: {int(sucessos.sum())}/{num_cadeias}")
+        print(f"Iterações (lote): {iteracoes}")
+        print(f"Tempo total: {tempo_total:.6f} segundos")
+
+    return {
+        'estado_final': melhor_estado[melhor].tolist(),
+        'conflitos': int(melhor_conflitos[melhor]),
+        'iteracoes': int(iteracoes_cadeia[melhor]),
+        'movimentos_ruins_aceitos': int(pioras_aceitas[melhor]),
+        'temperatura_final': temperatura,
+        'avaliacoes': int(iteracoes_cadeia.sum()) + num_cadeias,
+        'tempo': tempo_total,
+        'sucesso': sucesso,
+        'num_cadeias': num_cadeias,
+        'taxa_sucesso_cadeias': float(sucessos.mean() * 100),
+        'cadeias': {
+            'conflitos': melhor_conflitos.tolist(),
+            'iteracoes': iteracoes_cadeia.tolist(),
+            'movimentos_ruins_aceitos': pioras_aceitas.tolist(),
+            'sucesso': sucessos.tolist()
+        }
+    }
@@ -0,0 +1,259 @@
+"""
+Benchmark de escalabilidade dos algoritmos de busca local para N Rainhas.
+
+Varre tamanhos de tabuleiro × algoritmos × sementes e registra, para cada
+execução, tempo até a solução, iterações, avaliações por segundo, sucesso e
+pico de memória. Os resultados brutos vão para CSV e um resumo por
+(algoritmo, n) vai para JSON.
+
+Uso:
+    python benchmark.py --tamanhos 8 16 64 --sementes 10
+    python benchmark.py --algoritmos hc_laterais sa_vetorizado --tamanhos 8 16 64 256
+    python benchmark.py --tamanhos 8 16 32 64 128 --graficos   # tempo e avaliações × n (log–log)
+
+Autor: Matheus Emanuel
+Disciplina: Inteligência Artificial - CEFET-MG
+Data: 2025
+"""
+
+import argparse
+import csv
+import json
+import os
+import tracemalloc
+from statistics import mean, median
+from typing import Dict, List
+
+from estatisticas import resumir_por_grupo
+
+from hill_climbing import (
+    busca_tabu,
+    hill_climbing_basico,
+    hill_climbing_com_laterais,
+    random_restart_hill_climbing,
+    simulated_annealing
+)
+
+
+def _sa_vetorizado(n, semente, **kwargs):
+    # Import tardio: NumPy só é necessário para a versão vetorizada
+    from annealing_vetorizado import simulated_annealing_vetorizado
+    return simulated_annealing_vetorizado(n=n, semente=semente, **kwargs)
+
+
+def _algoritmo_genetico(n, semente, **kwargs):
+    from algoritmo_genetico import algoritmo_genetico
+    return algoritmo_genetico(n=n, semente=semente, **kwargs)
+
+
+# Wrappers de import tardio → função real (usado para inspecionar parâmetros)
+_TARDIOS = {
+    _sa_vetorizado: ('annealing_vetorizado', 'simulated_annealing_vetorizado'),
+    _algoritmo_genetico: ('algoritmo_genetico', 'algoritmo_genetico'),
+}
+
+
+# Nome → (função, parâmetros padrão)
+ALGORITMOS = {
+    'hc_basico': (hill_climbing_basico, {'max_iteracoes': 1000}),
+    'hc_laterais': (hill_climbing_com_laterais, {'max_iteracoes': 1000, 'max_laterais': 100}),
+    'random_restart': (random_restart_hill_climbing, {'max_reinicio': 100, 'usar_laterais': True,
+                                                      'max_laterais': 100}),
+    'simulated_annealing': (simulated_annealing, {'temperatura_inicial': 2000.0,
+                                                  'taxa_resfriamento': 0.995,
+                                                  'max_iteracoes': 100000}),
+    'sa_vetorizado': (_sa_vetorizado, {'num_cadeias': 64, 'max_iteracoes': 100000}),
+    'busca_tabu': (busca_tabu, {'max_iteracoes': 10000}),
+    'algoritmo_genetico': (_algoritmo_genetico, {'tamanho_populacao': 100, 'max_geracoes': 1000}),
+}
+
+TAMANHOS_PADRAO = [8, 16, 64]
+
+CAMPOS_CSV = ['algoritmo', 'n', 'semente', 'sucesso', 'conflitos', 'iteracoes',
+              'avaliacoes', 'tempo', 'avaliacoes_por_segundo', 'pico_memoria']
+
+
+def executar_algoritmo(nome: str, n: int, semente: int, **parametros) -> Dict:
+    """
+    Executa um algoritmo registrado em `ALGORITMOS` com semente fixa.
+
+    Args:
+        nome: Chave em `ALGORITMOS`
+        n: Tamanho do tabuleiro
+        semente: Semente da execução
+        **parametros: Sobrescrevem os parâmetros padrão do algoritmo
+
+    Returns:
+        Dicionário de resultado do algoritmo
+    """
+    funcao, padrao = ALGORITMOS[nome]
+    kwargs = {**padrao, **parametros}
+    if funcao in _TARDIOS:
+        return funcao(n, semente, **kwargs)
+    return funcao(n=n, semente=semente, verbose=False, **kwargs)
+
+
+def implementacao(nome: str):
+    """Função que de fato implementa o algoritmo (resolve os imports tardios)."""
+    funcao = ALGORITMOS[nome][0]
+    if funcao in _TARDIOS:
+        modulo, atributo = _TARDIOS[funcao]
+        funcao = getattr(__import__(modulo), atributo)
+    return funcao
+
+
+def medir_pico_memoria(nome: str, n: int, semente: int, **parametros) -> int:
+    """
+    Reexecuta a mesma carga (mesma semente) sob tracemalloc e devolve o pico.
+
+    A medição é separada da cronometragem porque o tracemalloc deixa as
+    alocações bem mais lentas e distorceria o tempo.
+    """
+    tracemalloc.start()
+    try:
+        executar_algoritmo(nome, n, semente, **parametros)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico
+
+
+def executar_benchmark(algoritmos: List[str], tamanhos: List[int], sementes: List[int],
+                       medir_memoria: bool = True, verbose: bool = True,
+                       **parametros) -> List[Dict]:
+    """
+    Varre tamanhos × algoritmos × sementes.
+
+    Returns:
+        Lista de registros (um por execução) com os campos de `CAMPOS_CSV`
+    """
+    registros = []
+    for n in tamanhos:
+        for nome in algoritmos:
+            for semente in sementes:
+                resultado = executar_algoritmo(nome, n, semente, **parametros)
+                tempo = resultado['tempo']
+                avaliacoes = resultado.get('avaliacoes', 0)
+                registro = {
+                    'algoritmo': nome,
+                    'n': n,
+                    'semente': semente,
+                    'sucesso': bool(resultado['sucesso']),
+                    'conflitos': int(resultado['conflitos']),
+                    'iteracoes': resultado.get('iteracoes', resultado.get('iteracoes_total', 0)),
+                    'avaliacoes': avaliacoes,
+                    'tempo': tempo,
+                    'avaliacoes_por_segundo': avaliacoes / tempo if tempo > 0 else 0.0,
+                    'pico_memoria': (medir_pico_memoria(nome, n, semente, **parametros)
+                                     if medir_memoria else None)
+                }
+                registros.append(registro)
+
+                if verbose:
+                    status = "✓" if registro['sucesso'] else "✗"
+                    print(f"n={n:<5} {nome:<20} semente={semente:<6} {status} "
+                          f"({registro['conflitos']} conflitos, {registro['iteracoes']} iter, "
+                          f"{tempo:.6f}s)")
+    return registros
+
+
+def resumir(registros: List[Dict]) -> List[Dict]:
+    """
+    Agrega os registros por (algoritmo, n).
+
+    O tempo até a solução considera apenas as execuções com sucesso.
+    """
+    grupos = {}
+    for registro in registros:
+        grupos.setdefault((registro['algoritmo'], registro['n']), []).append(registro)
+
+    resumo = []
+    for (nome, n), grupo in grupos.items():
+        sucessos = [r for r in grupo if r['sucesso']]
+        tempos = [r['tempo'] for r in grupo]
+        picos = [r['pico_memoria'] for r in grupo if r['pico_memoria'] is not None]
+        resumo.append({
+            'algoritmo': nome,
+            'n': n,
+            'execucoes': len(grupo),
+            'taxa_sucesso': len(sucessos) / len(grupo) * 100,
+            'tempo_medio': mean(tempos),
+            'tempo_mediano': median(tempos),
+            'tempo_ate_solucao': mean(r['tempo'] for r in sucessos) if sucessos else None,
+            'iteracoes_media': mean(r['iteracoes'] for r in grupo),
+            'avaliacoes_por_segundo': mean(r['avaliacoes_por_segundo'] for r in grupo),
+            'pico_memoria_max': max(picos) if picos else None
+        })
+    return resumo
+
+
+def salvar_csv(registros: List[Dict], caminho: str):
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=CAMPOS_CSV)
+        escritor.writeheader()
+        escritor.writerows(registros)
+
+
+def salvar_json(registros: List[Dict], resumo: List[Dict], caminho: str):
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump({'resumo': resumo, 'execucoes': registros}, arquivo, indent=2, ensure_ascii=False)
+
+
+def imprimir_resumo(resumo: List[Dict]):
+
+    print(f"\n{'='*96}")
+    print("RESUMO DE ESCALABILIDADE")
+    print(f"{'='*96}")
+    print(f"{'Algoritmo':<22} {'n':>6} {'Sucesso':>9} {'Tempo méd. (s)':>15} "
+          f"{'Até solução (s)':>16} {'Aval./s':>12} {'Pico (KB)':>11}")
+    print("-" * 96)
+    for linha in resumo:
+        ate_solucao = (f"{linha['tempo_ate_solucao']:>16.6f}"
+                       if linha['tempo_ate_solucao'] is not None else f"{'-':>16}")
+        pico = (f"{linha['pico_memoria_max']/1024:>11.1f}"
+                if linha['pico_memoria_max'] is not None else f"{'-':>11}")
+        print(f"{linha['algoritmo']:<22} {linha['n']:>6} {linha['taxa_sucesso']:>8.1f}% "
+              f"{linha['tempo_medio']:>15.6f} {ate_solucao} "
+              f"{linha['avaliacoes_por_segundo']:>12,.0f} {pico}")
+    print("=" * 96 + "\n")
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Benchmark de escalabilidade para N Rainhas")
+    parser.add_argument('--algoritmos', nargs='+', default=list(ALGORITMOS),
+                        choices=list(ALGORITMOS), help="Algoritmos a executar")
+    parser.add_argument('--tamanhos', nargs='+', type=int, default=TAMANHOS_PADRAO,
+                        help="Valores de n (ex.: 8 16 64 256 1024)")
+    parser.add_argument('--sementes', type=int, default=10,
+                        help="Quantidade de sementes (0, 1, ..., k-1)")
+    parser.add_argument('--sem-memoria', action='store_true',
+                        help="Não mede o pico de memória (evita a reexecução sob tracemalloc)")
+    parser.add_argument('--saida', default=os.path.join('..', 'data', 'benchmark'),
+                        help="Prefixo dos arquivos de saída (.csv e .json)")
+    parser.add_argument('--graficos', action='store_true',
+                        help="Gera os gráficos de escalabilidade (tempo e avaliações × n, log–log)")
+    args = parser.parse_args(argv)
+
+    registros = executar_benchmark(args.algoritmos, args.tamanhos, list(range(args.sementes)),
+                                   medir_memoria=not args.sem_memoria)
+    resumo = resumir(registros)
+    imprimir_resumo(resumo)
+
+    diretorio = os.path.dirname(args.saida)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+    salvar_csv(registros, args.saida + '.csv')
+    salvar_json(registros, resumo, args.saida + '.json')
+    print(f"✅ Salvo: {args.saida}.csv")
+    print(f"✅ Salvo: {args.saida}.json")
+
+    if args.graficos:
+        # Import tardio: matplotlib só é necessário para os gráficos
+        from visualizacao import gerar_graficos_escalabilidade
+        gerar_graficos_escalabilidade(resumir_por_grupo(registros, ('algoritmo', 'n')),
+                                      diretorio or '.', ('tempo', 'avaliacoes'))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Comparação estatística entre dois conjuntos de resultados (gate de regressão).
+
+Carrega dois arquivos JSONL gravados por `GravadorResultados` (por exemplo,
+`experimentos.py` antes e depois de uma mudança) e, para cada algoritmo
+(e tamanho n) e métrica de custo, calcula:
+- a variação relativa da mediana com intervalo de confiança bootstrap;
+- o p-valor do teste de Mann–Whitney.
+
+Uma métrica só é marcada como regressão quando o teste é significativo
+(p < alfa), o intervalo fica inteiro acima de zero e a variação passa do
+limiar. O programa sai com código 1 se houver regressão.
+Contraparte: Trabalho01/src/compare_runs.py.
+
+Uso:
+    python comparar_execucoes.py antes.jsonl depois.jsonl
+    python comparar_execucoes.py antes.jsonl depois.jsonl --metricas tempo --limiar 0.10
+
+Autor: Matheus Emanuel
+Disciplina: Inteligência Artificial - CEFET-MG
+Data: 2025
+"""
+
+import argparse
+import math
+import sys
+from typing import Dict, List, Sequence
+
+from estatisticas import intervalo_bootstrap, iteracoes_do_resultado, ler_jsonl, teste_mann_whitney
+
+
+# Métricas de custo (menor é melhor)
+METRICAS_PADRAO = ['tempo', 'memoria_usada', 'iteracoes', 'avaliacoes']
+
+
+def carregar_amostras(caminho: str) -> Dict[str, Dict[str, List[float]]]:
+    """
+    Agrupa as métricas numéricas de um JSONL por algoritmo (e n, se presente).
+
+    Returns:
+        {rótulo do grupo: {métrica: [valores]}}
+    """
+    amostras = {}
+    for registro in ler_jsonl(caminho):
+        rotulo = registro.get('algoritmo', '')
+        if 'n' in registro:
+            rotulo = f"{rotulo} (n={registro['n']})"
+        grupo = amostras.setdefault(rotulo, {})
+
+        valores = {'iteracoes': iteracoes_do_resultado(registro)}
+        for chave, valor in registro.items():
+            if isinstance(valor, bool) or not isinstance(valor, (int, float)):
+                continue
+            valores.setdefault(chave, valor)
+        for chave, valor in valores.items():
+            grupo.setdefault(chave, []).append(float(valor))
+    return amostras
+
+
+def comparar_amostras(antes: Sequence[float], depois: Sequence[float], alfa: float = 0.05,
+                      limiar: float = 0.05, reamostragens: int = 2000, semente=None) -> Dict:
+    """Compara uma métrica entre os dois conjuntos e classifica a variação."""
+    estimativa, inferior, superior = intervalo_bootstrap(antes, depois, 'mediana',
+                                                         reamostragens, 1 - alfa, semente)
+    _, p_valor = teste_mann_whitney(antes, depois)
+
+    significativo = not math.isnan(p_valor) and p_valor < alfa
+    if significativo and inferior > 0 and estimativa > limiar:
+        veredito = 'regressao'
+    elif significativo and superior < 0 and estimativa < -limiar:
+        veredito = 'melhora'
+    else:
+        veredito = 'igual'
+
+    return {
+        'n_antes': len(antes),
+        'n_depois': len(depois),
+        'variacao': estimativa,
+        'ic_inferior': inferior,
+        'ic_superior': superior,
+        'p_valor': p_valor,
+        'veredito': veredito
+    }
+
+
+def comparar_execucoes(caminho_antes: str, caminho_depois: str,
+                       metricas: Sequence[str] = METRICAS_PADRAO, alfa: float = 0.05,
+                       limiar: float = 0.05, reamostragens: int = 2000,
+                       semente: int = 0) -> List[Dict]:
+    """
+    Compara todos os grupos (algoritmo, n) presentes nos dois arquivos.
+
+    Returns:
+        Uma linha por (grupo, métrica) com variação, IC, p-valor e veredito
+    """
+    antes = carregar_amostras(caminho_antes)
+    depois = carregar_amostras(caminho_depois)
+
+    linhas = []
+    for grupo in antes:
+        if grupo not in depois:
+            continue
+        for metrica in metricas:
+            if metrica not in antes[grupo] or metrica not in depois[grupo]:
+                continue
+            linha = comparar_amostras(antes[grupo][metrica], depois[grupo][metrica],
+                                      alfa, limiar, reamostragens, semente)
+            linhas.append({'grupo': grupo, 'metrica': metrica, **linha})
+    return linhas
+
+
+def imprimir_comparacao(linhas: List[Dict], alfa: float):
+
+    simbolos = {'regressao': '✗ REGRESSÃO', 'melhora': '✓ melhora', 'igual': '= igual'}
+
+    print(f"\n{'='*104}")
+    print(f"COMPARAÇÃO ENTRE EXECUÇÕES (Mann–Whitney, IC bootstrap {100 * (1 - alfa):.0f}% da mediana)")
+    print(f"{'='*104}")
+    print(f"{'Algoritmo':<34} {'Métrica':<16} {'Amostras':>9} {'Variação':>10} "
+          f"{'IC':>21} {'p':>8}  Resultado")
+    print("-" * 104)
+    for linha in linhas:
+        intervalo = f"[{linha['ic_inferior']:+.1%}, {linha['ic_superior']:+.1%}]"
+        print(f"{linha['grupo']:<34} {linha['metrica']:<16} "
+              f"{linha['n_antes']:>4}/{linha['n_depois']:<4} {linha['variacao']:>+10.1%} "
+              f"{intervalo:>21} {linha['p_valor']:>8.4f}  {simbolos[linha['veredito']]}")
+    print("=" * 104 + "\n")
+
+
+def main(argv=None) -> int:
+
+    parser = argparse.ArgumentParser(description="Compara dois conjuntos de resultados (JSONL)")
+    parser.add_argument('antes', help="Resultados de referência (antes da mudança)")
+    parser.add_argument('depois', help="Resultados novos (depois da mudança)")
+    parser.add_argument('--metricas', nargs='+', default=METRICAS_PADRAO,
+                        help="Métricas comparadas (menor é melhor)")
+    parser.add_argument('--alfa', type=float, default=0.05, help="Nível de significância")
+    parser.add_argument('--limiar', type=float, default=0.05,
+                        help="Variação relativa mínima para contar como regressão (0.05 = 5%%)")
+    parser.add_argument('--reamostragens', type=int, default=2000,
+                        help="Reamostragens do bootstrap")
+    parser.add_argument('--semente', type=int, default=0, help="Semente do bootstrap")
+    args = parser.parse_args(argv)
+
+    linhas = comparar_execucoes(args.antes, args.depois, args.metricas, args.alfa,
+                                args.limiar, args.reamostragens, args.semente)
+    if not linhas:
+        print("Nenhum algoritmo/métrica em comum entre os dois arquivos.")
+        return 2
+
+    imprimir_comparacao(linhas, args.alfa)
+    regressoes = [linha for linha in linhas if linha['veredito'] == 'regressao']
+    if regressoes:
+        print(f"❌ {len(regressoes)} regressão(ões) significativa(s).")
+        return 1
+    print("✅ Nenhuma regressão significativa.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
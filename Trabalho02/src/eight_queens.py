@@ -1,9 +1,10 @@
+import argparse
+import sys
 import time
 import os
 import gc
-import ctypes
-import psutil
-import numpy as np
+from aleatoriedade import gerar_sementes
+from estatisticas import GravadorResultados, ResumoAlgoritmo, resumir_resultados
 from hill_climbing import (
     hill_climbing_basico,
     hill_climbing_com_laterais,
@@ -11,37 +12,66 @@ from hill_climbing import (
     simulated_annealing,
     imprimir_tabuleiro
 )
-from visualizacao import gerar_graficos
+from tabuleiro import REPRESENTACOES
+from medicao import MODOS, executar_em_processo_novo, memoria_processo, medir_quente, resumo_robusto
 
 def process_memory():
-  
-    process = psutil.Process(os.getpid())
-    mem_info = process.memory_info()
-    return mem_info.rss
+    
+    # /proc/self/statm no Linux (sem importar o psutil), ver medicao.memoria_processo
+    return memoria_processo()
 
 
-def clear_cache():
+def clear_cache(pausa=0.1):
     
     # Força coleta de lixo
     gc.collect()
     gc.collect()
     gc.collect()
     
-    # Pausa para garantir limpeza
-    time.sleep(0.1)
+    # Pausa para garantir limpeza (0 desativa; útil em lotes grandes)
+    if pausa > 0:
+        time.sleep(pausa)
     
     # Limpa working set (Windows)
     try:
         if os.name == 'nt':
+            import ctypes
             ctypes.windll.kernel32.SetProcessWorkingSetSize(-1, -1, -1)
     except:
         pass
 
 
-def executar_com_cold_cache(algoritmo_func, **kwargs):
-  
+def executar_com_cold_cache(algoritmo_func, pausa_cache=0.1, modo='padrao', **kwargs):
+    """
+    Executa o algoritmo uma vez e acrescenta 'memoria_usada' ao resultado.
+
+    Modos de medição (ver `medicao.py`):
+        'padrao': gc.collect() + pausa no próprio processo (comportamento original)
+        'frio': execução em um processo novo, após descartar o cache de páginas
+                (quando permitido)
+        'quente': aquecimento + repetições calibradas; 'tempo' passa a ser a
+                  mediana por chamada (sem outliers) e o resultado ganha
+                  'tempo_iqr', 'repeticoes' e 'outliers'
+
+    Passe `semente` nos kwargs: no modo quente todas as chamadas (aquecimento
+    e repetições) precisam resolver o mesmo tabuleiro.
+    """
+    if modo == 'frio':
+        return executar_em_processo_novo(algoritmo_func, **kwargs)
+
+    if modo == 'quente':
+        mem_antes = process_memory()
+        resultado, tempos, repeticoes = medir_quente(algoritmo_func, **kwargs)
+        resumo = resumo_robusto(tempos)
+        resultado['tempo'] = resumo['mediana']
+        resultado['tempo_iqr'] = resumo['iqr']
+        resultado['repeticoes'] = repeticoes
+        resultado['outliers'] = resumo['outliers']
+        resultado['memoria_usada'] = process_memory() - mem_antes
+        return resultado
+
     # Limpa cache antes da execução
-    clear_cache()
+    clear_cache(pausa_cache)
     
     # Mede memória antes
     mem_antes = process_memory()
@@ -61,87 +91,58 @@ def executar_com_cold_cache(algoritmo_func, **kwargs):
 
 def imprimir_estatisticas(nome_algoritmo, resultados):
   
-    # Extrai métricas
-    tempos = [r['tempo'] for r in resultados]
-    memorias = [r['memoria_usada'] for r in resultados]
-    iteracoes = [r.get('iteracoes', r.get('iteracoes_total', 0)) for r in resultados]
-    conflitos = [r['conflitos'] for r in resultados]
-    sucessos = [r['sucesso'] for r in resultados]
-    
-    # Calcula estatísticas
-    taxa_sucesso = (sum(sucessos) / len(sucessos)) * 100
-    
-    avg_tempo = np.mean(tempos)
-    std_tempo = np.std(tempos)
-    min_tempo = np.min(tempos)
-    max_tempo = np.max(tempos)
-    
-    avg_memoria = np.mean(memorias)
-    std_memoria = np.std(memorias)
-    min_memoria = np.min(memorias)
-    max_memoria = np.max(memorias)
-    
-    avg_iteracoes = np.mean(iteracoes)
-    avg_conflitos = np.mean(conflitos)
-    
-    # Estatísticas específicas por algoritmo
-    if 'reinicio' in resultados[0]:
-        reinicio = [r['reinicio'] for r in resultados]
-        avg_reinicio = np.mean(reinicio)
-        std_reinicio = np.std(reinicio)
-        min_reinicio = np.min(reinicio)
-        max_reinicio = np.max(reinicio)
-    
-    if 'laterais' in resultados[0]:
-        laterais = [r['laterais'] for r in resultados]
-        avg_laterais = np.mean(laterais)
-    
-    if 'movimentos_ruins_aceitos' in resultados[0]:
-        ruins = [r['movimentos_ruins_aceitos'] for r in resultados]
-        avg_ruins = np.mean(ruins)
-        taxa_aceitacao = (avg_ruins / avg_iteracoes * 100) if avg_iteracoes > 0 else 0
+    # Aceita lista de resultados ou um ResumoAlgoritmo já acumulado em fluxo
+    resumo = resumir_resultados(resultados, nome_algoritmo)
+    tempo = resumo['tempo']
+    memoria = resumo['memoria_usada']
+    iteracoes = resumo['iteracoes']
     
     # Imprime estatísticas
     print(f"\n{'='*70}")
-    print(f"ESTATÍSTICAS - {nome_algoritmo} (10 execuções em Cold Cache)")
+    print(f"ESTATÍSTICAS - {nome_algoritmo} ({resumo.execucoes} execuções em Cold Cache)")
     print(f"{'='*70}")
     
     print(f"\n TAXA DE SUCESSO:")
-    print(f"   • Taxa: {taxa_sucesso:.1f}% ({sum(sucessos)}/10 execuções)")
+    print(f"   • Taxa: {resumo.taxa_sucesso:.1f}% ({resumo.sucessos}/{resumo.execucoes} execuções)")
     
     print(f"\n  TEMPO DE EXECUÇÃO:")
-    print(f"   • Média: {avg_tempo:.6f} segundos")
-    print(f"   • Desvio Padrão: {std_tempo:.6f} segundos")
-    print(f"   • Mínimo: {min_tempo:.6f} segundos")
-    print(f"   • Máximo: {max_tempo:.6f} segundos")
+    print(f"   • Média: {tempo.media:.6f} segundos")
+    print(f"   • Desvio Padrão: {tempo.desvio_padrao:.6f} segundos")
+    print(f"   • Mediana: {tempo.mediana:.6f} segundos")
+    print(f"   • Mínimo: {tempo.minimo:.6f} segundos")
+    print(f"   • Máximo: {tempo.maximo:.6f} segundos")
     
     print(f"\n MEMÓRIA CONSUMIDA:")
-    print(f"   • Média: {avg_memoria:,.0f} bytes ({avg_memoria/1024:.2f} KB)")
-    print(f"   • Desvio Padrão: {std_memoria:,.0f} bytes ({std_memoria/1024:.2f} KB)")
-    print(f"   • Mínima: {min_memoria:,.0f} bytes ({min_memoria/1024:.2f} KB)")
-    print(f"   • Máxima: {max_memoria:,.0f} bytes ({max_memoria/1024:.2f} KB)")
+    print(f"   • Média: {memoria.media:,.0f} bytes ({memoria.media/1024:.2f} KB)")
+    print(f"   • Desvio Padrão: {memoria.desvio_padrao:,.0f} bytes ({memoria.desvio_padrao/1024:.2f} KB)")
+    print(f"   • Mínima: {memoria.minimo:,.0f} bytes ({memoria.minimo/1024:.2f} KB)")
+    print(f"   • Máxima: {memoria.maximo:,.0f} bytes ({memoria.maximo/1024:.2f} KB)")
     
     print(f"\n ITERAÇÕES:")
-    print(f"   • Média: {avg_iteracoes:.1f} iterações")
+    print(f"   • Média: {iteracoes.media:.1f} iterações")
     
-    if 'reinicio' in resultados[0]:
+    # Estatísticas específicas por algoritmo
+    if 'reinicio' in resumo:
+        reinicio = resumo['reinicio']
         print(f"\n REINÍCIOS (Random-Restart):")
-        print(f"   • Média: {avg_reinicio:.1f} reinícios")
-        print(f"   • Desvio Padrão: {std_reinicio:.2f}")
-        print(f"   • Mínimo: {min_reinicio} reinícios")
-        print(f"   • Máximo: {max_reinicio} reinícios")
+        print(f"   • Média: {reinicio.media:.1f} reinícios")
+        print(f"   • Desvio Padrão: {reinicio.desvio_padrao:.2f}")
+        print(f"   • Mínimo: {reinicio.minimo:.0f} reinícios")
+        print(f"   • Máximo: {reinicio.maximo:.0f} reinícios")
     
-    if 'laterais' in resultados[0]:
+    if 'laterais' in resumo:
         print(f"\n↔  MOVIMENTOS LATERAIS:")
-        print(f"   • Média: {avg_laterais:.1f} movimentos")
+        print(f"   • Média: {resumo['laterais'].media:.1f} movimentos")
     
-    if 'movimentos_ruins_aceitos' in resultados[0]:
+    if 'movimentos_ruins_aceitos' in resumo:
+        avg_ruins = resumo['movimentos_ruins_aceitos'].media
+        taxa_aceitacao = (avg_ruins / iteracoes.media * 100) if iteracoes.media > 0 else 0
         print(f"\n🔥 MOVIMENTOS RUINS ACEITOS (Simulated Annealing):")
         print(f"   • Média: {avg_ruins:.1f} movimentos")
         print(f"   • Taxa de aceitação: {taxa_aceitacao:.1f}%")
     
     print(f"\n🎯 QUALIDADE DA SOLUÇÃO:")
-    print(f"   • Conflitos médios: {avg_conflitos:.2f}")
+    print(f"   • Conflitos médios: {resumo['conflitos'].media:.2f}")
     
     print(f"\n{'='*70}\n")
 
@@ -152,20 +153,15 @@ def comparar_algoritmos(resultados_dict):
     print("COMPARAÇÃO ENTRE ALGORITMOS")
     print("="*70)
     
-    # Extrai métricas de cada algoritmo
+    # Extrai métricas de cada algoritmo (listas ou resumos em fluxo)
     metricas = {}
     for nome, resultados in resultados_dict.items():
-        sucessos = sum([r['sucesso'] for r in resultados])
-        taxa_sucesso = (sucessos / len(resultados)) * 100
-        tempo_medio = np.mean([r['tempo'] for r in resultados])
-        memoria_media = np.mean([r['memoria_usada'] for r in resultados])
-        iteracoes_media = np.mean([r.get('iteracoes', r.get('iteracoes_total', 0)) for r in resultados])
-        
+        resumo = resumir_resultados(resultados, nome)
         metricas[nome] = {
-            'taxa_sucesso': taxa_sucesso,
-            'tempo_medio': tempo_medio,
-            'memoria_media': memoria_media,
-            'iteracoes_media': iteracoes_media
+            'taxa_sucesso': resumo.taxa_sucesso,
+            'tempo_medio': resumo['tempo'].media,
+            'memoria_media': resumo['memoria_usada'].media,
+            'iteracoes_media': resumo['iteracoes'].media
         }
     
     # Encontra os melhores em cada categoria
@@ -204,7 +200,25 @@ def comparar_algoritmos(resultados_dict):
 # EXECUÇÃO PRINCIPAL
 # ============================================================================
 
-def main():
+def main(argv=None):
+    
+    parser = argparse.ArgumentParser(description="Problema das 8 Rainhas - Hill Climbing")
+    grupo = parser.add_mutually_exclusive_group()
+    grupo.add_argument('--graficos', dest='graficos', action='store_true', default=None,
+                       help="Gera os gráficos sem perguntar")
+    grupo.add_argument('--sem-graficos', dest='graficos', action='store_false',
+                       help="Não gera os gráficos")
+    parser.add_argument('--saida', default=None,
+                        help="Grava cada resultado em um arquivo JSONL conforme executa")
+    parser.add_argument('--modo', choices=MODOS, default='padrao',
+                        help="Medição: padrao, frio (processo novo) ou quente (repetições calibradas)")
+    parser.add_argument('--representacao', choices=list(REPRESENTACOES), default='linhas',
+                        help="Estados dos algoritmos 1-4: linhas livres ou permutação (vizinhos por troca)")
+    parser.add_argument('--semente', type=int, default=None,
+                        help="Semente mestre (cada execução recebe uma semente fixa derivada dela)")
+    args = parser.parse_args(argv)
+    
+    gravador = GravadorResultados(args.saida) if args.saida else None
     
     print("\n" + "="*70)
     print("PROBLEMA DAS 8 RAINHAS - HILL CLIMBING")
@@ -213,6 +227,9 @@ def main():
     
     num_execucoes = 10
     resultados_todos = {}
+    # Uma semente por execução: no modo quente, as repetições da execução i
+    # refazem exatamente o mesmo trabalho
+    sementes = gerar_sementes(args.semente, num_execucoes)
     
     # ========================================================================
     # 1. HILL CLIMBING BÁSICO
@@ -221,15 +238,20 @@ def main():
     print("1️⃣  EXECUTANDO: HILL CLIMBING BÁSICO")
     print("="*70)
     
-    resultados_basico = []
+    resultados_basico = ResumoAlgoritmo("Hill Climbing Básico")
     for i in range(num_execucoes):
         print(f"Execução {i+1}/10...", end=" ")
         resultado = executar_com_cold_cache(
             hill_climbing_basico,
+            modo=args.modo,
+            semente=sementes[i],
+            representacao=args.representacao,
             max_iteracoes=1000,
             verbose=False
         )
-        resultados_basico.append(resultado)
+        resultados_basico.adicionar(resultado)
+        if gravador:
+            gravador.gravar({'algoritmo': "Hill Climbing Básico", 'execucao': i, 'semente': sementes[i], **resultado})
         status = "✓" if resultado['sucesso'] else "✗"
         print(f"{status} ({resultado['conflitos']} conflitos, {resultado['iteracoes']} iter)")
     
@@ -237,7 +259,7 @@ def main():
     resultados_todos["Hill Climbing Básico"] = resultados_basico
     
     # Mostra uma solução encontrada (se houver)
-    solucao = next((r for r in resultados_basico if r['sucesso']), None)
+    solucao = resultados_basico.exemplo_solucao
     if solucao:
         print("Exemplo de solução encontrada:")
         imprimir_tabuleiro(solucao['estado_final'])
@@ -249,16 +271,21 @@ def main():
     print("2️⃣  EXECUTANDO: HILL CLIMBING COM MOVIMENTOS LATERAIS")
     print("="*70)
     
-    resultados_laterais = []
+    resultados_laterais = ResumoAlgoritmo("Hill Climbing com Laterais")
     for i in range(num_execucoes):
         print(f"Execução {i+1}/10...", end=" ")
         resultado = executar_com_cold_cache(
             hill_climbing_com_laterais,
+            modo=args.modo,
+            semente=sementes[i],
+            representacao=args.representacao,
             max_iteracoes=1000,
             max_laterais=100,
             verbose=False
         )
-        resultados_laterais.append(resultado)
+        resultados_laterais.adicionar(resultado)
+        if gravador:
+            gravador.gravar({'algoritmo': "Hill Climbing com Laterais", 'execucao': i, 'semente': sementes[i], **resultado})
         status = "✓" if resultado['sucesso'] else "✗"
         print(f"{status} ({resultado['conflitos']} conflitos, "
               f"{resultado['iteracoes']} iter, {resultado['laterais']} lat)")
@@ -267,7 +294,7 @@ def main():
     resultados_todos["Hill Climbing com Laterais"] = resultados_laterais
     
     # Mostra uma solução encontrada
-    solucao = next((r for r in resultados_laterais if r['sucesso']), None)
+    solucao = resultados_laterais.exemplo_solucao
     if solucao:
         print("Exemplo de solução encontrada:")
         imprimir_tabuleiro(solucao['estado_final'])
@@ -279,17 +306,22 @@ def main():
     print("3️⃣  EXECUTANDO: RANDOM-RESTART HILL CLIMBING")
     print("="*70)
     
-    resultados_restart = []
+    resultados_restart = ResumoAlgoritmo("Random-Restart Hill Climbing")
     for i in range(num_execucoes):
         print(f"Execução {i+1}/10...", end=" ")
         resultado = executar_com_cold_cache(
             random_restart_hill_climbing,
+            modo=args.modo,
+            semente=sementes[i],
+            representacao=args.representacao,
             max_reinicio=100,
             usar_laterais=True,
             max_laterais=100,
             verbose=False
         )
-        resultados_restart.append(resultado)
+        resultados_restart.adicionar(resultado)
+        if gravador:
+            gravador.gravar({'algoritmo': "Random-Restart Hill Climbing", 'execucao': i, 'semente': sementes[i], **resultado})
         status = "✓" if resultado['sucesso'] else "✗"
         print(f"{status} ({resultado['conflitos']} conflitos, "
               f"{resultado['reinicio']} reinícios, {resultado['iteracoes_total']} iter)")
@@ -298,7 +330,7 @@ def main():
     resultados_todos["Random-Restart Hill Climbing"] = resultados_restart
     
     # Mostra uma solução encontrada
-    solucao = next((r for r in resultados_restart if r['sucesso']), resultados_restart[0])
+    solucao = resultados_restart.exemplo_solucao or resultados_restart.primeiro_resultado
     if solucao:
         print("Exemplo de solução encontrada:")
         imprimir_tabuleiro(solucao['estado_final'])
@@ -310,17 +342,22 @@ def main():
     print("4️⃣  EXECUTANDO: SIMULATED ANNEALING")
     print("="*70)
     
-    resultados_annealing = []
+    resultados_annealing = ResumoAlgoritmo("Simulated Annealing")
     for i in range(num_execucoes):
         print(f"Execução {i+1}/10...", end=" ")
         resultado = executar_com_cold_cache(
             simulated_annealing,
+            modo=args.modo,
+            semente=sementes[i],
+            representacao=args.representacao,
             temperatura_inicial=2000.0,
             taxa_resfriamento=0.995,
             max_iteracoes=100000,
             verbose=False
         )
-        resultados_annealing.append(resultado)
+        resultados_annealing.adicionar(resultado)
+        if gravador:
+            gravador.gravar({'algoritmo': "Simulated Annealing", 'execucao': i, 'semente': sementes[i], **resultado})
         status = "✓" if resultado['sucesso'] else "✗"
         print(f"{status} ({resultado['conflitos']} conflitos, "
               f"{resultado['iteracoes']} iter, {resultado['movimentos_ruins_aceitos']} pioras)")
@@ -329,32 +366,78 @@ def main():
     resultados_todos["Simulated Annealing"] = resultados_annealing
     
     # Mostra uma solução encontrada
-    solucao = next((r for r in resultados_annealing if r['sucesso']), resultados_annealing[0])
+    solucao = resultados_annealing.exemplo_solucao or resultados_annealing.primeiro_resultado
+    if solucao:
+        print("Exemplo de solução encontrada:")
+        imprimir_tabuleiro(solucao['estado_final'])
+    
+    # ========================================================================
+    # 5. ALGORITMO GENÉTICO
+    # ========================================================================
+    print("\n\n" + "="*70)
+    print("5️⃣  EXECUTANDO: ALGORITMO GENÉTICO")
+    print("="*70)
+    
+    # Import tardio: NumPy só é necessário para o algoritmo genético
+    from algoritmo_genetico import algoritmo_genetico
+    
+    resultados_genetico = ResumoAlgoritmo("Algoritmo Genético")
+    for i in range(num_execucoes):
+        print(f"Execução {i+1}/10...", end=" ")
+        resultado = executar_com_cold_cache(
+            algoritmo_genetico,
+            modo=args.modo,
+            semente=sementes[i],
+            tamanho_populacao=100,
+            max_geracoes=1000,
+            verbose=False
+        )
+        resultados_genetico.adicionar(resultado)
+        if gravador:
+            gravador.gravar({'algoritmo': "Algoritmo Genético", 'execucao': i, 'semente': sementes[i], **resultado})
+        status = "✓" if resultado['sucesso'] else "✗"
+        print(f"{status} ({resultado['conflitos']} conflitos, {resultado['iteracoes']} gerações)")
+    
+    imprimir_estatisticas("Algoritmo Genético", resultados_genetico)
+    resultados_todos["Algoritmo Genético"] = resultados_genetico
+    
+    # Mostra uma solução encontrada
+    solucao = resultados_genetico.exemplo_solucao or resultados_genetico.primeiro_resultado
     if solucao:
         print("Exemplo de solução encontrada:")
         imprimir_tabuleiro(solucao['estado_final'])
     
     # ========================================================================
-    # 5. COMPARAÇÃO FINAL
+    # 6. COMPARAÇÃO FINAL
     # ========================================================================
     comparar_algoritmos(resultados_todos)
     
+    if gravador:
+        gravador.fechar()
+        print(f"✅ Resultados gravados em: {args.saida}")
+    
     # ========================================================================
-    # 5. GERAÇÃO DE GRÁFICOS
+    # 7. GERAÇÃO DE GRÁFICOS
     # ========================================================================
     print("\n" + "="*70)
     print("📊 GERANDO VISUALIZAÇÕES...")
     print("="*70)
-    print("\nDeseja gerar os gráficos de comparação? (S/N): ", end="")
     
-    try:
-        resposta = input().strip().upper()
-        if resposta in ['S', 'SIM', 'Y', 'YES', '']:
-            gerar_graficos(resultados_todos)
-        else:
-            print("⏭️  Geração de gráficos ignorada.")
-    except:
-        print("\n⏭️  Geração de gráficos ignorada.")
+    # Só pergunta em terminal interativo; em lote gera direto (resposta padrão)
+    if args.graficos is None and sys.stdin.isatty():
+        print("\nDeseja gerar os gráficos de comparação? (S/N): ", end="")
+        try:
+            resposta = input().strip().upper()
+            args.graficos = resposta in ['S', 'SIM', 'Y', 'YES', '']
+        except EOFError:
+            args.graficos = False
+    
+    if args.graficos is False:
+        print("⏭️  Geração de gráficos ignorada.")
+    else:
+        # Import tardio: o matplotlib só é carregado se os gráficos forem gerados
+        from visualizacao import gerar_graficos
+        gerar_graficos(resultados_todos)
     
     print("\n✅ Execução concluída com sucesso!")
     print("="*70 + "\n")
@@ -0,0 +1,558 @@
+"""
+Estatísticas em fluxo (streaming) para os resultados dos experimentos.
+
+Em vez de guardar todos os dicionários de resultado em listas, cada
+resultado é:
+- gravado em disco por `GravadorResultados` (JSONL append-only e, se
+  desejado, um arquivo binário por coluna numérica);
+- acumulado em `ResumoAlgoritmo`, que mantém média/variância/mín/máx
+  (algoritmo de Welford), quantis (estimador P²) e um histograma com classes
+  logarítmicas em memória constante.
+
+Assim as estatísticas de milhões de execuções ficam disponíveis durante
+a própria execução, sem reconstruir arrays a partir de listas.
+
+Contraparte em Trabalho01/src/stats_stream.py (ver README da raiz).
+
+Autor: Matheus Emanuel
+Disciplina: Inteligência Artificial - CEFET-MG
+Data: 2025
+"""
+
+import json
+import math
+import os
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+
+# ============================================================================
+# ACUMULADORES
+# ============================================================================
+
+class AcumuladorWelford:
+    """Média, variância (populacional, como np.std), mínimo e máximo em O(1) de memória."""
+
+    __slots__ = ('contagem', 'media', '_m2', 'minimo', 'maximo')
+
+    def __init__(self):
+        self.contagem = 0
+        self.media = 0.0
+        self._m2 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+
+    def adicionar(self, valor: float):
+        self.contagem += 1
+        delta = valor - self.media
+        self.media += delta / self.contagem
+        self._m2 += delta * (valor - self.media)
+        if valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+
+    def combinar(self, outro: 'AcumuladorWelford'):
+        """Incorpora outro acumulador (ex.: vindo de outro worker)."""
+        if outro.contagem == 0:
+            return
+        total = self.contagem + outro.contagem
+        delta = outro.media - self.media
+        self.media += delta * outro.contagem / total
+        self._m2 += outro._m2 + delta * delta * self.contagem * outro.contagem / total
+        self.contagem = total
+        self.minimo = min(self.minimo, outro.minimo)
+        self.maximo = max(self.maximo, outro.maximo)
+
+    @property
+    def variancia(self) -> float:
+        return self._m2 / self.contagem if self.contagem else 0.0
+
+    @property
+    def desvio_padrao(self) -> float:
+        return math.sqrt(self.variancia)
+
+
+class QuantilP2:
+    """
+    Estimador P² de Jain & Chlamtac (1985) para um quantil p.
+
+    Mantém apenas 5 marcadores; com menos de 5 amostras devolve o quantil
+    exato (interpolação linear, como np.percentile).
+    """
+
+    __slots__ = ('p', '_iniciais', '_alturas', '_posicoes', '_desejadas', '_incrementos')
+
+    def __init__(self, p: float):
+        self.p = p
+        self._iniciais = []
+        self._alturas = None
+
+    def adicionar(self, valor: float):
+        if self._alturas is None:
+            self._iniciais.append(valor)
+            if len(self._iniciais) == 5:
+                p = self.p
+                self._alturas = sorted(self._iniciais)
+                self._posicoes = [0, 1, 2, 3, 4]
+                self._desejadas = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+                self._incrementos = [0, p / 2, p, (1 + p) / 2, 1]
+                self._iniciais = None
+            return
+
+        q, n = self._alturas, self._posicoes
+        if valor < q[0]:
+            q[0] = valor
+            k = 0
+        elif valor >= q[4]:
+            q[4] = valor
+            k = 3
+        else:
+            k = 0
+            while valor >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desejadas[i] += self._incrementos[i]
+
+        for i in range(1, 4):
+            d = self._desejadas[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                parabolica = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if q[i - 1] < parabolica < q[i + 1]:
+                    q[i] = parabolica
+                else:
+                    q[i] += d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    @property
+    def valor(self) -> float:
+        if self._alturas is not None:
+            return self._alturas[2]
+        if not self._iniciais:
+            return math.nan
+        ordenados = sorted(self._iniciais)
+        posicao = self.p * (len(ordenados) - 1)
+        inferior = int(posicao)
+        superior = min(inferior + 1, len(ordenados) - 1)
+        return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicao - inferior)
+
+
+class HistogramaLog:
+    """
+    Histograma com classes de largura logarítmica constante.
+
+    Cada potência de 10 é dividida em `por_decada` classes, e só as classes
+    com alguma amostra são guardadas. A memória depende da faixa de valores,
+    não do número de amostras: tempos de 1 µs a 1000 s ocupam no máximo
+    9 × `por_decada` classes. Valores não positivos (e NaN) são contados à parte.
+    Dois histogramas com o mesmo `por_decada` podem ser combinados.
+    """
+
+    __slots__ = ('por_decada', 'contagens', 'nao_positivos')
+
+    def __init__(self, por_decada: int = 10):
+        self.por_decada = por_decada
+        self.contagens: Dict[int, int] = {}
+        self.nao_positivos = 0
+
+    def adicionar(self, valor: float):
+        if valor > 0:
+            classe = math.floor(math.log10(valor) * self.por_decada)
+            self.contagens[classe] = self.contagens.get(classe, 0) + 1
+        else:
+            self.nao_positivos += 1
+
+    def combinar(self, outro: 'HistogramaLog'):
+        if outro.por_decada != self.por_decada:
+            raise ValueError(f"Histogramas incompatíveis: {self.por_decada} e "
+                             f"{outro.por_decada} classes por década")
+        for classe, contagem in outro.contagens.items():
+            self.contagens[classe] = self.contagens.get(classe, 0) + contagem
+        self.nao_positivos += outro.nao_positivos
+
+    @property
+    def total(self) -> int:
+        return sum(self.contagens.values()) + self.nao_positivos
+
+    def classes(self) -> List[List[float]]:
+        """
+        Classes contíguas da menor à maior com amostras (as vazias no meio
+        entram com contagem 0, para desenhar como degraus).
+
+        Returns:
+            Lista de [início, fim, contagem]
+        """
+        if not self.contagens:
+            return []
+        classes = []
+        for classe in range(min(self.contagens), max(self.contagens) + 1):
+            classes.append([10 ** (classe / self.por_decada),
+                            10 ** ((classe + 1) / self.por_decada),
+                            self.contagens.get(classe, 0)])
+        return classes
+
+    def para_dict(self) -> Dict:
+        return {
+            'por_decada': self.por_decada,
+            'nao_positivos': self.nao_positivos,
+            'classes': self.classes()
+        }
+
+
+class ResumoMetrica:
+    """Welford + quantis P² + histograma logarítmico de uma métrica."""
+
+    __slots__ = ('acumulador', 'quantis', 'histograma')
+
+    QUANTIS_PADRAO = (0.25, 0.5, 0.75, 0.9, 0.99)
+
+    def __init__(self, quantis: Sequence[float] = QUANTIS_PADRAO):
+        self.acumulador = AcumuladorWelford()
+        self.quantis = {p: QuantilP2(p) for p in quantis}
+        self.histograma = HistogramaLog()
+
+    def adicionar(self, valor: float):
+        self.acumulador.adicionar(valor)
+        for estimador in self.quantis.values():
+            estimador.adicionar(valor)
+        self.histograma.adicionar(valor)
+
+    def quantil(self, p: float) -> float:
+        return self.quantis[p].valor
+
+    @property
+    def media(self) -> float:
+        return self.acumulador.media
+
+    @property
+    def desvio_padrao(self) -> float:
+        return self.acumulador.desvio_padrao
+
+    @property
+    def minimo(self) -> float:
+        return self.acumulador.minimo
+
+    @property
+    def maximo(self) -> float:
+        return self.acumulador.maximo
+
+    @property
+    def mediana(self) -> float:
+        return self.quantil(0.5)
+
+    def para_dict(self) -> Dict:
+        return {
+            'contagem': self.acumulador.contagem,
+            'media': self.media,
+            'desvio_padrao': self.desvio_padrao,
+            'minimo': self.minimo,
+            'maximo': self.maximo,
+            'quantis': {str(p): estimador.valor for p, estimador in self.quantis.items()},
+            'histograma': self.histograma.para_dict()
+        }
+
+
+# ============================================================================
+# RESUMO POR ALGORITMO
+# ============================================================================
+
+def iteracoes_do_resultado(resultado: Dict) -> int:
+    """Iterações do resultado (Random-Restart usa 'iteracoes_total')."""
+    return resultado.get('iteracoes', resultado.get('iteracoes_total', 0))
+
+
+class ResumoAlgoritmo:
+    """
+    Estatísticas em fluxo de todas as execuções de um algoritmo.
+
+    Toda métrica numérica dos resultados (tempo, memoria_usada, conflitos,
+    laterais, reinicio, ...) ganha um ResumoMetrica automaticamente;
+    'iteracoes' unifica 'iteracoes' e 'iteracoes_total'. Guarda apenas o
+    primeiro resultado e o primeiro com sucesso (para exibir um exemplo).
+    """
+
+    IGNORADOS = {'sucesso', 'execucao', 'semente', 'n', 'iteracoes_total'}
+
+    def __init__(self, nome: str = ''):
+        self.nome = nome
+        self.execucoes = 0
+        self.sucessos = 0
+        self.metricas: Dict[str, ResumoMetrica] = {}
+        self.primeiro_resultado: Optional[Dict] = None
+        self.exemplo_solucao: Optional[Dict] = None
+
+    def adicionar(self, resultado: Dict):
+        self.execucoes += 1
+        if self.primeiro_resultado is None:
+            self.primeiro_resultado = resultado
+        if resultado['sucesso']:
+            self.sucessos += 1
+            if self.exemplo_solucao is None:
+                self.exemplo_solucao = resultado
+
+        valores = {'iteracoes': iteracoes_do_resultado(resultado)}
+        for chave, valor in resultado.items():
+            if chave in self.IGNORADOS or isinstance(valor, bool):
+                continue
+            if isinstance(valor, (int, float)):
+                valores[chave] = valor
+
+        for chave, valor in valores.items():
+            metrica = self.metricas.get(chave)
+            if metrica is None:
+                metrica = self.metricas[chave] = ResumoMetrica()
+            metrica.adicionar(valor)
+
+    def __contains__(self, metrica: str) -> bool:
+        return metrica in self.metricas
+
+    def __getitem__(self, metrica: str) -> ResumoMetrica:
+        return self.metricas[metrica]
+
+    @property
+    def taxa_sucesso(self) -> float:
+        return self.sucessos / self.execucoes * 100 if self.execucoes else 0.0
+
+    def para_dict(self) -> Dict:
+        return {
+            'nome': self.nome,
+            'execucoes': self.execucoes,
+            'sucessos': self.sucessos,
+            'taxa_sucesso': self.taxa_sucesso,
+            'metricas': {chave: metrica.para_dict() for chave, metrica in self.metricas.items()}
+        }
+
+
+def resumir_resultados(resultados: Iterable[Dict], nome: str = '') -> ResumoAlgoritmo:
+    """Resume uma sequência (lista ou gerador) de resultados; aceita um resumo pronto."""
+    if isinstance(resultados, ResumoAlgoritmo):
+        return resultados
+    resumo = ResumoAlgoritmo(nome)
+    for resultado in resultados:
+        resumo.adicionar(resultado)
+    return resumo
+
+
+def resumir_por_grupo(resultados: Iterable[Dict],
+                      chaves: Sequence[str] = ('algoritmo',)) -> Dict[tuple, ResumoAlgoritmo]:
+    """
+    Resume em uma única passada, separando por grupo.
+
+    Ex.: `resumir_por_grupo(ler_jsonl(caminho), ('algoritmo', 'n'))` resume um
+    estudo de escalabilidade inteiro sem carregar os resultados na memória.
+
+    Args:
+        resultados: Lista ou gerador de resultados
+        chaves: Campos que definem o grupo (ausentes valem None)
+
+    Returns:
+        {tupla com os valores das chaves: ResumoAlgoritmo}
+    """
+    grupos: Dict[tuple, ResumoAlgoritmo] = {}
+    for resultado in resultados:
+        grupo = tuple(resultado.get(chave) for chave in chaves)
+        resumo = grupos.get(grupo)
+        if resumo is None:
+            resumo = grupos[grupo] = ResumoAlgoritmo(str(grupo[0]))
+        resumo.adicionar(resultado)
+    return grupos
+
+
+# ============================================================================
+# ARMAZENAMENTO EM DISCO
+# ============================================================================
+
+class GravadorResultados:
+    """
+    Destino append-only dos resultados.
+
+    - `caminho_jsonl`: um resultado por linha (JSON), gravado e descarregado
+      imediatamente;
+    - `diretorio_colunas` (opcional): um arquivo `<campo>.f64` por métrica
+      numérica (float64 nativo), legível com `np.fromfile(caminho)` ou
+      `ler_coluna`. Cada coluna fica alinhada pelo índice da execução
+      (campos ausentes são gravados como NaN).
+    - `excluir`: campos que não vão para o JSONL (ex.: 'estado_final').
+    """
+
+    def __init__(self, caminho_jsonl: str, diretorio_colunas: Optional[str] = None,
+                 excluir: Sequence[str] = ()):
+        diretorio = os.path.dirname(caminho_jsonl)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+        self._jsonl = open(caminho_jsonl, 'a', encoding='utf-8')
+        self._excluir = set(excluir)
+        self._diretorio_colunas = diretorio_colunas
+        self._colunas = {}
+        self._linhas = 0
+        if diretorio_colunas:
+            os.makedirs(diretorio_colunas, exist_ok=True)
+
+    def gravar(self, resultado: Dict):
+        registro = {k: v for k, v in resultado.items() if k not in self._excluir}
+        self._jsonl.write(json.dumps(registro, ensure_ascii=False) + '\n')
+        self._jsonl.flush()
+
+        if self._diretorio_colunas:
+            numericos = {k: float(v) for k, v in resultado.items()
+                         if isinstance(v, (int, float)) and k not in self._excluir}
+            for campo in numericos.keys() - self._colunas.keys():
+                arquivo = open(os.path.join(self._diretorio_colunas, f'{campo}.f64'), 'ab')
+                # Completa com NaN as execuções anteriores à primeira aparição do campo
+                array('d', [math.nan] * self._linhas).tofile(arquivo)
+                self._colunas[campo] = arquivo
+            for campo, arquivo in self._colunas.items():
+                array('d', [numericos.get(campo, math.nan)]).tofile(arquivo)
+                arquivo.flush()
+        self._linhas += 1
+
+    def fechar(self):
+        self._jsonl.close()
+        for arquivo in self._colunas.values():
+            arquivo.close()
+        self._colunas = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+
+def ler_jsonl(caminho: str) -> Iterator[Dict]:
+    """Lê um arquivo JSONL de resultados em fluxo (uma linha por vez)."""
+    with open(caminho, 'r', encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            linha = linha.strip()
+            if linha:
+                yield json.loads(linha)
+
+
+def ler_coluna(diretorio_colunas: str, campo: str) -> array:
+    """Carrega uma coluna gravada por `GravadorResultados`."""
+    coluna = array('d')
+    with open(os.path.join(diretorio_colunas, f'{campo}.f64'), 'rb') as arquivo:
+        coluna.frombytes(arquivo.read())
+    return coluna
+
+
+# ============================================================================
+# COMPARAÇÃO ENTRE DOIS CONJUNTOS DE AMOSTRAS
+# ============================================================================
+
+def _variacao_relativa(base: float, atual: float) -> float:
+    """
+    Variação `atual / base - 1`; com base 0, qualquer variação é ±infinita
+    (ex.: memória que era 0 em todas as execuções e passou a ser > 0).
+    """
+    if base == atual:
+        return 0.0
+    if base == 0:
+        return math.copysign(math.inf, atual)
+    return atual / base - 1
+
+
+def _quantis(valores, probabilidades: Sequence[float]) -> List[float]:
+    """
+    Quantis com interpolação linear (como np.quantile), aceitando ±inf.
+
+    Entre dois infinitos iguais o resultado é o próprio infinito (np.quantile
+    calcularia inf - inf = nan).
+    """
+    import numpy as np
+
+    ordenados = np.sort(valores)
+    resultado = []
+    for p in probabilidades:
+        posicao = p * (len(ordenados) - 1)
+        inferior = int(posicao)
+        superior = min(inferior + 1, len(ordenados) - 1)
+        a, b = ordenados[inferior], ordenados[superior]
+        resultado.append(float(a if a == b else a + (b - a) * (posicao - inferior)))
+    return resultado
+
+
+def intervalo_bootstrap(antes: Sequence[float], depois: Sequence[float],
+                        estatistica: str = 'mediana', reamostragens: int = 2000,
+                        confianca: float = 0.95, semente=None):
+    """
+    Intervalo de confiança bootstrap da variação relativa
+    `estatistica(depois) / estatistica(antes) - 1`.
+
+    Reamostragens com estatística(antes) = 0 entram como ±inf: uma métrica
+    que sai de 0 tem intervalo [inf, inf] e ainda pode ser uma regressão.
+
+    Args:
+        antes, depois: Amostras dos dois conjuntos
+        estatistica: 'mediana' ou 'media'
+        reamostragens: Número de reamostragens (vetorizadas com NumPy)
+        confianca: Nível de confiança do intervalo
+        semente: Semente do gerador do bootstrap
+
+    Returns:
+        Tupla (variação estimada, limite inferior, limite superior)
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(semente)
+    antes = np.asarray(antes, dtype=float)
+    depois = np.asarray(depois, dtype=float)
+    funcao = np.median if estatistica == 'mediana' else np.mean
+
+    amostras_antes = antes[rng.integers(0, len(antes), size=(reamostragens, len(antes)))]
+    amostras_depois = depois[rng.integers(0, len(depois), size=(reamostragens, len(depois)))]
+    est_antes = funcao(amostras_antes, axis=1)
+    est_depois = funcao(amostras_depois, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variacoes = np.where(est_depois == est_antes, 0.0, est_depois / est_antes - 1)
+
+    # Só descarta o que não tem valor definido (NaN nas amostras)
+    variacoes = variacoes[~np.isnan(variacoes)]
+    estimativa = float(_variacao_relativa(funcao(antes), funcao(depois)))
+    if len(variacoes) == 0:
+        return estimativa, math.nan, math.nan
+    alfa = (1 - confianca) / 2
+    inferior, superior = _quantis(variacoes, [alfa, 1 - alfa])
+    return estimativa, inferior, superior
+
+
+def teste_mann_whitney(antes: Sequence[float], depois: Sequence[float]):
+    """
+    Teste U de Mann–Whitney bilateral, sem SciPy.
+
+    Usa a aproximação normal com correção de empates e de continuidade
+    (adequada a partir de ~8 amostras por grupo).
+
+    Returns:
+        Tupla (U do primeiro grupo, p-valor)
+    """
+    import numpy as np
+
+    antes = np.asarray(antes, dtype=float)
+    depois = np.asarray(depois, dtype=float)
+    n1, n2 = len(antes), len(depois)
+    if n1 == 0 or n2 == 0:
+        return math.nan, math.nan
+
+    combinadas = np.concatenate([antes, depois])
+    ordem = np.argsort(combinadas, kind='mergesort')
+    postos = np.empty(len(combinadas))
+    # Posto médio para valores empatados
+    _, inicio, contagens = np.unique(combinadas[ordem], return_index=True, return_counts=True)
+    postos[ordem] = np.repeat(inicio + (contagens + 1) / 2, contagens)
+
+    u = postos[:n1].sum() - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    media_u = n1 * n2 / 2
+    empates = (contagens ** 3 - contagens).sum() / (n * (n - 1)) if n > 1 else 0.0
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - empates))
+    if sigma == 0:
+        return float(u), 1.0
+    z = (abs(u - media_u) - 0.5) / sigma
+    return float(u), min(math.erfc(max(z, 0.0) / math.sqrt(2)), 1.0)
@@ -0,0 +1,198 @@
+"""
+Executor de experimentos não interativo para as N Rainhas.
+
+Distribui as execuções (algoritmo × execução) em um pool de processos,
+grava cada resultado em JSONL assim que termina e, ao final, imprime a
+comparação entre algoritmos e gera os gráficos sem perguntar nada.
+
+Uso:
+    python experimentos.py --execucoes 100 --workers 8
+    python experimentos.py --algoritmos hc_laterais simulated_annealing -n 16 \\
+        --param simulated_annealing.taxa_resfriamento=0.999 --semente 42
+
+Autor: Matheus Emanuel
+Disciplina: Inteligência Artificial - CEFET-MG
+Data: 2025
+"""
+
+import argparse
+import ast
+import inspect
+import os
+import time
+from typing import Dict, List, Tuple
+
+from aleatoriedade import gerar_sementes
+from benchmark import ALGORITMOS, executar_algoritmo, implementacao
+from eight_queens import comparar_algoritmos, executar_com_cold_cache
+from estatisticas import GravadorResultados, ResumoAlgoritmo
+from medicao import MODOS
+
+
+# Nomes usados na saída e nos gráficos (mesmos de eight_queens.main)
+NOMES_EXIBICAO = {
+    'hc_basico': "Hill Climbing Básico",
+    'hc_laterais': "Hill Climbing com Laterais",
+    'random_restart': "Random-Restart Hill Climbing",
+    'simulated_annealing': "Simulated Annealing",
+    'sa_vetorizado': "Simulated Annealing Vetorizado",
+    'busca_tabu': "Busca Tabu",
+    'algoritmo_genetico': "Algoritmo Genético",
+}
+
+# Executados quando --algoritmos não é informado (os mesmos de eight_queens.main)
+ALGORITMOS_PADRAO = ['hc_basico', 'hc_laterais', 'random_restart', 'simulated_annealing',
+                     'algoritmo_genetico']
+
+
+def _aceita_parametro(nome: str, chave: str) -> bool:
+    return chave in inspect.signature(implementacao(nome)).parameters
+
+
+def interpretar_parametros(pares: List[str], algoritmos: List[str]) -> Dict[str, Dict]:
+    """
+    Converte `--param` em parâmetros por algoritmo.
+
+    Formatos aceitos:
+        chave=valor              → aplicado a todos os algoritmos que aceitam a chave
+        algoritmo.chave=valor    → aplicado só ao algoritmo indicado
+
+    Os valores são lidos como literais Python (números, booleanos, strings).
+    """
+    parametros = {nome: {} for nome in algoritmos}
+    for par in pares:
+        if '=' not in par:
+            raise ValueError(f"Parâmetro inválido (esperado chave=valor): {par!r}")
+        chave, valor = par.split('=', 1)
+        try:
+            valor = ast.literal_eval(valor)
+        except (ValueError, SyntaxError):
+            pass
+
+        if '.' in chave:
+            nome, chave = chave.split('.', 1)
+            if nome not in parametros:
+                raise ValueError(f"Algoritmo desconhecido em --param: {nome!r}")
+            parametros[nome][chave] = valor
+        else:
+            aceitam = [nome for nome in parametros if _aceita_parametro(nome, chave)]
+            if not aceitam:
+                raise ValueError(f"Nenhum algoritmo selecionado aceita o parâmetro {chave!r}")
+            for nome in aceitam:
+                parametros[nome][chave] = valor
+    return parametros
+
+
+def executar_tarefa(tarefa: Tuple) -> Dict:
+    """Executa uma única execução (roda dentro do worker)."""
+    nome, execucao, n, semente, parametros, pausa_cache, modo = tarefa
+    resultado = executar_com_cold_cache(executar_algoritmo, pausa_cache=pausa_cache, modo=modo,
+                                        nome=nome, n=n, semente=semente, **parametros)
+    return {'algoritmo': nome, 'execucao': execucao, 'n': n, 'semente': semente, **resultado}
+
+
+def montar_tarefas(algoritmos: List[str], execucoes: int, n: int, semente,
+                   parametros: Dict[str, Dict], pausa_cache: float,
+                   modo: str = 'padrao') -> List[Tuple]:
+    """Cria as tarefas com uma semente independente por execução."""
+    sementes = gerar_sementes(semente, len(algoritmos) * execucoes)
+    tarefas = []
+    for i, nome in enumerate(algoritmos):
+        for execucao in range(execucoes):
+            tarefas.append((nome, execucao, n, sementes[i * execucoes + execucao],
+                            parametros[nome], pausa_cache, modo))
+    return tarefas
+
+
+def executar_experimento(tarefas: List[Tuple], workers: int, caminho_jsonl: str,
+                         verbose: bool = True, diretorio_colunas: str = None
+                         ) -> Dict[str, ResumoAlgoritmo]:
+    """
+    Executa as tarefas e grava cada resultado em JSONL conforme termina.
+
+    Nenhum resultado fica em memória: cada um é gravado em disco e
+    acumulado no ResumoAlgoritmo do seu algoritmo.
+
+    Returns:
+        Resumos em fluxo indexados pelo nome de exibição do algoritmo
+    """
+    resultados = {}
+    total = len(tarefas)
+
+    with GravadorResultados(caminho_jsonl, diretorio_colunas) as saida:
+
+        def registrar(resultado, concluidas):
+            saida.gravar(resultado)
+            nome = NOMES_EXIBICAO.get(resultado['algoritmo'], resultado['algoritmo'])
+            if nome not in resultados:
+                resultados[nome] = ResumoAlgoritmo(nome)
+            resultados[nome].adicionar(resultado)
+            if verbose:
+                status = "✓" if resultado['sucesso'] else "✗"
+                print(f"[{concluidas}/{total}] {nome} #{resultado['execucao'] + 1}: {status} "
+                      f"({resultado['conflitos']} conflitos, {resultado['tempo']:.6f}s)")
+
+        if workers <= 1:
+            for concluidas, tarefa in enumerate(tarefas, start=1):
+                registrar(executar_tarefa(tarefa), concluidas)
+        else:
+            # Carregado só quando há paralelismo
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futuros = [pool.submit(executar_tarefa, tarefa) for tarefa in tarefas]
+                for concluidas, futuro in enumerate(as_completed(futuros), start=1):
+                    registrar(futuro.result(), concluidas)
+
+    return resultados
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Experimentos em lote para N Rainhas")
+    parser.add_argument('--algoritmos', nargs='+', default=ALGORITMOS_PADRAO,
+                        choices=list(ALGORITMOS), help="Algoritmos a executar")
+    parser.add_argument('--execucoes', type=int, default=10, help="Execuções por algoritmo")
+    parser.add_argument('-n', type=int, default=8, help="Tamanho do tabuleiro")
+    parser.add_argument('--semente', type=int, default=None,
+                        help="Semente mestre (cada execução recebe um fluxo independente)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Processos em paralelo (1 = sem pool)")
+    parser.add_argument('--param', action='append', default=[], metavar='[ALG.]CHAVE=VALOR',
+                        help="Sobrescreve parâmetros dos algoritmos (pode repetir)")
+    parser.add_argument('--pausa-cache', type=float, default=0.0,
+                        help="Pausa em segundos antes de cada execução (padrão: 0)")
+    parser.add_argument('--modo', choices=MODOS, default='padrao',
+                        help="Medição: padrao, frio (processo novo) ou quente (repetições calibradas)")
+    parser.add_argument('--saida', default=os.path.join('..', 'data', 'experimentos.jsonl'),
+                        help="Arquivo JSONL de resultados (acrescenta ao final)")
+    parser.add_argument('--colunas', default=None, metavar='DIRETORIO',
+                        help="Também grava cada métrica numérica em arquivos colunares")
+    parser.add_argument('--sem-graficos', action='store_true', help="Não gera os gráficos")
+    args = parser.parse_args(argv)
+
+    parametros = interpretar_parametros(args.param, args.algoritmos)
+    tarefas = montar_tarefas(args.algoritmos, args.execucoes, args.n, args.semente,
+                             parametros, args.pausa_cache, args.modo)
+
+    diretorio = os.path.dirname(args.saida)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+
+    print("\n" + "="*70)
+    print(f"EXPERIMENTO: {len(tarefas)} execuções (n={args.n}, workers={args.workers})")
+    print("="*70)
+
+    inicio = time.time()
+    resultados = executar_experimento(tarefas, args.workers, args.saida,
+                                      diretorio_colunas=args.colunas)
+    print(f"\n✅ {len(tarefas)} execuções em {time.time() - inicio:.2f}s → {args.saida}")
+
+    comparar_algoritmos(resultados)
+
+    if not args.sem_graficos:
+        from visualizacao import gerar_graficos
+        gerar_graficos(resultados)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,29 +7,37 @@ Disciplina: Inteligência Artificial - CEFET-MG
 Data: 2025
 """
 
-import random
 import time
 import math
-from typing import List, Tuple, Dict
+from array import array
+from typing import Callable, List, Optional, Tuple, Dict, Union
+
+from aleatoriedade import obter_rng
+from orcamento import Orcamento
+from resfriamento import EsquemaResfriamento, resolver_esquema
+from tabuleiro import MelhorEstado, tabuleiro_aleatorio
 
 
 # ============================================================================
 # FUNÇÕES BÁSICAS - REPRESENTAÇÃO E AVALIAÇÃO
 # ============================================================================
 
-def gerar_estado_aleatorio(n: int = 8) -> List[int]:
+def gerar_estado_aleatorio(n: int = 8, semente=None) -> List[int]:
     """
     Gera um estado inicial aleatório para o problema das N rainhas.
     
     Args:
         n: Tamanho do tabuleiro (padrão: 8)
+        semente: None, int, random.Random ou numpy.random.Generator
+                 (ver `aleatoriedade.obter_rng`)
     
     Returns:
         Lista representando posições das rainhas.
         Exemplo: [3, 5, 7, 1, 4, 6, 0, 2]
         Índice = coluna, Valor = linha da rainha
     """
-    return [random.randint(0, n - 1) for _ in range(n)]
+    rng = obter_rng(semente)
+    return [rng.randint(0, n - 1) for _ in range(n)]
 
 
 def calcular_conflitos(estado: List[int]) -> int:
@@ -156,18 +164,47 @@ def imprimir_tabuleiro(estado: List[int], titulo: str = "Tabuleiro"):
     print(f"Conflitos: {conflitos}")
 
 
+# ============================================================================
+# ORÇAMENTO (EXECUÇÃO ANYTIME)
+# ============================================================================
+
+def _iniciar_orcamento(orcamento: Optional[Orcamento], conflitos: int, avaliacoes: int,
+                       estado: Callable[[], List[int]]) -> int:
+    """Começa o orçamento (se houver), registra o estado inicial e devolve o alvo."""
+    if orcamento is None:
+        return 0
+    orcamento.iniciar()
+    orcamento.melhorou(conflitos, avaliacoes, estado)
+    return orcamento.conflitos_alvo
+
+
+def _encerrar_orcamento(orcamento: Optional[Orcamento], resultado: Dict) -> Dict:
+    """Fecha o orçamento e anota no resultado por que a execução parou."""
+    if orcamento is not None:
+        orcamento.encerrar()
+        resultado['parada'] = orcamento.motivo
+    return resultado
+
+
 # ============================================================================
 # ALGORITMO 1: HILL CLIMBING BÁSICO
 # ============================================================================
 
-def hill_climbing_basico(max_iteracoes: int = 1000, verbose: bool = False) -> Dict:
+def hill_climbing_basico(max_iteracoes: int = 1000, verbose: bool = False,
+                         n: int = 8, semente=None, representacao: str = 'linhas',
+                         orcamento: Orcamento = None) -> Dict:
 
-    # Estado inicial aleatório
-    estado_atual = gerar_estado_aleatorio()
-    conflitos_atual = calcular_conflitos(estado_atual)
+    # Estado inicial aleatório (tabuleiro compacto com contadores incrementais).
+    # representacao='permutacao': uma rainha por linha e coluna, vizinhos por troca
+    estado_atual = tabuleiro_aleatorio(representacao, n, obter_rng(semente))
+    conflitos_atual = estado_atual.conflitos
     
-    tempo_inicio = time.time()
+    tempo_inicio = time.perf_counter()
     iteracoes = 0
+    avaliacoes = 1
+    # Sem orçamento o alvo é 0 conflitos e só max_iteracoes limita a execução
+    alvo = _iniciar_orcamento(orcamento, conflitos_atual, avaliacoes, estado_atual.para_lista)
+    interromper = orcamento.interromper if orcamento is not None else None
     
     if verbose:
         print("\n" + "="*60)
@@ -176,14 +213,18 @@ def hill_climbing_basico(max_iteracoes: int = 1000, verbose: bool = False) -> Di
         imprimir_tabuleiro(estado_atual, "Estado Inicial")
     
     # Loop principal
-    while conflitos_atual > 0 and iteracoes < max_iteracoes:
+    while conflitos_atual > alvo and iteracoes < max_iteracoes:
+        if orcamento is not None and orcamento.esgotado(avaliacoes):
+            break
         iteracoes += 1
         
-        # Gera todos os vizinhos
-        vizinhos = gerar_vizinhos(estado_atual)
-        
-        # Encontra o melhor vizinho
-        melhor_vizinho, melhor_conflitos = encontrar_melhor_vizinho(vizinhos)
+        # Avalia todos os vizinhos por delta (mesma ordem de gerar_vizinhos)
+        delta, coluna, nova_linha = estado_atual.melhor_movimento(interromper)
+        if coluna < 0:
+            # Prazo ou cancelamento no meio da varredura
+            break
+        melhor_conflitos = conflitos_atual + delta
+        avaliacoes += estado_atual.num_vizinhos
         
         # Se o melhor vizinho NÃO é melhor que o atual, PARA!
         if melhor_conflitos >= conflitos_atual:
@@ -193,13 +234,15 @@ def hill_climbing_basico(max_iteracoes: int = 1000, verbose: bool = False) -> Di
             break
         
         # Move para o melhor vizinho
-        estado_atual = melhor_vizinho
+        estado_atual.mover(coluna, nova_linha, delta)
         conflitos_atual = melhor_conflitos
+        if orcamento is not None:
+            orcamento.melhorou(conflitos_atual, avaliacoes, estado_atual.para_lista)
         
         if verbose and iteracoes % 10 == 0:
             print(f"Iteração {iteracoes}: Conflitos = {conflitos_atual}")
     
-    tempo_total = time.time() - tempo_inicio
+    tempo_total = time.perf_counter() - tempo_inicio
     sucesso = (conflitos_atual == 0)
     
     if verbose:
@@ -208,13 +251,14 @@ def hill_climbing_basico(max_iteracoes: int = 1000, verbose: bool = False) -> Di
         print(f"Iterações: {iteracoes}")
         print(f"Tempo: {tempo_total:.6f} segundos")
     
-    return {
-        'estado_final': estado_atual,
+    return _encerrar_orcamento(orcamento, {
+        'estado_final': estado_atual.para_lista(),
         'conflitos': conflitos_atual,
         'iteracoes': iteracoes,
+        'avaliacoes': avaliacoes,
         'tempo': tempo_total,
         'sucesso': sucesso
-    }
+    })
 
 
 # ============================================================================
@@ -223,14 +267,21 @@ def hill_climbing_basico(max_iteracoes: int = 1000, verbose: bool = False) -> Di
 
 def hill_climbing_com_laterais(max_iteracoes: int = 1000, 
                                 max_laterais: int = 100,
-                                verbose: bool = False) -> Dict:
+                                verbose: bool = False,
+                                n: int = 8,
+                                semente=None,
+                                representacao: str = 'linhas',
+                                orcamento: Orcamento = None) -> Dict:
    
-    estado_atual = gerar_estado_aleatorio()
-    conflitos_atual = calcular_conflitos(estado_atual)
+    estado_atual = tabuleiro_aleatorio(representacao, n, obter_rng(semente))
+    conflitos_atual = estado_atual.conflitos
     
-    tempo_inicio = time.time()
+    tempo_inicio = time.perf_counter()
     iteracoes = 0
+    avaliacoes = 1
     laterais_consecutivos = 0
+    alvo = _iniciar_orcamento(orcamento, conflitos_atual, avaliacoes, estado_atual.para_lista)
+    interromper = orcamento.interromper if orcamento is not None else None
     
     if verbose:
         print("\n" + "="*60)
@@ -238,11 +289,16 @@ def hill_climbing_com_laterais(max_iteracoes: int = 1000,
         print("="*60)
         imprimir_tabuleiro(estado_atual, "Estado Inicial")
     
-    while conflitos_atual > 0 and iteracoes < max_iteracoes:
+    while conflitos_atual > alvo and iteracoes < max_iteracoes:
+        if orcamento is not None and orcamento.esgotado(avaliacoes):
+            break
         iteracoes += 1
         
-        vizinhos = gerar_vizinhos(estado_atual)
-        melhor_vizinho, melhor_conflitos = encontrar_melhor_vizinho(vizinhos)
+        delta, coluna, nova_linha = estado_atual.melhor_movimento(interromper)
+        if coluna < 0:
+            break
+        melhor_conflitos = conflitos_atual + delta
+        avaliacoes += estado_atual.num_vizinhos
         
         # DIFERENÇA: Aceita se melhor OU IGUAL (movimento lateral)
         if melhor_conflitos > conflitos_atual:
@@ -270,10 +326,12 @@ def hill_climbing_com_laterais(max_iteracoes: int = 1000,
             if verbose and iteracoes % 10 == 0:
                 print(f"Iteração {iteracoes}: Conflitos = {conflitos_atual} → {melhor_conflitos}")
         
-        estado_atual = melhor_vizinho
+        estado_atual.mover(coluna, nova_linha, delta)
         conflitos_atual = melhor_conflitos
+        if orcamento is not None:
+            orcamento.melhorou(conflitos_atual, avaliacoes, estado_atual.para_lista)
     
-    tempo_total = time.time() - tempo_inicio
+    tempo_total = time.perf_counter() - tempo_inicio
     sucesso = (conflitos_atual == 0)
     
     if verbose:
@@ -283,14 +341,15 @@ def hill_climbing_com_laterais(max_iteracoes: int = 1000,
         print(f"Movimentos laterais: {laterais_consecutivos}")
         print(f"Tempo: {tempo_total:.6f} segundos")
     
-    return {
-        'estado_final': estado_atual,
+    return _encerrar_orcamento(orcamento, {
+        'estado_final': estado_atual.para_lista(),
         'conflitos': conflitos_atual,
         'iteracoes': iteracoes,
         'laterais': laterais_consecutivos,
+        'avaliacoes': avaliacoes,
         'tempo': tempo_total,
         'sucesso': sucesso
-    }
+    })
 
 
 # ============================================================================
@@ -300,14 +359,26 @@ def hill_climbing_com_laterais(max_iteracoes: int = 1000,
 def random_restart_hill_climbing(max_reinicio: int = 100,
                                   usar_laterais: bool = True,
                                   max_laterais: int = 100,
-                                  verbose: bool = False) -> Dict:
+                                  verbose: bool = False,
+                                  n: int = 8,
+                                  semente=None,
+                                  representacao: str = 'linhas',
+                                  orcamento: Orcamento = None) -> Dict:
 
-    tempo_inicio = time.time()
+    # Um único fluxo aleatório alimenta todas as tentativas
+    rng = obter_rng(semente)
+    tempo_inicio = time.perf_counter()
     
     melhor_estado = None
     melhor_conflitos = float('inf')
     iteracoes_total = 0
+    avaliacoes = 0
     tentativa = 0
+    # As tentativas recebem o mesmo orçamento: tempo e avaliações são globais
+    alvo = 0
+    if orcamento is not None:
+        orcamento.iniciar()
+        alvo = orcamento.conflitos_alvo
     
     if verbose:
         print("\n" + "="*60)
@@ -320,6 +391,11 @@ def random_restart_hill_climbing(max_reinicio: int = 100,
     
     # Loop de reinícios
     while tentativa <= max_reinicio:
+        if orcamento is not None:
+            orcamento.avaliacoes_anteriores = avaliacoes
+            # A primeira tentativa sempre roda, para haver um estado a devolver
+            if tentativa > 0 and orcamento.esgotado(0):
+                break
         tentativa += 1
         
         if verbose:
@@ -330,15 +406,24 @@ def random_restart_hill_climbing(max_reinicio: int = 100,
             resultado = hill_climbing_com_laterais(
                 max_iteracoes=1000,
                 max_laterais=max_laterais,
-                verbose=False  # Não imprime cada tentativa
+                verbose=False,  # Não imprime cada tentativa
+                n=n,
+                semente=rng,
+                representacao=representacao,
+                orcamento=orcamento
             )
         else:
             resultado = hill_climbing_basico(
                 max_iteracoes=1000,
-                verbose=False
+                verbose=False,
+                n=n,
+                semente=rng,
+                representacao=representacao,
+                orcamento=orcamento
             )
         
         iteracoes_total += resultado['iteracoes']
+        avaliacoes += resultado['avaliacoes']
         
         if verbose:
             print(f"Conflitos: {resultado['conflitos']}")
@@ -351,13 +436,13 @@ def random_restart_hill_climbing(max_reinicio: int = 100,
             if verbose:
                 print(f"Novo melhor: {melhor_conflitos} conflitos")
         
-        # Encontrou solução?
-        if resultado['sucesso']:
-            if verbose:
+        # Encontrou solução (ou chegou ao alvo do orçamento)?
+        if resultado['conflitos'] <= alvo:
+            if verbose and resultado['sucesso']:
                 print(f"\n✓ SOLUÇÃO ENCONTRADA na tentativa {tentativa}!")
             break
     
-    tempo_total = time.time() - tempo_inicio
+    tempo_total = time.perf_counter() - tempo_inicio
     sucesso = (melhor_conflitos == 0)
     
     if verbose:
@@ -370,14 +455,17 @@ def random_restart_hill_climbing(max_reinicio: int = 100,
         print(f"Iterações totais: {iteracoes_total}")
         print(f"Tempo total: {tempo_total:.6f} segundos")
     
-    return {
+    if orcamento is not None:
+        orcamento.avaliacoes_anteriores = 0
+    return _encerrar_orcamento(orcamento, {
         'estado_final': melhor_estado,
         'conflitos': melhor_conflitos,
         'reinicio': tentativa,
         'iteracoes_total': iteracoes_total,
+        'avaliacoes': avaliacoes,
         'tempo': tempo_total,
         'sucesso': sucesso
-    }
+    })
 
 
 # ============================================================================
@@ -387,47 +475,64 @@ def random_restart_hill_climbing(max_reinicio: int = 100,
 def simulated_annealing(temperatura_inicial: float = 2000.0,
                        taxa_resfriamento: float = 0.995,
                        max_iteracoes: int = 100000,
-                       verbose: bool = False) -> Dict:
+                       verbose: bool = False,
+                       esquema_resfriamento: Union[str, EsquemaResfriamento] = 'geometrico',
+                       temperatura_minima: float = 0.01,
+                       n: int = 8,
+                       semente=None,
+                       representacao: str = 'linhas',
+                       orcamento: Orcamento = None) -> Dict:
+    
+    # Esquema de resfriamento (por nome ou objeto; padrão: geométrico com α)
+    esquema = resolver_esquema(esquema_resfriamento, taxa_resfriamento, temperatura_minima)
+    
+    rng = obter_rng(semente)
     
     # Estado inicial
-    estado_atual = gerar_estado_aleatorio()
-    conflitos_atual = calcular_conflitos(estado_atual)
+    estado_atual = tabuleiro_aleatorio(representacao, n, rng)
+    conflitos_atual = estado_atual.conflitos
     
-    # Melhor solução encontrada até agora
-    melhor_estado = estado_atual.copy()
+    # Melhor solução encontrada até agora (por log de movimentos, sem cópias)
+    melhor = MelhorEstado(estado_atual)
     melhor_conflitos = conflitos_atual
     
-    temperatura = temperatura_inicial
-    tempo_inicio = time.time()
+    temperatura = esquema.iniciar(temperatura_inicial)
+    tempo_inicio = time.perf_counter()
     iteracoes = 0
+    avaliacoes = 1
     movimentos_ruins_aceitos = 0
+    alvo = _iniciar_orcamento(orcamento, conflitos_atual, avaliacoes, melhor.estado)
     
     if verbose:
         print("\n" + "="*60)
         print("SIMULATED ANNEALING (TÊMPERA SIMULADA)")
         print("="*60)
         print(f"Temperatura inicial: {temperatura_inicial}")
-        print(f"Taxa de resfriamento: {taxa_resfriamento}")
+        print(f"Esquema de resfriamento: {esquema!r}")
         print(f"Max iterações: {max_iteracoes}")
         imprimir_tabuleiro(estado_atual, "Estado Inicial")
     
     # Loop principal
-    while conflitos_atual > 0 and iteracoes < max_iteracoes and temperatura > 0.01:
+    while conflitos_atual > alvo and iteracoes < max_iteracoes and not esquema.terminou(temperatura):
+        if orcamento is not None and orcamento.esgotado(avaliacoes):
+            break
         iteracoes += 1
+        aceito = True
+        melhorou = False
         
-        # Gera um vizinho ALEATÓRIO (não o melhor!)
-        # Isso é diferente do Hill Climbing que sempre escolhe o melhor
-        vizinhos = gerar_vizinhos(estado_atual)
-        vizinho = random.choice(vizinhos)
-        conflitos_vizinho = calcular_conflitos(vizinho)
+        # Sorteia um vizinho ALEATÓRIO (não o melhor!)
+        # Isso é diferente do Hill Climbing que sempre escolhe o melhor.
+        coluna, nova_linha = estado_atual.movimento_aleatorio(rng)
         
-        # Calcula diferença de energia (Delta E)
-        delta_e = conflitos_vizinho - conflitos_atual
+        # Calcula diferença de energia (Delta E) em O(1)
+        delta_e = estado_atual.delta(coluna, nova_linha)
+        conflitos_vizinho = conflitos_atual + delta_e
+        avaliacoes += 1
         
         # Decide se aceita o movimento
         if delta_e < 0:
             # Melhoria: SEMPRE aceita
-            estado_atual = vizinho
+            estado_atual.mover(coluna, nova_linha, delta_e)
             conflitos_atual = conflitos_vizinho
             
             if verbose and iteracoes % 100 == 0:
@@ -435,39 +540,47 @@ def simulated_annealing(temperatura_inicial: float = 2000.0,
         
         elif delta_e == 0:
             # Lateral: sempre aceita (como Hill Climbing com laterais)
-            estado_atual = vizinho
+            estado_atual.mover(coluna, nova_linha, delta_e)
             conflitos_atual = conflitos_vizinho
         
         else:
             # Piora: aceita com probabilidade P = e^(-ΔE/T)
             probabilidade = math.exp(-delta_e / temperatura)
             
-            if random.random() < probabilidade:
+            if rng.random() < probabilidade:
                 # ACEITA A PIORA! (isso é o diferencial)
-                estado_atual = vizinho
+                estado_atual.mover(coluna, nova_linha, delta_e)
                 conflitos_atual = conflitos_vizinho
                 movimentos_ruins_aceitos += 1
                 
                 if verbose and iteracoes % 500 == 0:
                     print(f"Iter {iteracoes}: Piora aceita! {conflitos_atual - delta_e} → {conflitos_atual} "
                           f"(P={probabilidade:.2%}, T={temperatura:.2f})")
+            else:
+                aceito = False
         
         # Atualiza melhor solução encontrada
         if conflitos_atual < melhor_conflitos:
-            melhor_estado = estado_atual.copy()
+            melhor.registrar()
             melhor_conflitos = conflitos_atual
+            melhorou = True
+            if orcamento is not None:
+                orcamento.melhorou(melhor_conflitos, avaliacoes, melhor.estado)
             
             if verbose:
                 print(f"\nIter {iteracoes}: 🎯 Novo melhor! {melhor_conflitos} conflitos (T={temperatura:.2f})")
+        else:
+            melhor.observar()
         
-        # Resfria a temperatura
-        temperatura *= taxa_resfriamento
+        # Resfria a temperatura segundo o esquema escolhido
+        temperatura = esquema.atualizar(temperatura, iteracoes, float(aceito), melhorou)
         
         # Log periódico
         if verbose and iteracoes % 1000 == 0:
             print(f"\nIter {iteracoes}: Conflitos={conflitos_atual}, Melhor={melhor_conflitos}, T={temperatura:.2f}")
     
-    tempo_total = time.time() - tempo_inicio
+    melhor_estado = melhor.encerrar()
+    tempo_total = time.perf_counter() - tempo_inicio
     sucesso = (melhor_conflitos == 0)
     
     if verbose:
@@ -478,16 +591,129 @@ def simulated_annealing(temperatura_inicial: float = 2000.0,
         print(f"\nStatus: {'SUCESSO! ✓' if sucesso else 'FALHA'}")
         print(f"Iterações: {iteracoes}")
         print(f"Movimentos ruins aceitos: {movimentos_ruins_aceitos}")
-        print(f"Taxa de aceitação de pioras: {movimentos_ruins_aceitos/iteracoes*100:.1f}%")
+        print(f"Taxa de aceitação de pioras: {movimentos_ruins_aceitos/max(iteracoes, 1)*100:.1f}%")
         print(f"Temperatura final: {temperatura:.4f}")
         print(f"Tempo total: {tempo_total:.6f} segundos")
     
-    return {
+    return _encerrar_orcamento(orcamento, {
         'estado_final': melhor_estado,
         'conflitos': melhor_conflitos,
         'iteracoes': iteracoes,
         'movimentos_ruins_aceitos': movimentos_ruins_aceitos,
         'temperatura_final': temperatura,
+        'avaliacoes': avaliacoes,
+        'tempo': tempo_total,
+        'sucesso': sucesso
+    })
+
+# ============================================================================
+# ALGORITMO 5: BUSCA TABU
+# ============================================================================
+
+def busca_tabu(max_iteracoes: int = 10000,
+               duracao_tabu: int = None,
+               verbose: bool = False,
+               n: int = 8,
+               semente=None,
+               representacao: str = 'linhas',
+               orcamento: Orcamento = None) -> Dict:
+    
+    # Memória de curto prazo: depois de tirar a rainha da coluna c da linha r,
+    # voltar para (c, r) fica proibido por `duracao_tabu` iterações. As
+    # expirações ficam em um array plano n*n (índice c*n + r), então testar
+    # se um movimento é tabu (ou se cumpre a aspiração) custa O(1). Na
+    # representação por permutação a troca (i, j) proíbe a volta das duas rainhas.
+    # Padrão: 5 iterações para n pequeno (com 2 a busca entra em ciclos no
+    # 8x8) e n/8 para tabuleiros grandes
+    if duracao_tabu is None:
+        duracao_tabu = max(5, n // 8)
+    
+    rng = obter_rng(semente)
+    
+    estado_atual = tabuleiro_aleatorio(representacao, n, rng)
+    conflitos_atual = estado_atual.conflitos
+    expiracao = array('I', bytes(4 * n * n))
+    
+    # Melhor solução encontrada até agora (por log de movimentos, sem cópias)
+    melhor = MelhorEstado(estado_atual)
+    melhor_conflitos = conflitos_atual
+    
+    tempo_inicio = time.perf_counter()
+    iteracoes = 0
+    avaliacoes = 1
+    aspiracoes = 0
+    alvo = _iniciar_orcamento(orcamento, conflitos_atual, avaliacoes, melhor.estado)
+    interromper = orcamento.interromper if orcamento is not None else None
+    
+    if verbose:
+        print("\n" + "="*60)
+        print("BUSCA TABU")
+        print("="*60)
+        print(f"Duração tabu: {duracao_tabu} iterações")
+        print(f"Max iterações: {max_iteracoes}")
+        imprimir_tabuleiro(estado_atual, "Estado Inicial")
+    
+    while melhor_conflitos > alvo and iteracoes < max_iteracoes:
+        if orcamento is not None and orcamento.esgotado(avaliacoes):
+            break
+        iteracoes += 1
+        
+        # Melhor vizinho não tabu (ou tabu que supera o melhor já visto),
+        # mesmo que seja pior que o atual: é isso que tira a busca de
+        # máximos locais e platôs sem reinícios
+        delta, coluna, nova_linha = estado_atual.melhor_movimento_permitido(
+            expiracao, iteracoes, melhor_conflitos - conflitos_atual, rng, interromper)
+        if coluna < 0 and interromper is not None and orcamento.motivo is not None:
+            # Prazo ou cancelamento no meio da varredura
+            break
+        avaliacoes += estado_atual.num_vizinhos
+        if coluna < 0:
+            # Todos os movimentos são tabu: espera a próxima expiração
+            continue
+        if estado_atual.e_tabu(expiracao, iteracoes, coluna, nova_linha):
+            aspiracoes += 1
+        
+        estado_atual.proibir_desfazer(expiracao, coluna, nova_linha, iteracoes + duracao_tabu)
+        estado_atual.mover(coluna, nova_linha, delta)
+        conflitos_atual += delta
+        
+        # Atualiza melhor solução encontrada
+        if conflitos_atual < melhor_conflitos:
+            melhor.registrar()
+            melhor_conflitos = conflitos_atual
+            if orcamento is not None:
+                orcamento.melhorou(melhor_conflitos, avaliacoes, melhor.estado)
+            
+            if verbose:
+                print(f"Iter {iteracoes}: 🎯 Novo melhor! {melhor_conflitos} conflitos")
+        else:
+            melhor.observar()
+        
+        # Log periódico
+        if verbose and iteracoes % 1000 == 0:
+            print(f"\nIter {iteracoes}: Conflitos={conflitos_atual}, Melhor={melhor_conflitos}")
+    
+    melhor_estado = melhor.encerrar()
+    tempo_total = time.perf_counter() - tempo_inicio
+    sucesso = (melhor_conflitos == 0)
+    
+    if verbose:
+        print("\n" + "="*60)
+        print("RESULTADO FINAL")
+        print("="*60)
+        imprimir_tabuleiro(melhor_estado, "Melhor Solução Encontrada")
+        print(f"\nStatus: {'SUCESSO! ✓' if sucesso else 'FALHA'}")
+        print(f"Iterações: {iteracoes}")
+        print(f"Aspirações: {aspiracoes}")
+        print(f"Tempo total: {tempo_total:.6f} segundos")
+    
+    return _encerrar_orcamento(orcamento, {
+        'estado_final': melhor_estado,
+        'conflitos': melhor_conflitos,
+        'iteracoes': iteracoes,
+        'aspiracoes': aspiracoes,
+        'duracao_tabu': duracao_tabu,
+        'avaliacoes': avaliacoes,
         'tempo': tempo_total,
         'sucesso': sucesso
-    }
\ No newline at end of file
+    })
@@ -0,0 +1,229 @@
+"""
+Medição de tempo com semântica explícita de cache frio e quente.
+
+`clear_cache` (três `gc.collect()` e o trim de working set do Windows) não
+esvazia nada no Linux, e uma única chamada cronometrada com `time.time()`
+fica dominada pela resolução do relógio e pelo ruído. Este módulo oferece
+dois modos de medição:
+
+- **frio**: cada execução roda em um interpretador novo (multiprocessing
+  com `spawn`), sem módulos, caches de CPU ou alocador aquecidos. Antes de
+  criar o processo, o cache de páginas do sistema é descartado quando há
+  permissão (escrita em /proc/sys/vm/drop_caches ou `sudo -n sysctl`).
+- **quente**: chamadas de aquecimento, calibração automática do número de
+  repetições por amostra (como `timeit.autorange`) para cargas abaixo de
+  1 ms, `time.perf_counter` com o GC desligado e resumo robusto (mediana,
+  IQR e descarte de outliers pelas cercas de Tukey).
+
+Contraparte: Trabalho01/src/benchmarking.py.
+
+Autor: Matheus Emanuel
+Disciplina: Inteligência Artificial - CEFET-MG
+Data: 2025
+"""
+
+import gc
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+
+MODOS = ('padrao', 'frio', 'quente')
+
+_CAMINHO_DROP_CACHES = '/proc/sys/vm/drop_caches'
+
+# None = ainda não testado; depois guarda se o descarte é permitido
+_descarte_permitido = None
+
+
+_TAMANHO_PAGINA = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def memoria_processo() -> int:
+    """
+    RSS do processo em bytes.
+
+    No Linux lê /proc/self/statm direto; o psutil (dezenas de ms só para
+    importar) é carregado apenas nos outros sistemas.
+    """
+    try:
+        with open('/proc/self/statm', 'rb') as arquivo:
+            return int(arquivo.read().split()[1]) * _TAMANHO_PAGINA
+    except OSError:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss
+
+
+# ============================================================================
+# CACHE FRIO
+# ============================================================================
+
+def limpar_cache_paginas() -> bool:
+    """
+    Descarta o cache de páginas do kernel (Linux), se houver permissão.
+
+    Tenta escrever em /proc/sys/vm/drop_caches (root) e, senão, usa
+    `sudo -n sysctl` (só funciona se o sudo não pedir senha). Depois da
+    primeira falha não tenta de novo.
+
+    Returns:
+        True se o cache foi descartado
+    """
+    global _descarte_permitido
+    if _descarte_permitido is False or not sys.platform.startswith('linux'):
+        return False
+
+    os.sync()
+    try:
+        with open(_CAMINHO_DROP_CACHES, 'w') as arquivo:
+            arquivo.write('3\n')
+        _descarte_permitido = True
+        return True
+    except OSError:
+        pass
+
+    import shutil
+    import subprocess
+    if shutil.which('sudo') and shutil.which('sysctl'):
+        retorno = subprocess.run(['sudo', '-n', 'sysctl', '-q', 'vm.drop_caches=3'],
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if retorno.returncode == 0:
+            _descarte_permitido = True
+            return True
+
+    _descarte_permitido = False
+    return False
+
+
+def _executar_cronometrado(funcao: Callable, kwargs: Dict) -> Tuple[Dict, float, int]:
+    # Roda dentro do processo novo
+    gc.collect()
+    memoria_antes = memoria_processo()
+    inicio = time.perf_counter()
+    resultado = funcao(**kwargs)
+    tempo = time.perf_counter() - inicio
+    return resultado, tempo, memoria_processo() - memoria_antes
+
+
+def executar_em_processo_novo(funcao: Callable, limpar_paginas: bool = True,
+                              **kwargs) -> Dict:
+    """
+    Executa `funcao(**kwargs)` em um interpretador recém-criado.
+
+    Args:
+        funcao: Função de nível de módulo (precisa ser serializável)
+        limpar_paginas: Descarta o cache de páginas antes, se permitido
+        **kwargs: Argumentos da função
+
+    Returns:
+        Resultado da função com 'tempo' (perf_counter no processo filho) e
+        'memoria_usada' medidos em volta da chamada
+    """
+    if limpar_paginas:
+        limpar_cache_paginas()
+    # Carregados só no modo frio
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    contexto = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=contexto) as pool:
+        resultado, tempo, memoria = pool.submit(_executar_cronometrado, funcao, kwargs).result()
+    resultado['tempo'] = tempo
+    resultado['memoria_usada'] = memoria
+    return resultado
+
+
+# ============================================================================
+# CACHE QUENTE
+# ============================================================================
+
+def _cronometrar(funcao: Callable, kwargs: Dict, repeticoes: int) -> Tuple[Dict, float]:
+    gc_ativo = gc.isenabled()
+    gc.disable()
+    try:
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            resultado = funcao(**kwargs)
+        tempo = time.perf_counter() - inicio
+    finally:
+        if gc_ativo:
+            gc.enable()
+    return resultado, tempo
+
+
+def calibrar_repeticoes(funcao: Callable, kwargs: Dict, tempo_minimo: float = 0.01) -> int:
+    """
+    Menor número de chamadas (1, 2, 5, 10, 20, 50, ...) cujo tempo total
+    passa de `tempo_minimo` segundos, como `timeit.Timer.autorange`.
+    """
+    base = 1
+    while True:
+        for fator in (1, 2, 5):
+            repeticoes = base * fator
+            _, tempo = _cronometrar(funcao, kwargs, repeticoes)
+            if tempo >= tempo_minimo:
+                return repeticoes
+        base *= 10
+
+
+def medir_quente(funcao: Callable, aquecimento: int = 3, amostras: int = 10,
+                 tempo_minimo: float = 0.01, **kwargs) -> Tuple[Dict, List[float], int]:
+    """
+    Mede `funcao(**kwargs)` com cache quente.
+
+    Args:
+        funcao: Função a medir
+        aquecimento: Chamadas descartadas antes da medição
+        amostras: Número de amostras cronometradas
+        tempo_minimo: Duração mínima de cada amostra (define as repetições)
+        **kwargs: Argumentos da função (use uma semente fixa para que todas
+            as chamadas façam o mesmo trabalho)
+
+    Returns:
+        Tupla (último resultado, tempos por chamada de cada amostra, repetições)
+    """
+    for _ in range(aquecimento):
+        funcao(**kwargs)
+    repeticoes = calibrar_repeticoes(funcao, kwargs, tempo_minimo)
+
+    tempos = []
+    resultado = None
+    for _ in range(amostras):
+        resultado, tempo = _cronometrar(funcao, kwargs, repeticoes)
+        tempos.append(tempo / repeticoes)
+    return resultado, tempos, repeticoes
+
+
+def _quantil(ordenados: List[float], p: float) -> float:
+    posicao = p * (len(ordenados) - 1)
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicao - inferior)
+
+
+def resumo_robusto(amostras: List[float], k: float = 1.5) -> Dict:
+    """
+    Mediana e IQR após descartar outliers pelas cercas de Tukey
+    ([Q1 - k·IQR, Q3 + k·IQR]).
+
+    Returns:
+        Dicionário com mediana, q1, q3, iqr, media (sem outliers),
+        minimo, maximo, validas e outliers
+    """
+    ordenados = sorted(amostras)
+    q1, q3 = _quantil(ordenados, 0.25), _quantil(ordenados, 0.75)
+    iqr = q3 - q1
+    validas = [t for t in ordenados if q1 - k * iqr <= t <= q3 + k * iqr]
+
+    q1, q3 = _quantil(validas, 0.25), _quantil(validas, 0.75)
+    return {
+        'mediana': _quantil(validas, 0.5),
+        'q1': q1,
+        'q3': q3,
+        'iqr': q3 - q1,
+        'media': sum(validas) / len(validas),
+        'minimo': validas[0],
+        'maximo': validas[-1],
+        'validas': len(validas),
+        'outliers': len(ordenados) - len(validas)
+    }
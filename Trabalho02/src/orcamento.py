@@ -0,0 +1,239 @@
+"""
+Execução "anytime" dos algoritmos de busca local.
+
+Um `Orcamento` limita uma execução por tempo de parede, por número de
+avaliações, por um alvo de conflitos ou por um token de cancelamento, e
+avisa o chamador a cada melhora do melhor estado. Qualquer algoritmo de
+`hill_climbing.py` aceita `orcamento=`. Quando o orçamento acaba, ele para na
+hora e devolve o melhor tabuleiro encontrado até ali, então o tempo de
+resposta fica limitado mesmo quando não há solução.
+
+Exemplo:
+    orcamento = Orcamento(tempo_limite=0.05, ao_melhorar=print)
+    resultado = simulated_annealing(n=64, orcamento=orcamento)
+    resultado['parada']   # 'tempo', 'avaliacoes', 'cancelado' ou None
+
+    for melhoria in melhorias(busca_tabu, Orcamento(tempo_limite=1.0), n=256):
+        if melhoria.conflitos <= 2:
+            break            # encerra a busca (cancela o token)
+
+Autor: Matheus Emanuel
+Disciplina: Inteligência Artificial - CEFET-MG
+Data: 2025
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Iterator, List, NamedTuple, Optional
+
+
+class Melhoria(NamedTuple):
+    """Novo melhor estado encontrado durante a execução."""
+    estado: List[int]
+    conflitos: int
+    avaliacoes: int
+    tempo: float
+
+
+# ============================================================================
+# CANCELAMENTO
+# ============================================================================
+
+class TokenCancelamento:
+    """
+    Sinal de cancelamento que pode ser disparado de outra thread.
+
+    Um mesmo token pode ser compartilhado por várias execuções (ex.: todas as
+    tarefas de um lote); `cancelar()` interrompe todas na próxima iteração.
+    Um token com `pai` também fica cancelado quando o pai é cancelado, sem
+    que cancelar o filho afete o pai.
+    """
+
+    __slots__ = ('_evento', 'pai')
+
+    def __init__(self, pai: Optional['TokenCancelamento'] = None):
+        self._evento = threading.Event()
+        self.pai = pai
+
+    def cancelar(self):
+        self._evento.set()
+
+    @property
+    def cancelado(self) -> bool:
+        return self._evento.is_set() or (self.pai is not None and self.pai.cancelado)
+
+
+# ============================================================================
+# ORÇAMENTO
+# ============================================================================
+
+class Orcamento:
+    """
+    Limites de uma execução anytime.
+
+    Os limites se somam aos critérios próprios de cada algoritmo
+    (`max_iteracoes`, temperatura mínima, ...): a execução para no que vier
+    primeiro. O tempo é contado a partir do início do algoritmo, e as
+    avaliações são verificadas antes de cada iteração. Por isso o Hill Climbing
+    pode passar do limite em no máximo uma vizinhança.
+
+    Um orçamento pode ser reutilizado em execuções seguidas, mas não em
+    execuções simultâneas; o Random-Restart repassa o seu às tentativas, que
+    consomem o mesmo tempo e as mesmas avaliações.
+    """
+
+    def __init__(self, tempo_limite: Optional[float] = None,
+                 max_avaliacoes: Optional[int] = None,
+                 conflitos_alvo: int = 0,
+                 cancelamento: Optional[TokenCancelamento] = None,
+                 ao_melhorar: Optional[Callable[[Melhoria], None]] = None):
+        """
+        Args:
+            tempo_limite: Segundos de parede (None = sem limite)
+            max_avaliacoes: Avaliações de vizinhos (None = sem limite)
+            conflitos_alvo: Para ao chegar a este número de conflitos (0 = solução)
+            cancelamento: Token para interromper de fora
+            ao_melhorar: Chamado com uma `Melhoria` a cada novo melhor estado
+        """
+        self.tempo_limite = tempo_limite
+        self.max_avaliacoes = max_avaliacoes
+        self.conflitos_alvo = conflitos_alvo
+        self.cancelamento = cancelamento
+        self.ao_melhorar = ao_melhorar
+
+        self.motivo = None
+        self.melhor_conflitos = float('inf')
+        self.avaliacoes_anteriores = 0
+        self._inicio = None
+        self._prazo = None
+        self._profundidade = 0
+
+    def iniciar(self):
+        """Começa a contar (só na execução mais externa, se houver aninhamento)."""
+        if self._profundidade == 0:
+            self._inicio = time.perf_counter()
+            self._prazo = (self._inicio + self.tempo_limite
+                           if self.tempo_limite is not None else None)
+            self.motivo = None
+            self.melhor_conflitos = float('inf')
+            self.avaliacoes_anteriores = 0
+        self._profundidade += 1
+
+    def encerrar(self):
+        self._profundidade -= 1
+
+    def esgotado(self, avaliacoes: int) -> bool:
+        """
+        Verifica os limites; guarda em `motivo` qual deles acabou.
+
+        Args:
+            avaliacoes: Avaliações feitas pela execução atual
+        """
+        if self.max_avaliacoes is not None and \
+                self.avaliacoes_anteriores + avaliacoes >= self.max_avaliacoes:
+            self.motivo = 'avaliacoes'
+            return True
+        return self.expirou()
+
+    def expirou(self) -> bool:
+        """
+        Verifica só o prazo e o cancelamento.
+
+        Os tabuleiros chamam isto a cada coluna durante a varredura da
+        vizinhança, para que uma iteração longa (n grande) não estoure o prazo.
+        """
+        if self._prazo is not None and time.perf_counter() >= self._prazo:
+            self.motivo = 'tempo'
+            return True
+        if self.cancelamento is not None and self.cancelamento.cancelado:
+            self.motivo = 'cancelado'
+            return True
+        return False
+
+    @property
+    def interromper(self) -> Optional[Callable[[], bool]]:
+        """`expirou`, ou None se não há prazo nem token (varredura sem verificações)."""
+        if self.tempo_limite is None and self.cancelamento is None:
+            return None
+        return self.expirou
+
+    def melhorou(self, conflitos: int, avaliacoes: int, estado: Callable[[], List[int]]):
+        """
+        Registra um candidato a melhor estado e avisa `ao_melhorar` se ele for.
+
+        Args:
+            conflitos: Conflitos do estado
+            avaliacoes: Avaliações feitas pela execução atual
+            estado: Função que devolve o estado como lista (só chamada se
+                    houver `ao_melhorar`, para não copiar o tabuleiro à toa)
+        """
+        if conflitos >= self.melhor_conflitos:
+            return
+        self.melhor_conflitos = conflitos
+        if self.ao_melhorar is not None:
+            self.ao_melhorar(Melhoria(estado(), conflitos,
+                                      self.avaliacoes_anteriores + avaliacoes,
+                                      time.perf_counter() - self._inicio))
+
+
+# ============================================================================
+# FLUXO DE MELHORIAS
+# ============================================================================
+
+def melhorias(algoritmo: Callable, orcamento: Optional[Orcamento] = None,
+              **kwargs) -> Iterator[Melhoria]:
+    """
+    Executa o algoritmo em uma thread e produz cada melhora conforme acontece.
+
+    Interromper a iteração (break, ou fechar o gerador) cancela a execução.
+    O valor de retorno do gerador (`resultado = yield from melhorias(...)`) é
+    o dicionário de resultado do algoritmo.
+
+    Args:
+        algoritmo: Função de `hill_climbing.py`
+        orcamento: Limites da execução (None = só os critérios do algoritmo)
+        **kwargs: Parâmetros do algoritmo
+
+    Yields:
+        `Melhoria` a cada novo melhor estado
+    """
+    if orcamento is None:
+        orcamento = Orcamento()
+
+    fila = queue.Queue()
+    anterior = orcamento.ao_melhorar
+    # Token próprio (filho do token do chamador): parar este gerador não
+    # cancela outras execuções que compartilham o token original
+    token_original = orcamento.cancelamento
+    token = TokenCancelamento(pai=token_original)
+
+    def repassar(melhoria: Melhoria):
+        if anterior is not None:
+            anterior(melhoria)
+        fila.put(melhoria)
+
+    def executar():
+        try:
+            fila.put(algoritmo(orcamento=orcamento, **kwargs))
+        except BaseException as erro:
+            fila.put(erro)
+
+    orcamento.ao_melhorar = repassar
+    orcamento.cancelamento = token
+    thread = threading.Thread(target=executar, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = fila.get()
+            if isinstance(item, Melhoria):
+                yield item
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                return item
+    finally:
+        token.cancelar()
+        thread.join()
+        orcamento.ao_melhorar = anterior
+        orcamento.cancelamento = token_original
@@ -0,0 +1,394 @@
+"""
+Perfilamento dos algoritmos de busca local sem instrumentar o código.
+
+`perfilar_chamada` executa qualquer função sob o cProfile (determinístico)
+ou sob um profiler por amostragem (uma thread que lê `sys._current_frames()`
+a cada `intervalo` segundos) e devolve um `Perfil` com:
+- `pilhas`: pilha (tupla de frames, da raiz para a folha) → segundos;
+- `funcoes`: frame → chamadas, tempo próprio e tempo total.
+
+As pilhas são exportadas no formato "collapsed" (flamegraph.pl, inferno,
+speedscope) e em JSON do speedscope, um arquivo por algoritmo e tamanho n;
+`TabelaFuncoes` agrega as funções mais caras de várias execuções.
+Contraparte: Trabalho01/src/profiling.py.
+
+Uso:
+    python perfilamento.py --algoritmos hc_laterais simulated_annealing --tamanhos 8 64 256
+    python perfilamento.py --profiler amostragem --intervalo 0.0005 --tamanhos 512
+
+Autor: Matheus Emanuel
+Disciplina: Inteligência Artificial - CEFET-MG
+Data: 2025
+"""
+
+import argparse
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from functools import partial, wraps
+from typing import Callable, Dict, Optional, Tuple
+
+
+PROFILERS = ('cprofile', 'amostragem')
+
+# Pilhas reconstruídas do cProfile mais profundas que isso são truncadas
+PROFUNDIDADE_MAXIMA = 64
+
+
+def rotulo_frame(arquivo: str, linha: int, nome: str) -> str:
+    """Nome do frame sem ';' (separador do formato collapsed)."""
+    if arquivo == '~':
+        return nome.replace(';', ',')
+    return f"{nome} ({os.path.basename(arquivo)}:{linha})".replace(';', ',')
+
+
+def _rotulo_codigo(codigo) -> str:
+    return rotulo_frame(codigo.co_filename, codigo.co_firstlineno, codigo.co_name)
+
+
+class Perfil:
+    """Pilhas e tabela de funções de uma ou mais execuções perfiladas."""
+
+    def __init__(self, rotulo: str = '', profiler: str = 'cprofile'):
+        self.rotulo = rotulo
+        self.profiler = profiler
+        self.pilhas: Counter = Counter()
+        self.funcoes: Dict[str, Dict] = {}
+        self.tempo = 0.0
+        self.execucoes = 0
+
+    def combinar(self, outro: 'Perfil'):
+        """Soma outro perfil (ex.: outra execução do mesmo algoritmo e n)."""
+        self.pilhas.update(outro.pilhas)
+        for nome, linha in outro.funcoes.items():
+            minha = self.funcoes.setdefault(nome, {'chamadas': 0, 'proprio': 0.0, 'total': 0.0})
+            for chave in minha:
+                minha[chave] += linha[chave]
+        self.tempo += outro.tempo
+        self.execucoes += outro.execucoes
+
+
+# ============================================================================
+# CPROFILE
+# ============================================================================
+
+def _perfil_de_pstats(estatisticas: pstats.Stats, perfil: Perfil):
+    """
+    Reconstrói as pilhas a partir das arestas chamador → chamado do cProfile.
+
+    O tempo próprio de cada função é dividido entre os seus chamadores na
+    proporção do tempo acumulado de cada aresta, a partir das raízes.
+    """
+    entradas = estatisticas.stats
+    rotulos = {chave: rotulo_frame(*chave) for chave in entradas}
+
+    chamados = defaultdict(list)
+    for chave, (_, _, _, _, chamadores) in entradas.items():
+        for chamador, aresta in chamadores.items():
+            chamados[chamador].append((chave, aresta[3]))
+
+    def percorrer(chave, pilha, visitadas, fracao):
+        _, _, proprio, _, _ = entradas[chave]
+        if proprio * fracao > 0:
+            perfil.pilhas[pilha] += proprio * fracao
+        if len(pilha) >= PROFUNDIDADE_MAXIMA:
+            return
+        for filho, tempo_aresta in chamados.get(chave, ()):
+            tempo_filho = entradas[filho][3]
+            if filho in visitadas or not tempo_filho:
+                continue
+            parcela = fracao * tempo_aresta / tempo_filho
+            if parcela > 1e-9:
+                percorrer(filho, pilha + (rotulos[filho],), visitadas | {filho}, parcela)
+
+    for chave, (_, _, _, _, chamadores) in entradas.items():
+        if not chamadores:
+            percorrer(chave, (rotulos[chave],), frozenset([chave]), 1.0)
+
+    for chave, (_, chamadas, proprio, total, _) in entradas.items():
+        perfil.funcoes[rotulos[chave]] = {'chamadas': chamadas, 'proprio': proprio, 'total': total}
+
+
+def _executar_cprofile(funcao: Callable, args: Tuple, kwargs: Dict, perfil: Perfil):
+    profiler = cProfile.Profile()
+    resultado = profiler.runcall(funcao, *args, **kwargs)
+    estatisticas = pstats.Stats(profiler)
+    # Remove o próprio profiler.disable() que o runcall registra
+    estatisticas.stats = {chave: valor for chave, valor in estatisticas.stats.items()
+                          if "_lsprof.Profiler" not in chave[2]}
+    for chave, (cc, nc, tt, ct, chamadores) in estatisticas.stats.items():
+        estatisticas.stats[chave] = (cc, nc, tt, ct, {c: a for c, a in chamadores.items()
+                                                      if c in estatisticas.stats})
+    _perfil_de_pstats(estatisticas, perfil)
+    return resultado
+
+
+# ============================================================================
+# AMOSTRAGEM
+# ============================================================================
+
+class ProfilerAmostragem:
+    """
+    Lê a pilha da thread alvo a cada `intervalo` segundos.
+
+    O custo para o código medido é quase nulo, mas trechos mais curtos que
+    o intervalo só aparecem estatisticamente (use várias execuções).
+    """
+
+    def __init__(self, intervalo: float = 0.001, descartar: int = 0):
+        self.intervalo = intervalo
+        self.descartar = descartar
+        self.amostras: Counter = Counter()
+        self.ativo = False
+        self._alvo = None
+        self._parar = threading.Event()
+        self._thread = None
+
+    def _executar(self):
+        while not self._parar.wait(self.intervalo):
+            frame = sys._current_frames().get(self._alvo)
+            pilha = []
+            while frame is not None:
+                pilha.append(_rotulo_codigo(frame.f_code))
+                frame = frame.f_back
+            pilha.reverse()
+            if self.ativo and len(pilha) > self.descartar:
+                self.amostras[tuple(pilha[self.descartar:])] += 1
+
+    def iniciar(self):
+        self._alvo = threading.get_ident()
+        self._thread = threading.Thread(target=self._executar, daemon=True)
+        self._thread.start()
+
+    def parar(self):
+        self._parar.set()
+        self._thread.join()
+
+
+def _profundidade(frame) -> int:
+    profundidade = 0
+    while frame is not None:
+        profundidade += 1
+        frame = frame.f_back
+    return profundidade
+
+
+def _executar_amostragem(funcao: Callable, args: Tuple, kwargs: Dict, perfil: Perfil,
+                         intervalo: float):
+    # Descarta os frames até este (inclusive): as pilhas começam em `funcao`
+    amostrador = ProfilerAmostragem(intervalo, descartar=_profundidade(sys._getframe()))
+    amostrador.iniciar()
+    inicio = time.perf_counter()
+    amostrador.ativo = True
+    try:
+        resultado = funcao(*args, **kwargs)
+    finally:
+        amostrador.ativo = False
+        tempo = time.perf_counter() - inicio
+        amostrador.parar()
+
+    total = sum(amostrador.amostras.values())
+    if total:
+        # Cada amostra vale o tempo real dividido pelo número de amostras
+        peso = tempo / total
+        for pilha, contagem in amostrador.amostras.items():
+            perfil.pilhas[pilha] += contagem * peso
+            for nome in set(pilha):
+                linha = perfil.funcoes.setdefault(nome, {'chamadas': 0, 'proprio': 0.0,
+                                                         'total': 0.0})
+                linha['total'] += contagem * peso
+            perfil.funcoes[pilha[-1]]['proprio'] += contagem * peso
+    return resultado
+
+
+def perfilar_chamada(funcao: Callable, args: Tuple = (), kwargs: Optional[Dict] = None,
+                     profiler: str = 'cprofile', intervalo: float = 0.001,
+                     rotulo: Optional[str] = None) -> Tuple[object, Perfil]:
+    """
+    Executa `funcao(*args, **kwargs)` sob o profiler escolhido.
+
+    Args:
+        funcao: Função a perfilar (qualquer algoritmo do projeto)
+        args, kwargs: Argumentos da função
+        profiler: 'cprofile' ou 'amostragem'
+        intervalo: Intervalo entre amostras (só 'amostragem')
+        rotulo: Nome do perfil (padrão: nome da função)
+
+    Returns:
+        Tupla (resultado da função, Perfil)
+    """
+    kwargs = kwargs or {}
+    perfil = Perfil(rotulo or getattr(funcao, '__name__', 'perfil'), profiler)
+    inicio = time.perf_counter()
+    if profiler == 'cprofile':
+        resultado = _executar_cprofile(funcao, args, kwargs, perfil)
+    elif profiler == 'amostragem':
+        resultado = _executar_amostragem(funcao, args, kwargs, perfil, intervalo)
+    else:
+        raise ValueError(f"Profiler desconhecido: {profiler!r} (use {PROFILERS})")
+    perfil.tempo = time.perf_counter() - inicio
+    perfil.execucoes = 1
+    return resultado, perfil
+
+
+# ============================================================================
+# EXPORTAÇÃO E AGREGAÇÃO
+# ============================================================================
+
+def salvar_collapsed(perfil: Perfil, caminho: str):
+    """Uma linha por pilha: `raiz;...;folha <microssegundos>`."""
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        for pilha, segundos in sorted(perfil.pilhas.items()):
+            peso = round(segundos * 1e6)
+            if peso > 0:
+                arquivo.write(f"{';'.join(pilha)} {peso}\n")
+
+
+def salvar_speedscope(perfil: Perfil, caminho: str):
+    """Perfil 'sampled' do speedscope (https://www.speedscope.app)."""
+    frames, indices = [], {}
+    amostras, pesos = [], []
+    for pilha, segundos in perfil.pilhas.items():
+        for nome in pilha:
+            if nome not in indices:
+                indices[nome] = len(frames)
+                frames.append({'name': nome})
+        amostras.append([indices[nome] for nome in pilha])
+        pesos.append(segundos)
+
+    documento = {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'shared': {'frames': frames},
+        'profiles': [{
+            'type': 'sampled',
+            'name': f"{perfil.rotulo} ({perfil.profiler}, {perfil.execucoes} execuções)",
+            'unit': 'seconds',
+            'startValue': 0,
+            'endValue': sum(pesos),
+            'samples': amostras,
+            'weights': pesos
+        }],
+        'name': perfil.rotulo,
+        'exporter': 'perfilamento.py'
+    }
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(documento, arquivo, ensure_ascii=False)
+
+
+def salvar_perfil(perfil: Perfil, diretorio: str) -> Tuple[str, str]:
+    """Grava `<rotulo>.folded` e `<rotulo>.speedscope.json` no diretório."""
+    os.makedirs(diretorio, exist_ok=True)
+    base = os.path.join(diretorio, perfil.rotulo.replace(os.sep, '_'))
+    salvar_collapsed(perfil, base + '.folded')
+    salvar_speedscope(perfil, base + '.speedscope.json')
+    return base + '.folded', base + '.speedscope.json'
+
+
+class TabelaFuncoes:
+    """Agrega as funções de vários perfis (execuções, sementes, tamanhos...)."""
+
+    def __init__(self):
+        self.linhas: Dict[str, Dict] = {}
+        self.execucoes = 0
+        self.tempo = 0.0
+
+    def adicionar(self, perfil: Perfil):
+        self.execucoes += perfil.execucoes
+        self.tempo += perfil.tempo
+        for nome, linha in perfil.funcoes.items():
+            minha = self.linhas.setdefault(nome, {'chamadas': 0, 'proprio': 0.0, 'total': 0.0})
+            for chave in minha:
+                minha[chave] += linha[chave]
+
+    def mais_caras(self, quantidade: int = 15, chave: str = 'proprio'):
+        return sorted(self.linhas.items(), key=lambda item: item[1][chave], reverse=True)[:quantidade]
+
+    def imprimir(self, titulo: str = '', quantidade: int = 15, chave: str = 'proprio'):
+
+        print(f"\n{'='*100}")
+        print(f"FUNÇÕES MAIS CARAS{' - ' + titulo if titulo else ''} "
+              f"({self.execucoes} execuções, {self.tempo:.4f}s)")
+        print(f"{'='*100}")
+        print(f"{'Próprio (s)':>12} {'%':>6} {'Total (s)':>12} {'Chamadas':>10}  Função")
+        print("-" * 100)
+        for nome, linha in self.mais_caras(quantidade, chave):
+            parcela = linha['proprio'] / self.tempo * 100 if self.tempo else 0.0
+            chamadas = linha['chamadas'] if linha['chamadas'] else '-'
+            print(f"{linha['proprio']:>12.6f} {parcela:>5.1f}% {linha['total']:>12.6f} "
+                  f"{chamadas:>10}  {nome}")
+        print("=" * 100)
+
+
+def perfilar(funcao: Callable = None, *, profiler: str = 'cprofile',
+             diretorio: Optional[str] = None, intervalo: float = 0.001,
+             tabela: Optional[TabelaFuncoes] = None):
+    """
+    Decorador: `@perfilar` ou `@perfilar(profiler='amostragem', diretorio=...)`.
+
+    Com `diretorio`, grava os arquivos de cada chamada; com `tabela`, acumula
+    as funções nela. Sem nenhum dos dois, imprime as funções mais caras.
+    """
+    if funcao is None:
+        return partial(perfilar, profiler=profiler, diretorio=diretorio,
+                       intervalo=intervalo, tabela=tabela)
+
+    @wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        resultado, perfil = perfilar_chamada(funcao, args, kwargs, profiler, intervalo)
+        if diretorio:
+            salvar_perfil(perfil, diretorio)
+        if tabela is not None:
+            tabela.adicionar(perfil)
+        elif not diretorio:
+            relatorio = TabelaFuncoes()
+            relatorio.adicionar(perfil)
+            relatorio.imprimir(funcao.__name__, quantidade=10)
+        return resultado
+    return envoltorio
+
+
+# ============================================================================
+# LINHA DE COMANDO: ALGORITMOS × TAMANHOS
+# ============================================================================
+
+def main(argv=None):
+    from benchmark import ALGORITMOS, executar_algoritmo
+
+    parser = argparse.ArgumentParser(description="Perfilamento dos algoritmos de N Rainhas")
+    parser.add_argument('--algoritmos', nargs='+', default=['hc_laterais', 'simulated_annealing'],
+                        choices=list(ALGORITMOS))
+    parser.add_argument('--tamanhos', nargs='+', type=int, default=[8, 64],
+                        help="Valores de n")
+    parser.add_argument('--sementes', type=int, default=3,
+                        help="Execuções por algoritmo e n (sementes 0, 1, ..., k-1)")
+    parser.add_argument('--profiler', choices=PROFILERS, default='cprofile')
+    parser.add_argument('--intervalo', type=float, default=0.001,
+                        help="Intervalo de amostragem em segundos (profiler 'amostragem')")
+    parser.add_argument('--linhas', type=int, default=15, help="Linhas da tabela de funções")
+    parser.add_argument('--saida', default=os.path.join('..', 'data', 'perfis'),
+                        help="Diretório dos arquivos .folded e .speedscope.json")
+    args = parser.parse_args(argv)
+
+    for n in args.tamanhos:
+        for nome in args.algoritmos:
+            rotulo = f"{nome}_n{n}"
+            combinado = Perfil(rotulo, args.profiler)
+            for semente in range(args.sementes):
+                _, perfil = perfilar_chamada(executar_algoritmo, (nome, n, semente),
+                                             profiler=args.profiler, intervalo=args.intervalo)
+                combinado.combinar(perfil)
+
+            tabela = TabelaFuncoes()
+            tabela.adicionar(combinado)
+            tabela.imprimir(rotulo, args.linhas)
+            for caminho in salvar_perfil(combinado, args.saida):
+                print(f"✅ Salvo: {caminho}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+Esquemas de resfriamento para o Simulated Annealing.
+
+Cada esquema recebe a temperatura atual e informações da iteração
+(fração de movimentos aceitos e se o melhor estado melhorou) e devolve
+a próxima temperatura. Os esquemas podem ser escolhidos pelo nome
+(ver `ESQUEMAS`) ou passados diretamente como objeto.
+
+Autor: Matheus Emanuel
+Disciplina: Inteligência Artificial - CEFET-MG
+Data: 2025
+"""
+
+import math
+from abc import ABC, abstractmethod
+from typing import Dict, Type, Union
+
+
+# ============================================================================
+# INTERFACE BASE
+# ============================================================================
+
+class EsquemaResfriamento(ABC):
+    """
+    Interface comum dos esquemas de resfriamento.
+
+    Classe abstrata: subclasses precisam implementar `atualizar` (um esquema
+    incompleto falha ao ser criado, e não no meio da execução).
+
+    Uso pelo Simulated Annealing:
+        temperatura = esquema.iniciar(temperatura_inicial)
+        while ... and not esquema.terminou(temperatura):
+            ...
+            temperatura = esquema.atualizar(temperatura, iteracao, aceitos, melhorou)
+    """
+
+    nome = 'base'
+
+    def __init__(self, temperatura_minima: float = 0.01):
+        self.temperatura_minima = temperatura_minima
+        self.temperatura_inicial = 0.0
+
+    def iniciar(self, temperatura_inicial: float) -> float:
+        """
+        Reinicia o estado interno do esquema para uma nova execução.
+
+        Args:
+            temperatura_inicial: Temperatura T₀
+
+        Returns:
+            Temperatura da primeira iteração
+        """
+        self.temperatura_inicial = temperatura_inicial
+        return temperatura_inicial
+
+    @abstractmethod
+    def atualizar(self, temperatura: float, iteracao: int,
+                  aceitos: float, melhorou: bool) -> float:
+        """
+        Calcula a temperatura da próxima iteração.
+
+        Args:
+            temperatura: Temperatura atual
+            iteracao: Número da iteração que acabou de terminar (1, 2, ...)
+            aceitos: Fração dos movimentos propostos que foram aceitos (0 a 1)
+            melhorou: Se o melhor estado encontrado melhorou nesta iteração
+
+        Returns:
+            Nova temperatura
+        """
+
+    def terminou(self, temperatura: float) -> bool:
+        """Indica se a temperatura chegou ao mínimo (critério de parada)."""
+        return temperatura <= self.temperatura_minima
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(temperatura_minima={self.temperatura_minima})"
+
+
+# ============================================================================
+# ESQUEMAS CLÁSSICOS
+# ============================================================================
+
+class Geometrico(EsquemaResfriamento):
+    """Resfriamento geométrico: T_nova = α × T_atual (padrão do projeto)."""
+
+    nome = 'geometrico'
+
+    def __init__(self, alfa: float = 0.995, temperatura_minima: float = 0.01):
+        super().__init__(temperatura_minima)
+        self.alfa = alfa
+
+    def atualizar(self, temperatura, iteracao, aceitos, melhorou):
+        return temperatura * self.alfa
+
+
+class Linear(EsquemaResfriamento):
+    """Resfriamento linear: T_k = T₀ - β × k."""
+
+    nome = 'linear'
+
+    def __init__(self, decremento: float = 1.0, temperatura_minima: float = 0.01):
+        super().__init__(temperatura_minima)
+        self.decremento = decremento
+
+    def atualizar(self, temperatura, iteracao, aceitos, melhorou):
+        return max(self.temperatura_inicial - self.decremento * iteracao, 0.0)
+
+
+class Logaritmico(EsquemaResfriamento):
+    """
+    Resfriamento logarítmico: T_k = T₀ × ln(2) / ln(k + 2).
+
+    Muito lento (garantia teórica de convergência); normalmente termina
+    pelo limite de iterações, e não pela temperatura mínima.
+    """
+
+    nome = 'logaritmico'
+
+    def atualizar(self, temperatura, iteracao, aceitos, melhorou):
+        return self.temperatura_inicial * math.log(2) / math.log(iteracao + 2)
+
+
+class LundyMees(EsquemaResfriamento):
+    """Resfriamento de Lundy–Mees: T_nova = T / (1 + β × T)."""
+
+    nome = 'lundy_mees'
+
+    def __init__(self, beta: float = 0.001, temperatura_minima: float = 0.01):
+        super().__init__(temperatura_minima)
+        self.beta = beta
+
+    def atualizar(self, temperatura, iteracao, aceitos, melhorou):
+        return temperatura / (1 + self.beta * temperatura)
+
+
+# ============================================================================
+# ESQUEMAS ADAPTATIVOS
+# ============================================================================
+
+class Adaptativo(EsquemaResfriamento):
+    """
+    Resfriamento guiado pela taxa de aceitação.
+
+    A cada `janela` iterações compara a taxa de aceitação observada com a
+    taxa alvo: acima do alvo a busca ainda está "quente demais" e resfria
+    com `alfa_rapido`; abaixo do alvo resfria devagar com `alfa_lento`.
+    """
+
+    nome = 'adaptativo'
+
+    def __init__(self, taxa_alvo: float = 0.3, janela: int = 50,
+                 alfa_rapido: float = 0.98, alfa_lento: float = 0.999,
+                 temperatura_minima: float = 0.01):
+        super().__init__(temperatura_minima)
+        self.taxa_alvo = taxa_alvo
+        self.janela = janela
+        self.alfa_rapido = alfa_rapido
+        self.alfa_lento = alfa_lento
+
+    def iniciar(self, temperatura_inicial):
+        self._soma_aceitos = 0.0
+        self._passos = 0
+        self._alfa = self.alfa_rapido
+        return super().iniciar(temperatura_inicial)
+
+    def atualizar(self, temperatura, iteracao, aceitos, melhorou):
+        self._soma_aceitos += aceitos
+        self._passos += 1
+        if self._passos == self.janela:
+            taxa = self._soma_aceitos / self._passos
+            self._alfa = self.alfa_rapido if taxa > self.taxa_alvo else self.alfa_lento
+            self._soma_aceitos = 0.0
+            self._passos = 0
+        return temperatura * self._alfa
+
+
+class ComReaquecimento(EsquemaResfriamento):
+    """
+    Adiciona reaquecimento por estagnação a qualquer esquema.
+
+    Se o melhor estado não melhora por `paciencia` iterações, a temperatura
+    volta para `fator × T₀` e o esquema base é reiniciado a partir dela.
+    """
+
+    nome = 'reaquecimento'
+
+    def __init__(self, base: EsquemaResfriamento = None, paciencia: int = 500,
+                 fator: float = 0.5, max_reaquecimentos: int = 10,
+                 temperatura_minima: float = 0.01):
+        base = base if base is not None else Geometrico(temperatura_minima=temperatura_minima)
+        super().__init__(base.temperatura_minima)
+        self.base = base
+        self.paciencia = paciencia
+        self.fator = fator
+        self.max_reaquecimentos = max_reaquecimentos
+
+    def iniciar(self, temperatura_inicial):
+        self._sem_melhora = 0
+        self._inicio_ciclo = 0
+        self.reaquecimentos = 0
+        super().iniciar(temperatura_inicial)
+        return self.base.iniciar(temperatura_inicial)
+
+    def atualizar(self, temperatura, iteracao, aceitos, melhorou):
+        self._sem_melhora = 0 if melhorou else self._sem_melhora + 1
+
+        if (self._sem_melhora >= self.paciencia
+                and self.reaquecimentos < self.max_reaquecimentos):
+            self.reaquecimentos += 1
+            self._sem_melhora = 0
+            self._inicio_ciclo = iteracao
+            return self.base.iniciar(self.temperatura_inicial * self.fator)
+
+        # O esquema base enxerga as iterações contadas a partir do último reinício
+        return self.base.atualizar(temperatura, iteracao - self._inicio_ciclo,
+                                   aceitos, melhorou)
+
+    def terminou(self, temperatura):
+        return self.base.terminou(temperatura)
+
+    def __repr__(self) -> str:
+        return f"ComReaquecimento(base={self.base!r}, paciencia={self.paciencia})"
+
+
+# ============================================================================
+# SELEÇÃO POR NOME
+# ============================================================================
+
+ESQUEMAS: Dict[str, Type[EsquemaResfriamento]] = {
+    Geometrico.nome: Geometrico,
+    Linear.nome: Linear,
+    Logaritmico.nome: Logaritmico,
+    LundyMees.nome: LundyMees,
+    Adaptativo.nome: Adaptativo,
+    ComReaquecimento.nome: ComReaquecimento,
+}
+
+
+def obter_esquema(esquema: Union[str, EsquemaResfriamento] = 'geometrico',
+                  **parametros) -> EsquemaResfriamento:
+    """
+    Resolve um esquema de resfriamento a partir do nome ou do objeto.
+
+    Args:
+        esquema: Nome registrado em `ESQUEMAS` ou instância de EsquemaResfriamento
+        **parametros: Parâmetros repassados ao construtor (apenas para nomes)
+
+    Returns:
+        Instância de EsquemaResfriamento
+
+    Exemplo:
+        obter_esquema('lundy_mees', beta=0.0005)
+        obter_esquema(ComReaquecimento(Adaptativo(), paciencia=300))
+    """
+    if isinstance(esquema, EsquemaResfriamento):
+        return esquema
+    try:
+        classe = ESQUEMAS[esquema]
+    except KeyError:
+        raise ValueError(f"Esquema de resfriamento desconhecido: {esquema!r}. "
+                         f"Opções: {', '.join(ESQUEMAS)}") from None
+    return classe(**parametros)
+
+
+def resolver_esquema(esquema: Union[str, EsquemaResfriamento],
+                     taxa_resfriamento: float = 0.995,
+                     temperatura_minima: float = 0.01) -> EsquemaResfriamento:
+    """
+    Resolve o esquema usado pelo Simulated Annealing.
+
+    Mantém a compatibilidade com os parâmetros antigos: quando o esquema é
+    dado pelo nome, `taxa_resfriamento` vira o α do resfriamento geométrico
+    (também usado como base do reaquecimento) e `temperatura_minima` o
+    critério de parada.
+
+    Args:
+        esquema: Nome registrado em `ESQUEMAS` ou instância de EsquemaResfriamento
+        taxa_resfriamento: α do resfriamento geométrico
+        temperatura_minima: Temperatura de parada
+
+    Returns:
+        Instância de EsquemaResfriamento
+    """
+    if not isinstance(esquema, str):
+        return obter_esquema(esquema)
+    if esquema == Geometrico.nome:
+        return Geometrico(taxa_resfriamento, temperatura_minima)
+    if esquema == ComReaquecimento.nome:
+        return ComReaquecimento(Geometrico(taxa_resfriamento, temperatura_minima))
+    return obter_esquema(esquema, temperatura_minima=temperatura_minima)
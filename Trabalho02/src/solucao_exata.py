@@ -0,0 +1,248 @@
+"""
+Solução exata do problema das N Rainhas por backtracking com bitboards.
+
+Serve de referência (ground truth) para os algoritmos estocásticos: encontra
+uma solução, enumera todas (gerador) e conta quantas existem.
+
+Mesma codificação do resto do projeto (índice = coluna, valor = linha). A
+busca percorre as colunas em ordem e guarda três máscaras de bits com as
+linhas já ocupadas e as atacadas pelas duas diagonais; ao avançar uma coluna
+as máscaras das diagonais são deslocadas de um bit. As linhas livres da
+coluna são `~(linhas | diag1 | diag2)`, e cada uma é extraída com
+`livres & -livres`, sem percorrer o tabuleiro.
+
+A contagem usa a simetria de reflexão vertical (linha r ↔ n-1-r): basta
+contar as soluções com a rainha da primeira coluna na metade de cima e
+dobrar (para n ímpar, com ela na linha do meio, a segunda coluna é que fica
+restrita à metade de cima). Os prefixos das duas primeiras colunas viram
+tarefas independentes, distribuídas entre processos.
+
+Autor: Matheus Emanuel
+Disciplina: Inteligência Artificial - CEFET-MG
+Data: 2025
+"""
+
+import argparse
+import os
+import time
+from typing import Iterator, List, Optional, Tuple
+
+# Quantidade de soluções para n = 0..16 (OEIS A000170), para conferência
+SOLUCOES_CONHECIDAS = (1, 1, 0, 0, 2, 10, 4, 40, 92, 352, 724, 2680, 14200, 73712,
+                       365596, 2279184, 14772512)
+
+
+# ============================================================================
+# ENUMERAÇÃO
+# ============================================================================
+
+def iterar_solucoes(n: int = 8) -> Iterator[List[int]]:
+    """
+    Gera todas as soluções, em ordem lexicográfica.
+
+    A busca usa uma pilha explícita (sem recursão) e produz cada solução
+    assim que ela é encontrada, então a memória é O(n) mesmo para n grande.
+
+    Args:
+        n: Tamanho do tabuleiro
+
+    Yields:
+        Lista com a linha da rainha de cada coluna
+    """
+    if n == 0:
+        yield []
+        return
+
+    cheio = (1 << n) - 1
+    estado = [0] * n
+    # Por coluna: linhas ainda não testadas e máscaras vigentes
+    livres = [0] * n
+    mascaras = [(0, 0, 0)] * n
+
+    coluna = 0
+    livres[0] = cheio
+    while coluna >= 0:
+        disponiveis = livres[coluna]
+        if not disponiveis:
+            coluna -= 1
+            continue
+
+        bit = disponiveis & -disponiveis
+        livres[coluna] = disponiveis ^ bit
+        estado[coluna] = bit.bit_length() - 1
+
+        if coluna == n - 1:
+            yield estado.copy()
+            continue
+
+        linhas, diag1, diag2 = mascaras[coluna]
+        linhas |= bit
+        diag1 = ((diag1 | bit) << 1) & cheio
+        diag2 = (diag2 | bit) >> 1
+        coluna += 1
+        mascaras[coluna] = (linhas, diag1, diag2)
+        livres[coluna] = cheio & ~(linhas | diag1 | diag2)
+
+
+def encontrar_solucao(n: int = 8) -> Optional[List[int]]:
+    """
+    Primeira solução em ordem lexicográfica.
+
+    Returns:
+        Estado sem conflitos, ou None se não houver solução (n = 2 ou 3)
+    """
+    return next(iterar_solucoes(n), None)
+
+
+# ============================================================================
+# CONTAGEM
+# ============================================================================
+
+def _contar(cheio: int, restantes: int, linhas: int, diag1: int, diag2: int) -> int:
+    # Pilha explícita (mais rápida que recursão em Python). As duas últimas
+    # colunas são resolvidas direto: sobra uma única linha, então basta testar
+    # se ela está livre depois de posicionar a penúltima rainha.
+    if restantes == 1:
+        return 1 if cheio & ~(linhas | diag1 | diag2) else 0
+    total = 0
+    pilha = []
+    livres = cheio & ~(linhas | diag1 | diag2)
+    while True:
+        if livres:
+            bit = livres & -livres
+            livres ^= bit
+            if restantes == 2:
+                if cheio & ~(linhas | bit | ((diag1 | bit) << 1) | ((diag2 | bit) >> 1)):
+                    total += 1
+                continue
+            pilha.append((livres, linhas, diag1, diag2, restantes))
+            linhas |= bit
+            diag1 = ((diag1 | bit) << 1) & cheio
+            diag2 = (diag2 | bit) >> 1
+            restantes -= 1
+            livres = cheio & ~(linhas | diag1 | diag2)
+        elif pilha:
+            livres, linhas, diag1, diag2, restantes = pilha.pop()
+        else:
+            return total
+
+
+def contar_prefixo(n: int, prefixo: Tuple[int, ...]) -> int:
+    """
+    Conta as soluções que começam com as linhas de `prefixo` nas primeiras colunas.
+
+    Returns:
+        Número de soluções (0 se o próprio prefixo já tiver conflito)
+    """
+    cheio = (1 << n) - 1
+    linhas = diag1 = diag2 = 0
+    for linha in prefixo:
+        bit = 1 << linha
+        if (linhas | diag1 | diag2) & bit:
+            return 0
+        linhas |= bit
+        diag1 = ((diag1 | bit) << 1) & cheio
+        diag2 = (diag2 | bit) >> 1
+    restantes = n - len(prefixo)
+    if restantes == 0:
+        return 1
+    return _contar(cheio, restantes, linhas, diag1, diag2)
+
+
+def tarefas_simetricas(n: int) -> List[Tuple[Tuple[int, ...], int]]:
+    """
+    Prefixos das duas primeiras colunas com o peso de cada um pela simetria.
+
+    Só entram prefixos da metade de cima (peso 2, contando o reflexo); para n
+    ímpar, a rainha no meio da primeira coluna fica com a segunda coluna
+    restrita à metade de cima (a linha do meio é ataque de linha).
+
+    Returns:
+        Lista de (prefixo, peso); a soma de peso × contar_prefixo é o total
+    """
+    if n < 2:
+        return [((), 1)]
+    meio = n // 2
+    tarefas = []
+    for primeira in range(meio):
+        for segunda in range(n):
+            if abs(segunda - primeira) > 1:
+                tarefas.append(((primeira, segunda), 2))
+    if n % 2 == 1:
+        for segunda in range(meio - 1):
+            tarefas.append(((meio, segunda), 2))
+    return tarefas
+
+
+def _contar_tarefa(tarefa: Tuple[int, Tuple[int, ...], int]) -> int:
+    n, prefixo, peso = tarefa
+    return peso * contar_prefixo(n, prefixo)
+
+
+def contar_solucoes(n: int = 8, processos: int = 0) -> int:
+    """
+    Conta todas as soluções do tabuleiro n×n.
+
+    Args:
+        n: Tamanho do tabuleiro
+        processos: Workers para as tarefas por prefixo (0 = processo atual)
+
+    Returns:
+        Número de soluções (92 para n = 8)
+    """
+    tarefas = [(n, prefixo, peso) for prefixo, peso in tarefas_simetricas(n)]
+    if processos > 0 and len(tarefas) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=processos) as pool:
+            return sum(pool.map(_contar_tarefa, tarefas, chunksize=1))
+    return sum(map(_contar_tarefa, tarefas))
+
+
+# ============================================================================
+# EXECUÇÃO PRINCIPAL
+# ============================================================================
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Solução exata das N Rainhas (backtracking com bitboards)")
+    parser.add_argument('-n', type=int, default=8, help="Tamanho do tabuleiro")
+    grupo = parser.add_mutually_exclusive_group()
+    grupo.add_argument('--contar', action='store_true', help="Conta todas as soluções")
+    grupo.add_argument('--todas', action='store_true',
+                       help="Imprime todas as soluções (uma por linha, conforme são encontradas)")
+    parser.add_argument('--processos', type=int, default=os.cpu_count() or 1,
+                        help="Processos para a contagem (0 = só o processo atual)")
+    args = parser.parse_args(argv)
+
+    tempo_inicio = time.perf_counter()
+
+    if args.todas:
+        total = 0
+        for solucao in iterar_solucoes(args.n):
+            total += 1
+            print(solucao)
+        print(f"\n{total} soluções em {time.perf_counter() - tempo_inicio:.6f} segundos")
+
+    elif args.contar:
+        total = contar_solucoes(args.n, args.processos)
+        tempo_total = time.perf_counter() - tempo_inicio
+        print(f"n = {args.n}: {total} soluções em {tempo_total:.6f} segundos")
+        if args.n < len(SOLUCOES_CONHECIDAS):
+            esperado = SOLUCOES_CONHECIDAS[args.n]
+            print(f"Referência (OEIS A000170): {esperado} "
+                  f"{'✓' if total == esperado else '✗ DIVERGENTE'}")
+
+    else:
+        from hill_climbing import imprimir_tabuleiro
+        solucao = encontrar_solucao(args.n)
+        tempo_total = time.perf_counter() - tempo_inicio
+        if solucao is None:
+            print(f"n = {args.n}: não há solução ({tempo_total:.6f} segundos)")
+        else:
+            imprimir_tabuleiro(solucao, f"Primeira solução (n = {args.n})")
+            print(f"\nEstado: {solucao}")
+            print(f"Tempo: {tempo_total:.6f} segundos")
+
+
+if __name__ == "__main__":
+    main()
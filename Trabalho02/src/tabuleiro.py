@@ -0,0 +1,555 @@
+"""
+Representação compacta do tabuleiro das N Rainhas.
+
+O `Tabuleiro` guarda as linhas das rainhas em um `array('H')` (ou `array('I')`
+para n ≥ 65536) e mantém contadores incrementais de rainhas por linha e por
+diagonal. Com isso:
+- o número de conflitos é atualizado em O(1) a cada movimento;
+- o delta de conflitos de qualquer movimento é calculado em O(1), sem
+  gerar a lista de vizinhos;
+- uma cópia custa um memcpy de 2–4 bytes por coluna, em vez de uma lista
+  de ponteiros para inteiros.
+
+`TabuleiroPermutacao` é a representação alternativa por permutação (uma
+rainha por linha e por coluna): a vizinhança passa a ser a troca das linhas de
+duas colunas, só há conflitos nas diagonais e o espaço de busca cai de nⁿ
+para n! estados.
+
+`MelhorEstado` acompanha a melhor solução encontrada por log de movimentos,
+evitando copiar o tabuleiro a cada melhora.
+
+Autor: Matheus Emanuel
+Disciplina: Inteligência Artificial - CEFET-MG
+Data: 2025
+"""
+
+from array import array
+from typing import Callable, List, Optional, Tuple
+
+
+def _tipo_array(n: int) -> str:
+    return 'H' if n < 65536 else 'I'
+
+
+class Tabuleiro:
+    """
+    Tabuleiro com contadores incrementais de conflitos.
+
+    Mesma codificação do resto do projeto: índice = coluna, valor = linha.
+    Para a rainha (c, r): diagonal principal c - r + n - 1, secundária c + r.
+    """
+
+    __slots__ = ('n', 'linhas', 'conflitos', '_por_linha', '_diag1', '_diag2', 'log')
+
+    def __init__(self, estado):
+        n = len(estado)
+        self.n = n
+        self.linhas = array(_tipo_array(n), estado)
+        self._por_linha = array('I', bytes(4 * n))
+        self._diag1 = array('I', bytes(4 * (2 * n - 1)))
+        self._diag2 = array('I', bytes(4 * (2 * n - 1)))
+        self.log = None
+
+        for coluna, linha in enumerate(self.linhas):
+            self._por_linha[linha] += 1
+            self._diag1[coluna - linha + n - 1] += 1
+            self._diag2[coluna + linha] += 1
+
+        self.conflitos = sum(k * (k - 1) // 2 for contagem in
+                             (self._por_linha, self._diag1, self._diag2) for k in contagem)
+
+    @classmethod
+    def aleatorio(cls, n: int, rng) -> 'Tabuleiro':
+        """Cria um tabuleiro aleatório consumindo o gerador como `gerar_estado_aleatorio`."""
+        return cls([rng.randint(0, n - 1) for _ in range(n)])
+
+    # ------------------------------------------------------------------------
+    # Movimentos
+    # ------------------------------------------------------------------------
+
+    @property
+    def num_vizinhos(self) -> int:
+        """Tamanho da vizinhança (mover uma rainha para outra linha)."""
+        return self.n * (self.n - 1)
+
+    def movimento_aleatorio(self, rng) -> Tuple[int, int]:
+        """
+        Sorteia um vizinho uniformemente (para o Simulated Annealing).
+
+        O índice sorteado corresponde à posição do vizinho em `gerar_vizinhos`.
+
+        Returns:
+            Tupla (coluna, nova_linha)
+        """
+        coluna, indice = divmod(rng.randrange(self.num_vizinhos), self.n - 1)
+        return coluna, (indice if indice < self.linhas[coluna] else indice + 1)
+
+    def delta(self, coluna: int, nova_linha: int) -> int:
+        """
+        Variação de conflitos ao mover a rainha da coluna para `nova_linha`.
+
+        Args:
+            coluna: Coluna da rainha
+            nova_linha: Linha de destino (diferente da atual)
+
+        Returns:
+            conflitos_depois - conflitos_antes
+        """
+        linha = self.linhas[coluna]
+        d = self.n - 1 + coluna
+        return (self._por_linha[nova_linha] - self._por_linha[linha] + 1
+                + self._diag1[d - nova_linha] - self._diag1[d - linha] + 1
+                + self._diag2[coluna + nova_linha] - self._diag2[coluna + linha] + 1)
+
+    def mover(self, coluna: int, nova_linha: int, delta: int = None) -> int:
+        """
+        Move a rainha da coluna para `nova_linha`, atualizando os contadores.
+
+        Args:
+            coluna: Coluna da rainha
+            nova_linha: Linha de destino
+            delta: Delta já calculado (evita recalcular)
+
+        Returns:
+            Linha anterior da rainha
+        """
+        if delta is None:
+            delta = self.delta(coluna, nova_linha)
+        linha = self.linhas[coluna]
+        d = self.n - 1 + coluna
+        self._por_linha[linha] -= 1
+        self._por_linha[nova_linha] += 1
+        self._diag1[d - linha] -= 1
+        self._diag1[d - nova_linha] += 1
+        self._diag2[coluna + linha] -= 1
+        self._diag2[coluna + nova_linha] += 1
+        self.linhas[coluna] = nova_linha
+        self.conflitos += delta
+        if self.log is not None:
+            self.log.append(coluna)
+            self.log.append(nova_linha)
+        return linha
+
+    def melhor_movimento(self, interromper: Optional[Callable[[], bool]] = None) -> Tuple[int, int, int]:
+        """
+        Procura o movimento de menor delta na vizinhança completa.
+
+        Percorre os vizinhos na mesma ordem de `gerar_vizinhos` e, como
+        `encontrar_melhor_vizinho`, fica com o primeiro de menor valor.
+
+        Args:
+            interromper: Consultada a cada coluna; se retornar True a
+                         varredura é abandonada (ver `Orcamento.expirou`)
+
+        Returns:
+            Tupla (delta, coluna, nova_linha); coluna = -1 se interrompida
+        """
+        n = self.n
+        por_linha, diag1, diag2, linhas = self._por_linha, self._diag1, self._diag2, self.linhas
+        melhor = None
+        melhor_coluna = melhor_linha = -1
+
+        for coluna in range(n):
+            if interromper is not None and interromper():
+                return None, -1, -1
+            linha = linhas[coluna]
+            d = n - 1 + coluna
+            # Parte do delta que só depende da posição atual
+            saida = 3 - por_linha[linha] - diag1[d - linha] - diag2[coluna + linha]
+            for nova_linha in range(n):
+                if nova_linha == linha:
+                    continue
+                delta = saida + por_linha[nova_linha] + diag1[d - nova_linha] + diag2[coluna + nova_linha]
+                if melhor is None or delta < melhor:
+                    melhor = delta
+                    melhor_coluna = coluna
+                    melhor_linha = nova_linha
+
+        return melhor, melhor_coluna, melhor_linha
+
+    def melhor_movimento_permitido(self, expiracao: array, iteracao: int,
+                                   delta_aspiracao: int, rng,
+                                   interromper: Optional[Callable[[], bool]] = None) -> Tuple[int, int, int]:
+        """
+        Melhor movimento não tabu (para a busca tabu).
+
+        O movimento (coluna, linha) é tabu enquanto `expiracao[coluna * n + linha]`
+        for maior que `iteracao`; um movimento tabu ainda é aceito (aspiração)
+        se o seu delta for menor que `delta_aspiracao` (isto é, se levar a um
+        estado melhor que o melhor já visto). Os dois testes são O(1). Empates
+        são desfeitos ao acaso com `rng` (amostragem de reservatório).
+
+        Returns:
+            Tupla (delta, coluna, nova_linha); coluna = -1 se todos forem tabu
+            ou se `interromper` pedir a parada (como em `melhor_movimento`)
+        """
+        n = self.n
+        por_linha, diag1, diag2, linhas = self._por_linha, self._diag1, self._diag2, self.linhas
+        melhor = None
+        melhor_coluna = melhor_linha = -1
+        empates = 0
+
+        for coluna in range(n):
+            if interromper is not None and interromper():
+                return None, -1, -1
+            linha = linhas[coluna]
+            d = n - 1 + coluna
+            base = coluna * n
+            saida = 3 - por_linha[linha] - diag1[d - linha] - diag2[coluna + linha]
+            for nova_linha in range(n):
+                if nova_linha == linha:
+                    continue
+                delta = saida + por_linha[nova_linha] + diag1[d - nova_linha] + diag2[coluna + nova_linha]
+                if melhor is not None and delta > melhor:
+                    continue
+                if expiracao[base + nova_linha] > iteracao and delta >= delta_aspiracao:
+                    continue
+                if melhor is None or delta < melhor:
+                    melhor = delta
+                    melhor_coluna = coluna
+                    melhor_linha = nova_linha
+                    empates = 1
+                else:
+                    empates += 1
+                    if rng.randrange(empates) == 0:
+                        melhor_coluna = coluna
+                        melhor_linha = nova_linha
+
+        return melhor, melhor_coluna, melhor_linha
+
+    def e_tabu(self, expiracao: array, iteracao: int, coluna: int, nova_linha: int) -> bool:
+        """Se o movimento devolve a rainha a uma posição ainda proibida."""
+        return expiracao[coluna * self.n + nova_linha] > iteracao
+
+    def proibir_desfazer(self, expiracao: array, coluna: int, nova_linha: int, ate: int):
+        """Antes de mover: proíbe a volta da rainha à linha atual até `ate`."""
+        expiracao[coluna * self.n + self.linhas[coluna]] = ate
+
+    # ------------------------------------------------------------------------
+    # Cópia e conversão
+    # ------------------------------------------------------------------------
+
+    def copiar(self) -> 'Tabuleiro':
+        """Cópia independente (memcpy dos arrays, sem recontar conflitos)."""
+        copia = Tabuleiro.__new__(Tabuleiro)
+        copia.n = self.n
+        copia.linhas = array(self.linhas.typecode, self.linhas)
+        copia._por_linha = array('I', self._por_linha)
+        copia._diag1 = array('I', self._diag1)
+        copia._diag2 = array('I', self._diag2)
+        copia.conflitos = self.conflitos
+        copia.log = None
+        return copia
+
+    def para_lista(self) -> List[int]:
+        return self.linhas.tolist()
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, coluna: int) -> int:
+        return self.linhas[coluna]
+
+    def __iter__(self):
+        return iter(self.linhas)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.para_lista()}, conflitos={self.conflitos})"
+
+
+class TabuleiroPermutacao(Tabuleiro):
+    """
+    Tabuleiro em que as linhas formam uma permutação de 0..n-1.
+
+    Como linhas e colunas nunca se repetem, só as diagonais são contadas. Um
+    movimento (i, j), com i < j, troca as linhas das colunas i e j, o que
+    mantém a permutação; são n(n-1)/2 vizinhos em vez de n(n-1). O delta da
+    troca mexe em 4 casas de cada contador de diagonais e sai em O(1).
+
+    Mesma interface de movimentos do `Tabuleiro`, com (i, j) no lugar de
+    (coluna, nova_linha), então os algoritmos rodam sobre as duas representações.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, estado):
+        n = len(estado)
+        if sorted(estado) != list(range(n)):
+            raise ValueError("O estado não é uma permutação de 0..n-1")
+        self.n = n
+        self.linhas = array(_tipo_array(n), estado)
+        self._por_linha = None
+        self._diag1 = array('I', bytes(4 * (2 * n - 1)))
+        self._diag2 = array('I', bytes(4 * (2 * n - 1)))
+        self.log = None
+
+        for coluna, linha in enumerate(self.linhas):
+            self._diag1[coluna - linha + n - 1] += 1
+            self._diag2[coluna + linha] += 1
+
+        self.conflitos = sum(k * (k - 1) // 2 for contagem in (self._diag1, self._diag2)
+                             for k in contagem)
+
+    @classmethod
+    def aleatorio(cls, n: int, rng) -> 'TabuleiroPermutacao':
+        """Cria uma permutação aleatória (embaralhamento de Fisher–Yates)."""
+        estado = list(range(n))
+        rng.shuffle(estado)
+        return cls(estado)
+
+    # ------------------------------------------------------------------------
+    # Movimentos (troca de duas colunas)
+    # ------------------------------------------------------------------------
+
+    @property
+    def num_vizinhos(self) -> int:
+        """Tamanho da vizinhança (pares de colunas)."""
+        return self.n * (self.n - 1) // 2
+
+    def movimento_aleatorio(self, rng) -> Tuple[int, int]:
+        """Sorteia um par de colunas distintas uniformemente; retorna (i, j) com i < j."""
+        i = rng.randrange(self.n)
+        j = rng.randrange(self.n - 1)
+        if j >= i:
+            j += 1
+        return (i, j) if i < j else (j, i)
+
+    def delta(self, i: int, j: int) -> int:
+        """
+        Variação de conflitos ao trocar as linhas das colunas i e j.
+
+        As diagonais novas nunca coincidem com as antigas (linhas e colunas
+        são distintas), então basta corrigir os casos em que as duas rainhas
+        antigas, ou as duas novas, dividem a mesma diagonal.
+        """
+        linhas, diag1, diag2 = self.linhas, self._diag1, self._diag2
+        ri, rj = linhas[i], linhas[j]
+        d = self.n - 1
+        a, b = i - ri + d, j - rj + d          # diagonais principais antigas
+        c, e = i - rj + d, j - ri + d          # diagonais principais novas
+        f, g = i + ri, j + rj                  # secundárias antigas
+        h, k = i + rj, j + ri                  # secundárias novas
+        return (diag1[c] + diag1[e] + (c == e) - diag1[a] - diag1[b] + 2 + (a == b)
+                + diag2[h] + diag2[k] + (h == k) - diag2[f] - diag2[g] + 2 + (f == g))
+
+    def mover(self, i: int, j: int, delta: int = None) -> int:
+        """
+        Troca as linhas das colunas i e j, atualizando os contadores.
+
+        Returns:
+            Linha anterior da coluna i
+        """
+        if delta is None:
+            delta = self.delta(i, j)
+        linhas, diag1, diag2 = self.linhas, self._diag1, self._diag2
+        ri, rj = linhas[i], linhas[j]
+        d = self.n - 1
+        diag1[i - ri + d] -= 1
+        diag1[j - rj + d] -= 1
+        diag1[i - rj + d] += 1
+        diag1[j - ri + d] += 1
+        diag2[i + ri] -= 1
+        diag2[j + rj] -= 1
+        diag2[i + rj] += 1
+        diag2[j + ri] += 1
+        linhas[i] = rj
+        linhas[j] = ri
+        self.conflitos += delta
+        if self.log is not None:
+            self.log.extend((i, rj, j, ri))
+        return ri
+
+    def melhor_movimento(self, interromper: Optional[Callable[[], bool]] = None) -> Tuple[int, int, int]:
+        """
+        Procura a troca de menor delta (primeira em ordem de (i, j)).
+
+        Returns:
+            Tupla (delta, i, j); i = -1 se `interromper` pedir a parada
+        """
+        n = self.n
+        linhas, diag1, diag2 = self.linhas, self._diag1, self._diag2
+        d = n - 1
+        melhor = None
+        melhor_i = melhor_j = -1
+
+        for i in range(n - 1):
+            if interromper is not None and interromper():
+                return None, -1, -1
+            ri = linhas[i]
+            a, f = i - ri + d, i + ri
+            saida_i = 4 - diag1[a] - diag2[f]
+            for j in range(i + 1, n):
+                # Mesmo cálculo de `delta`, sem a chamada de método
+                rj = linhas[j]
+                b, g = j - rj + d, j + rj
+                c, e = i - rj + d, j - ri + d
+                h, k = i + rj, j + ri
+                valor = (saida_i - diag1[b] - diag2[g] + (a == b) + (f == g)
+                         + diag1[c] + diag1[e] + (c == e) + diag2[h] + diag2[k] + (h == k))
+                if melhor is None or valor < melhor:
+                    melhor = valor
+                    melhor_i = i
+                    melhor_j = j
+
+        return melhor, melhor_i, melhor_j
+
+    def melhor_movimento_permitido(self, expiracao: array, iteracao: int,
+                                   delta_aspiracao: int, rng,
+                                   interromper: Optional[Callable[[], bool]] = None) -> Tuple[int, int, int]:
+        """
+        Melhor troca não tabu (para a busca tabu).
+
+        A troca (i, j) é tabu se levar a linha de j para a coluna i, ou a de i
+        para a coluna j, enquanto essa volta ainda estiver proibida em
+        `expiracao` (mesmo array n*n e mesma aspiração do `Tabuleiro`).
+
+        Returns:
+            Tupla (delta, i, j); i = -1 se todas forem tabu ou se interrompida
+        """
+        n = self.n
+        linhas, diag1, diag2 = self.linhas, self._diag1, self._diag2
+        d = n - 1
+        melhor = None
+        melhor_i = melhor_j = -1
+        empates = 0
+
+        for i in range(n - 1):
+            if interromper is not None and interromper():
+                return None, -1, -1
+            base = i * n
+            ri = linhas[i]
+            a, f = i - ri + d, i + ri
+            saida_i = 4 - diag1[a] - diag2[f]
+            for j in range(i + 1, n):
+                rj = linhas[j]
+                b, g = j - rj + d, j + rj
+                c, e = i - rj + d, j - ri + d
+                h, k = i + rj, j + ri
+                valor = (saida_i - diag1[b] - diag2[g] + (a == b) + (f == g)
+                         + diag1[c] + diag1[e] + (c == e) + diag2[h] + diag2[k] + (h == k))
+                if melhor is not None and valor > melhor:
+                    continue
+                if valor >= delta_aspiracao and (expiracao[base + rj] > iteracao
+                                                 or expiracao[j * n + ri] > iteracao):
+                    continue
+                if melhor is None or valor < melhor:
+                    melhor = valor
+                    melhor_i = i
+                    melhor_j = j
+                    empates = 1
+                else:
+                    empates += 1
+                    if rng.randrange(empates) == 0:
+                        melhor_i = i
+                        melhor_j = j
+
+        return melhor, melhor_i, melhor_j
+
+    def e_tabu(self, expiracao: array, iteracao: int, i: int, j: int) -> bool:
+        n, linhas = self.n, self.linhas
+        return expiracao[i * n + linhas[j]] > iteracao or expiracao[j * n + linhas[i]] > iteracao
+
+    def proibir_desfazer(self, expiracao: array, i: int, j: int, ate: int):
+        n, linhas = self.n, self.linhas
+        expiracao[i * n + linhas[i]] = ate
+        expiracao[j * n + linhas[j]] = ate
+
+    # ------------------------------------------------------------------------
+    # Cópia
+    # ------------------------------------------------------------------------
+
+    def copiar(self) -> 'TabuleiroPermutacao':
+        """Cópia independente (memcpy dos arrays, sem recontar conflitos)."""
+        copia = TabuleiroPermutacao.__new__(TabuleiroPermutacao)
+        copia.n = self.n
+        copia.linhas = array(self.linhas.typecode, self.linhas)
+        copia._por_linha = None
+        copia._diag1 = array('I', self._diag1)
+        copia._diag2 = array('I', self._diag2)
+        copia.conflitos = self.conflitos
+        copia.log = None
+        return copia
+
+
+# Representações aceitas pelo parâmetro `representacao` dos algoritmos
+REPRESENTACOES = {
+    'linhas': Tabuleiro,
+    'permutacao': TabuleiroPermutacao,
+}
+
+
+def tabuleiro_aleatorio(representacao: str, n: int, rng) -> Tabuleiro:
+    """
+    Cria o tabuleiro inicial na representação pedida.
+
+    Args:
+        representacao: 'linhas' (uma rainha por coluna, linhas livres) ou
+                       'permutacao' (uma rainha por linha e por coluna)
+        n: Tamanho do tabuleiro
+        rng: Gerador (random.Random)
+    """
+    try:
+        classe = REPRESENTACOES[representacao]
+    except KeyError:
+        raise ValueError(f"Representação desconhecida: {representacao!r}. "
+                         f"Opções: {', '.join(REPRESENTACOES)}") from None
+    return classe.aleatorio(n, rng)
+
+
+class MelhorEstado:
+    """
+    Acompanha o melhor estado de um Tabuleiro por log de movimentos.
+
+    Em vez de copiar o tabuleiro a cada melhora, guarda uma base (cópia
+    compacta das linhas) e os movimentos aplicados desde ela; o melhor estado
+    é a base mais os movimentos até a `marca`. Se o log passar de n movimentos
+    depois da marca, ele é descartado e a próxima melhora volta a tirar um
+    snapshot. Assim o custo amortizado por movimento é O(1) e o melhor estado
+    nunca custa mais que uma cópia a cada n movimentos.
+    """
+
+    __slots__ = ('tabuleiro', 'base', 'marca', 'conflitos', '_limite')
+
+    def __init__(self, tabuleiro: Tabuleiro):
+        self.tabuleiro = tabuleiro
+        self._limite = 2 * max(tabuleiro.n, 8)
+        self.base = array(tabuleiro.linhas.typecode, tabuleiro.linhas)
+        self.marca = 0
+        self.conflitos = tabuleiro.conflitos
+        tabuleiro.log = array('I')
+
+    def registrar(self):
+        """Marca o estado atual do tabuleiro como o melhor até agora."""
+        tabuleiro = self.tabuleiro
+        self.conflitos = tabuleiro.conflitos
+        if tabuleiro.log is None or len(tabuleiro.log) > self._limite:
+            # Log descartado ou longo demais: snapshot direto (memcpy)
+            self.base = array(tabuleiro.linhas.typecode, tabuleiro.linhas)
+            tabuleiro.log = array('I')
+            self.marca = 0
+        else:
+            self.marca = len(tabuleiro.log)
+
+    def observar(self):
+        """Descarta o log quando os movimentos após a marca excedem o limite."""
+        log = self.tabuleiro.log
+        if log is not None and len(log) - self.marca > self._limite:
+            # Incorpora os movimentos até a marca na base e para de registrar
+            for i in range(0, self.marca, 2):
+                self.base[log[i]] = log[i + 1]
+            self.marca = 0
+            self.tabuleiro.log = None
+
+    def estado(self) -> List[int]:
+        """Reconstrói o melhor estado como lista."""
+        estado = array(self.base.typecode, self.base)
+        log = self.tabuleiro.log
+        for i in range(0, self.marca, 2):
+            estado[log[i]] = log[i + 1]
+        return estado.tolist()
+
+    def encerrar(self) -> List[int]:
+        """Reconstrói o melhor estado e desliga o log do tabuleiro."""
+        estado = self.estado()
+        self.tabuleiro.log = None
+        return estado
@@ -0,0 +1,158 @@
+"""
+Benchmark do tempo de inicialização dos pontos de entrada (python -X importtime).
+
+Cada módulo é importado em um interpretador novo, várias vezes (mediana), e a
+saída do `-X importtime` dá o tempo acumulado de cada import. Também serve de
+gate: sai com código 1 se algum módulo pesado for carregado só pelo import do
+ponto de entrada (numpy, matplotlib e psutil devem ser importados dentro das
+funções que os usam), ou se a mediana passar de --limite-ms.
+Contraparte: Trabalho01/src/startup_benchmark.py.
+
+Uso:
+    python tempo_inicializacao.py
+    python tempo_inicializacao.py --modulos eight_queens --limite-ms 100
+
+Autor: Matheus Emanuel
+Disciplina: Inteligência Artificial - CEFET-MG
+Data: 2025
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+PONTOS_DE_ENTRADA = ['eight_queens', 'experimentos', 'benchmark', 'hill_climbing',
+                     'solucao_exata', 'comparar_execucoes', 'perfilamento']
+
+# Só podem ser carregados quando usados
+MODULOS_PESADOS = ['numpy', 'matplotlib', 'psutil', 'pandas', 'scipy']
+
+
+# ============================================================================
+# MEDIÇÃO
+# ============================================================================
+
+def ler_importtime(saida: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Interpreta a saída de `-X importtime`.
+
+    As linhas vêm em pós-ordem: os imports feitos por um módulo aparecem antes
+    dele, com um nível a mais de indentação.
+
+    Returns:
+        Lista de (módulo, próprio_us, acumulado_us, profundidade), na ordem da saída
+    """
+    imports = []
+    for linha in saida.splitlines():
+        if not linha.startswith('import time:') or 'imported package' in linha:
+            continue
+        proprio, acumulado, nome = linha[len('import time:'):].split('|')
+        profundidade = (len(nome) - len(nome.lstrip(' '))) // 2
+        imports.append((nome.strip(), int(proprio), int(acumulado), profundidade))
+    return imports
+
+
+def medir_ponto_de_entrada(modulo: str, execucoes: int = 5, diretorio: str = None):
+    """
+    Importa o módulo em processos novos.
+
+    Returns:
+        (mediana do import em µs, mediana do processo em s, imports da última execução)
+    """
+    tempos_import = []
+    tempos_processo = []
+    imports = []
+    for _ in range(execucoes):
+        inicio = time.perf_counter()
+        processo = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+                                  cwd=diretorio, capture_output=True, text=True)
+        tempos_processo.append(time.perf_counter() - inicio)
+        if processo.returncode != 0:
+            raise RuntimeError(f"Falha ao importar {modulo}:\n{processo.stderr}")
+        imports = ler_importtime(processo.stderr)
+        tempos_import.append(next(acumulado for nome, _, acumulado, profundidade in imports
+                                  if nome == modulo and profundidade == 0))
+    return statistics.median(tempos_import), statistics.median(tempos_processo), imports
+
+
+def medir_interpretador(execucoes: int = 5) -> float:
+    """Mediana (s) de um processo que não importa nada (custo fixo do interpretador)."""
+    tempos = []
+    for _ in range(execucoes):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos)
+
+
+def imports_mais_caros(imports, modulo: str, quantidade: int = 5) -> List[Tuple[int, str]]:
+    """
+    Imports diretos do módulo, do mais caro ao mais barato.
+
+    São as entradas de profundidade 1 logo antes da linha do próprio módulo
+    (até a entrada de profundidade 0 anterior).
+    """
+    fim = next(i for i, (nome, _, _, profundidade) in enumerate(imports)
+               if nome == modulo and profundidade == 0)
+    filhos = []
+    for nome, _, acumulado, profundidade in reversed(imports[:fim]):
+        if profundidade == 0:
+            break
+        if profundidade == 1:
+            filhos.append((acumulado, nome))
+    return sorted(filhos, reverse=True)[:quantidade]
+
+
+# ============================================================================
+# EXECUÇÃO PRINCIPAL
+# ============================================================================
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Tempo de inicialização dos pontos de entrada (-X importtime)")
+    parser.add_argument('--modulos', nargs='+', default=PONTOS_DE_ENTRADA, help="Módulos a importar")
+    parser.add_argument('--execucoes', type=int, default=5, help="Execuções por módulo (mediana)")
+    parser.add_argument('--mostrar', type=int, default=5, help="Quantos imports mais caros mostrar")
+    parser.add_argument('--limite-ms', type=float, default=None,
+                        help="Falha se a mediana de import de algum módulo passar disto")
+    parser.add_argument('--permitir', nargs='*', default=[],
+                        help="Módulos pesados permitidos na importação")
+    args = parser.parse_args(argv)
+
+    diretorio = os.path.dirname(os.path.abspath(__file__))
+    proibidos = [nome for nome in MODULOS_PESADOS if nome not in args.permitir]
+    falhas = []
+
+    tempo_interpretador = medir_interpretador(args.execucoes)
+    print(f"\nInterpretador vazio: {tempo_interpretador * 1000:.1f} ms")
+    print(f"{'='*80}")
+    print(f"{'Módulo':<20} {'Import (ms)':>12} {'Processo (ms)':>14}   Imports mais caros")
+    print(f"{'-'*80}")
+
+    for modulo in args.modulos:
+        import_us, processo, imports = medir_ponto_de_entrada(modulo, args.execucoes, diretorio)
+        caros = ', '.join(f"{nome} {acumulado / 1000:.1f}"
+                          for acumulado, nome in imports_mais_caros(imports, modulo, args.mostrar))
+        print(f"{modulo:<20} {import_us / 1000:>12.1f} {processo * 1000:>14.1f}   {caros}")
+
+        nomes = {nome for nome, _, _, _ in imports}
+        carregados = [nome for nome in proibidos if nome in nomes]
+        if carregados:
+            falhas.append(f"{modulo} carrega {', '.join(carregados)} na importação")
+        if args.limite_ms is not None and import_us / 1000 > args.limite_ms:
+            falhas.append(f"{modulo} leva {import_us / 1000:.1f} ms (limite {args.limite_ms} ms)")
+
+    print(f"{'='*80}")
+    if falhas:
+        for falha in falhas:
+            print(f"✗ {falha}")
+        sys.exit(1)
+    print("✓ Nenhum módulo pesado carregado na inicialização")
+
+
+if __name__ == "__main__":
+    main()
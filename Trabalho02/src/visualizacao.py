@@ -1,23 +1,93 @@
-import matplotlib.pyplot as plt
-import numpy as np
-from matplotlib.patches import Rectangle
+import argparse
+import hashlib
+import json
+import math
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import matplotlib
+import matplotlib.style
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import NullLocator, ScalarFormatter
+
+from estatisticas import ler_jsonl, resumir_por_grupo, resumir_resultados
+
+# Os gráficos usam a API orientada a objetos (Figure + canvas Agg), sem o
+# estado global do pyplot: não depende do backend interativo e pode rodar em
+# paralelo em processos separados.
+#
+# Os gráficos só recebem resumos (contagens, quantis, histogramas) vindos das
+# estatísticas em fluxo, nunca a lista de resultados: o custo de desenhar
+# não depende do número de execuções, e um estudo de 10⁶ execuções pode ser
+# lido do JSONL em uma passada (python visualizacao.py resultados.jsonl).
 
+# Mudar quando o desenho mudar, para invalidar os hashes já gravados
+VERSAO_GRAFICOS = 3
 
+ESTILO = 'seaborn-v0_8-darkgrid'
+PARAMETROS_ESTILO = {
+    'figure.figsize': (15, 5),
+    'font.size': 10,
+    'axes.titlesize': 12,
+    'axes.labelsize': 11,
+}
+
+
+@contextmanager
 def configurar_estilo():
 
-    plt.style.use('seaborn-v0_8-darkgrid')
-    plt.rcParams['figure.figsize'] = (15, 5)
-    plt.rcParams['font.size'] = 10
-    plt.rcParams['axes.titlesize'] = 12
-    plt.rcParams['axes.labelsize'] = 11
+    # Estilo só durante o desenho (não altera o rcParams de quem chamou)
+    with matplotlib.style.context(ESTILO), matplotlib.rc_context(PARAMETROS_ESTILO):
+        yield
+
+
+# Cores dos 4 algoritmos originais; os demais seguem a paleta tab10
+CORES_BASE = ['#ff6b6b', '#ffd93d', '#6bcf7f', '#4ecdc4']
+
+# Marcadores alternados para distinguir pontos sobrepostos no gráfico de dispersão
+MARCADORES = ['o', 's', 'D', '^', 'v', 'P', 'X', '*']
+
+# Acima disso o gráfico de dispersão usa legenda em vez de anotar cada ponto
+MAX_ANOTACOES = 8
+
+# Nomes curtos para as anotações (por trecho do nome de exibição)
+NOMES_CURTOS = [
+    ('Restart', 'Random-Restart'),
+    ('Vetorizado', 'SA Vetorizado'),
+    ('Annealing', 'Simul. Annealing'),
+    ('Laterais', 'HC Laterais'),
+    ('Básico', 'HC Básico'),
+    ('Tabu', 'Busca Tabu'),
+    ('Genético', 'Genético'),
+]
+
+
+def obter_cores(quantidade):
+
+    cores = list(CORES_BASE)
+    paleta = matplotlib.colormaps['tab10']
+    i = 0
+    while len(cores) < quantidade:
+        cores.append(paleta(i % 10))
+        i += 1
+    return cores[:quantidade]
+
+
+def nome_curto(nome):
 
+    for trecho, curto in NOMES_CURTOS:
+        if trecho in nome:
+            return curto
+    return nome
 
-def criar_diretorio_graficos():
 
-    caminho = os.path.join('..', 'data')
-    if not os.path.exists(caminho):
-        os.makedirs(caminho)
+def criar_diretorio_graficos(caminho=None):
+
+    caminho = caminho or os.path.join('..', 'data')
+    os.makedirs(caminho, exist_ok=True)
     return caminho
 
 
@@ -26,18 +96,21 @@ def grafico_taxa_sucesso(ax, dados):
     algoritmos = list(dados.keys())
     taxas = [dados[alg]['taxa_sucesso'] for alg in algoritmos]
     
-    # Cores para cada algoritmo (4 algoritmos)
-    cores = ['#ff6b6b', '#ffd93d', '#6bcf7f', '#4ecdc4']
+    # Uma cor por algoritmo
+    cores = obter_cores(len(algoritmos))
     
     # Cria barras horizontais
     y_pos = np.arange(len(algoritmos))
-    barras = ax.barh(y_pos, taxas, color=cores[:len(algoritmos)], alpha=0.8, edgecolor='black', linewidth=1.5)
+    barras = ax.barh(y_pos, taxas, color=cores, alpha=0.8, edgecolor='black', linewidth=1.5)
     
     # Configurações
     ax.set_yticks(y_pos)
     ax.set_yticklabels(algoritmos, fontsize=10)
     ax.set_xlabel('Taxa de Sucesso (%)', fontsize=11, fontweight='bold')
-    ax.set_title('🏆 Taxa de Sucesso dos Algoritmos (10 execuções)', 
+    # Número de execuções no título (quando é o mesmo para todos)
+    execucoes = {dados[alg]['execucoes'] for alg in algoritmos}
+    sufixo = f' ({execucoes.pop()} execuções)' if len(execucoes) == 1 else ''
+    ax.set_title(f'🏆 Taxa de Sucesso dos Algoritmos{sufixo}', 
                  fontsize=13, fontweight='bold', pad=15)
     ax.set_xlim(0, 105)
     
@@ -77,13 +150,12 @@ def grafico_tempo_vs_sucesso(ax, dados):
     tempos = [dados[alg]['tempo_medio'] * 1000 for alg in algoritmos]  # Converte para ms
     taxas = [dados[alg]['taxa_sucesso'] for alg in algoritmos]
     
-    # Cores e tamanhos (4 algoritmos)
-    cores = ['#ff6b6b', '#ffd93d', '#6bcf7f', '#4ecdc4']
-    tamanhos = [200, 300, 400, 350]  # Tamanhos diferentes para destacar
+    # Uma cor por algoritmo; os marcadores se alternam para destacar pontos sobrepostos
+    cores = obter_cores(len(algoritmos))
     
     # Scatter plot
     for i, (alg, tempo, taxa) in enumerate(zip(algoritmos, tempos, taxas)):
-        ax.scatter(tempo, taxa, s=tamanhos[i], c=[cores[i]], 
+        ax.scatter(tempo, taxa, s=250, c=[cores[i]], marker=MARCADORES[i % len(MARCADORES)],
                   alpha=0.7, edgecolors='black', linewidth=2, label=alg)
     
     # Configurações
@@ -101,62 +173,44 @@ def grafico_tempo_vs_sucesso(ax, dados):
     ax.axhline(y=50, color='orange', linestyle='--', linewidth=1, alpha=0.3)
     ax.text(max(tempos) + 0.5, 102, 'Ideal', fontsize=9, color='green')
     
-    # Anotações nos pontos
-    for i, (alg, tempo, taxa) in enumerate(zip(algoritmos, tempos, taxas)):
-        # Nome do algoritmo (abreviado)
-        if 'Restart' in alg:
-            nome_curto = 'Random-Restart'
-        elif 'Annealing' in alg:
-            nome_curto = 'Simul. Annealing'
-        elif 'Laterais' in alg:
-            nome_curto = 'HC Laterais'
-        else:
-            nome_curto = 'HC Básico'
-            
-        ax.annotate(nome_curto, 
-                   xy=(tempo, taxa), 
-                   xytext=(10, 10),
-                   textcoords='offset points',
-                   fontsize=9,
-                   fontweight='bold',
-                   bbox=dict(boxstyle='round,pad=0.5', facecolor=cores[i], alpha=0.3),
-                   arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0', lw=1.5))
+    # Anotações nos pontos (com muitos algoritmos, legenda)
+    if len(algoritmos) > MAX_ANOTACOES:
+        ax.legend(loc='lower right', fontsize=8, ncol=2)
+    else:
+        for i, (alg, tempo, taxa) in enumerate(zip(algoritmos, tempos, taxas)):
+            # Nome do algoritmo (abreviado)
+            ax.annotate(nome_curto(alg), 
+                       xy=(tempo, taxa), 
+                       xytext=(10, 10),
+                       textcoords='offset points',
+                       fontsize=9,
+                       fontweight='bold',
+                       bbox=dict(boxstyle='round,pad=0.5', facecolor=cores[i], alpha=0.3),
+                       arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0', lw=1.5))
     
     # Grid
     ax.grid(True, alpha=0.3, linestyle='--')
     ax.set_axisbelow(True)
 
 
-
-
-def grafico_barras_iteracoes(ax, dados_completos):
+def grafico_barras_iteracoes(ax, dados):
     """
     Gráfico de barras agrupadas mostrando min, média e max de iterações.
     Alternativa ao boxplot para dados com escalas muito diferentes.
     """
-    algoritmos = list(dados_completos.keys())
-    
-    # Prepara dados
-    minimos = []
-    medias = []
-    maximos = []
+    algoritmos = list(dados.keys())
     
-    for alg in algoritmos:
-        iteracoes = []
-        for resultado in dados_completos[alg]:
-            iter_valor = resultado.get('iteracoes', resultado.get('iteracoes_total', 0))
-            iteracoes.append(iter_valor)
-        
-        minimos.append(min(iteracoes))
-        medias.append(np.mean(iteracoes))
-        maximos.append(max(iteracoes))
+    # Dados já resumidos (ver resumir_para_graficos)
+    minimos = [dados[alg]['iteracoes_min'] for alg in algoritmos]
+    medias = [dados[alg]['iteracoes_media'] for alg in algoritmos]
+    maximos = [dados[alg]['iteracoes_max'] for alg in algoritmos]
     
     # Posições das barras
     x = np.arange(len(algoritmos))
     largura = 0.25
     
     # Cores
-    cores = ['#ff6b6b', '#ffd93d', '#6bcf7f', '#4ecdc4']
+    cores = obter_cores(len(algoritmos))
     
     # Cria barras agrupadas
     bars1 = ax.bar(x - largura, minimos, largura, label='Mínimo', 
@@ -189,51 +243,380 @@ def grafico_barras_iteracoes(ax, dados_completos):
     ax.legend(loc='upper left', fontsize=9)
 
 
-def gerar_graficos(resultados_todos):
+def grafico_distribuicao_iteracoes(ax, dados):
+    """
+    Boxplot das iterações montado a partir dos quantis (sem as amostras).
 
-    # Configura estilo
-    configurar_estilo()
-    
-    # Prepara dados resumidos
-    dados_resumidos = {}
+    Caixa do 1º ao 3º quartil com a mediana; bigodes do mínimo ao percentil
+    99; o máximo aparece como ponto isolado.
+    """
+    algoritmos = list(dados.keys())
+    cores = obter_cores(len(algoritmos))
+
+    estatisticas = [{
+        'label': nome_curto(alg),
+        'whislo': dados[alg]['iteracoes_min'],
+        'q1': dados[alg]['iteracoes_q1'],
+        'med': dados[alg]['iteracoes_mediana'],
+        'q3': dados[alg]['iteracoes_q3'],
+        'whishi': dados[alg]['iteracoes_p99'],
+        'fliers': [dados[alg]['iteracoes_max']],
+    } for alg in algoritmos]
+
+    caixas = ax.bxp(estatisticas, patch_artist=True, showfliers=True,
+                    medianprops=dict(color='black', linewidth=2),
+                    flierprops=dict(marker='x', markersize=6))
+    for caixa, cor in zip(caixas['boxes'], cores):
+        caixa.set_facecolor(cor)
+        caixa.set_alpha(0.7)
+
+    # Configurações
+    ax.set_ylabel('Número de Iterações (escala log)', fontsize=11, fontweight='bold')
+    ax.set_title('Distribuição de Iterações (quartis, P99 e máximo)',
+                 fontsize=13, fontweight='bold', pad=15)
+    ax.set_yscale('log')
+    ax.tick_params(axis='x', labelrotation=15, labelsize=9)
+
+    # Grid
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+    ax.set_axisbelow(True)
+
+
+def grafico_histograma_iteracoes(ax, dados):
+    """
+    Histogramas das iterações (classes logarítmicas) sobrepostos em degraus.
+
+    Cada algoritmo é normalizado pelo seu número de execuções, então algoritmos
+    executados um número diferente de vezes continuam comparáveis.
+    """
+    algoritmos = list(dados.keys())
+    cores = obter_cores(len(algoritmos))
+
+    for alg, cor in zip(algoritmos, cores):
+        classes = dados[alg]['iteracoes_histograma']
+        total = dados[alg]['execucoes']
+        if not classes or not total:
+            continue
+        bordas = [classes[0][0]] + [fim for _, fim, _ in classes]
+        fracoes = [contagem / total * 100 for _, _, contagem in classes]
+        ax.stairs(fracoes, bordas, color=cor, linewidth=2, label=nome_curto(alg))
+
+    # Configurações
+    ax.set_xscale('log')
+    ax.set_xlabel('Número de Iterações (escala log)', fontsize=11, fontweight='bold')
+    ax.set_ylabel('Execuções (%)', fontsize=11, fontweight='bold')
+    ax.set_title('Histograma de Iterações', fontsize=13, fontweight='bold', pad=15)
+
+    # Grid e legenda
+    ax.grid(True, alpha=0.3, linestyle='--')
+    ax.set_axisbelow(True)
+    ax.legend(loc='upper right', fontsize=8, ncol=1 + len(algoritmos) // 8)
+
+
+def ajustar_expoente(xs, ys):
+    """
+    Inclinação da reta de mínimos quadrados em log–log (y ≈ c · xᵏ → k).
+
+    Pontos não positivos são ignorados; com menos de dois, devolve NaN.
+    """
+    pontos = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len(pontos) < 2:
+        return math.nan
+    media_x = sum(x for x, _ in pontos) / len(pontos)
+    media_y = sum(y for _, y in pontos) / len(pontos)
+    sxx = sum((x - media_x) ** 2 for x, _ in pontos)
+    if sxx == 0:
+        return math.nan
+    return sum((x - media_x) * (y - media_y) for x, y in pontos) / sxx
+
+
+def grafico_escalabilidade(ax, dados):
+    """
+    Mediana de uma métrica em função de n, em eixos log–log.
+
+    A faixa sombreada vai do 1º ao 3º quartil, e a legenda traz o expoente k
+    do ajuste y ∝ nᵏ.
+    """
+    series = dados['series']
+    algoritmos = list(series.keys())
+    cores = obter_cores(len(algoritmos))
+
+    for i, (alg, cor) in enumerate(zip(algoritmos, cores)):
+        serie = series[alg]
+        expoente = ajustar_expoente(serie['n'], serie['mediana'])
+        rotulo = nome_curto(alg) if math.isnan(expoente) else f'{nome_curto(alg)} (∝ n^{expoente:.2f})'
+        ax.plot(serie['n'], serie['mediana'], color=cor, marker=MARCADORES[i % len(MARCADORES)],
+                linewidth=2, label=rotulo)
+        ax.fill_between(serie['n'], serie['q1'], serie['q3'], color=cor, alpha=0.2)
+
+    # Configurações (marcas do eixo x nos próprios valores de n)
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    tamanhos = sorted({n for serie in series.values() for n in serie['n']})
+    ax.set_xticks(tamanhos)
+    ax.xaxis.set_major_formatter(ScalarFormatter())
+    ax.xaxis.set_minor_locator(NullLocator())
+    ax.set_xlabel(dados['rotulo_x'], fontsize=11, fontweight='bold')
+    ax.set_ylabel(dados['rotulo_y'], fontsize=11, fontweight='bold')
+    ax.set_title(f"Escalabilidade: {dados['rotulo_y']} (log–log)",
+                 fontsize=13, fontweight='bold', pad=15)
+
+    # Grid e legenda
+    ax.grid(True, which='both', alpha=0.3, linestyle='--')
+    ax.set_axisbelow(True)
+    ax.legend(loc='upper left', fontsize=8, ncol=1 + len(algoritmos) // 8)
+
+
+# (arquivo, função de desenho, campos usados) de cada gráfico; só os campos
+# usados entram no hash, então mudar as iterações não redesenha o gráfico 1
+GRAFICOS = [
+    ('grafico_01_taxa_sucesso.png', grafico_taxa_sucesso, ('taxa_sucesso', 'execucoes')),
+    ('grafico_02_tempo_vs_sucesso.png', grafico_tempo_vs_sucesso, ('taxa_sucesso', 'tempo_medio')),
+    ('grafico_03_barras_iteracoes.png', grafico_barras_iteracoes,
+     ('iteracoes_min', 'iteracoes_media', 'iteracoes_max')),
+    ('grafico_04_distribuicao_iteracoes.png', grafico_distribuicao_iteracoes,
+     ('iteracoes_min', 'iteracoes_q1', 'iteracoes_mediana', 'iteracoes_q3', 'iteracoes_p99',
+      'iteracoes_max')),
+    ('grafico_05_histograma_iteracoes.png', grafico_histograma_iteracoes,
+     ('iteracoes_histograma', 'execucoes')),
+]
+
+# Métricas dos gráficos de escalabilidade: campo → rótulo do eixo
+METRICAS_ESCALABILIDADE = {
+    'tempo': 'Tempo (s)',
+    'avaliacoes': 'Avaliações',
+    'iteracoes': 'Iterações',
+}
+
+
+def resumir_para_graficos(resultados_todos):
+    """
+    Reduz os resultados ao que os gráficos desenham.
+
+    Aceita listas de resultados ou ResumoAlgoritmo; o dicionário devolvido é
+    pequeno, serializável (vai para os processos) e é o que entra no hash.
+    """
+    dados = {}
     for nome, resultados in resultados_todos.items():
-        sucessos = sum([r['sucesso'] for r in resultados])
-        taxa_sucesso = (sucessos / len(resultados)) * 100
-        tempo_medio = np.mean([r['tempo'] for r in resultados])
-        
-        dados_resumidos[nome] = {
-            'taxa_sucesso': taxa_sucesso,
-            'tempo_medio': tempo_medio
+        resumo = resumir_resultados(resultados, nome)
+        iteracoes = resumo['iteracoes']
+        dados[nome] = {
+            'execucoes': resumo.execucoes,
+            'taxa_sucesso': resumo.taxa_sucesso,
+            'tempo_medio': resumo['tempo'].media,
+            'iteracoes_min': iteracoes.minimo,
+            'iteracoes_q1': iteracoes.quantil(0.25),
+            'iteracoes_mediana': iteracoes.mediana,
+            'iteracoes_media': iteracoes.media,
+            'iteracoes_q3': iteracoes.quantil(0.75),
+            'iteracoes_p99': iteracoes.quantil(0.99),
+            'iteracoes_max': iteracoes.maximo,
+            'iteracoes_histograma': iteracoes.histograma.classes(),
         }
-    
-    caminho_graficos = criar_diretorio_graficos()
-    
-    # Gráfico 1: Taxa de Sucesso
-    
-    fig1, ax1 = plt.subplots(figsize=(10, 6))
-    grafico_taxa_sucesso(ax1, dados_resumidos)
-    plt.tight_layout()
-    caminho1 = os.path.join(caminho_graficos, 'grafico_01_taxa_sucesso.png')
-    plt.savefig(caminho1, dpi=300, bbox_inches='tight')
-    print(f"      ✅ Salvo: {caminho1}")
-    plt.close(fig1)
-    
-    # Gráfico 2: Tempo vs Taxa de Sucesso
-    
-    fig2, ax2 = plt.subplots(figsize=(10, 6))
-    grafico_tempo_vs_sucesso(ax2, dados_resumidos)
-    plt.tight_layout()
-    caminho2 = os.path.join(caminho_graficos, 'grafico_02_tempo_vs_sucesso.png')
-    plt.savefig(caminho2, dpi=300, bbox_inches='tight')
-    print(f"      ✅ Salvo: {caminho2}")
-    plt.close(fig2)
-    
-    # Gráfico 3: Barras Agrupadas de Iterações (Min/Média/Max)
-    
-    fig3, ax3 = plt.subplots(figsize=(10, 6))
-    grafico_barras_iteracoes(ax3, resultados_todos)
-    plt.tight_layout()
-    caminho3 = os.path.join(caminho_graficos, 'grafico_03_barras_iteracoes.png')
-    plt.savefig(caminho3, dpi=300, bbox_inches='tight')
-    print(f"      ✅ Salvo: {caminho3}")
-    plt.close(fig3)
\ No newline at end of file
+    return dados
+
+
+def resumir_escalabilidade(resumos, metrica='tempo'):
+    """
+    Séries (n, quartis) de uma métrica por algoritmo.
+
+    Args:
+        resumos: {(algoritmo, n): ResumoAlgoritmo}, como devolvido por
+                 `resumir_por_grupo(..., ('algoritmo', 'n'))`
+        metrica: Campo dos resultados (ver METRICAS_ESCALABILIDADE)
+    """
+    series = {}
+    for (nome, n), resumo in sorted(resumos.items(), key=lambda item: (str(item[0][0]), item[0][1])):
+        if metrica not in resumo:
+            continue
+        valores = resumo[metrica]
+        serie = series.setdefault(nome, {'n': [], 'q1': [], 'mediana': [], 'q3': []})
+        serie['n'].append(n)
+        serie['q1'].append(valores.quantil(0.25))
+        serie['mediana'].append(valores.mediana)
+        serie['q3'].append(valores.quantil(0.75))
+    return {
+        'rotulo_x': 'Tamanho do tabuleiro (n)',
+        'rotulo_y': METRICAS_ESCALABILIDADE.get(metrica, metrica),
+        'series': series,
+    }
+
+
+def hash_grafico(funcao, dados, dpi):
+
+    conteudo = json.dumps([VERSAO_GRAFICOS, funcao.__name__, dpi, dados],
+                          ensure_ascii=False, default=float)
+    return hashlib.sha256(conteudo.encode('utf-8')).hexdigest()
+
+
+def _caminho_hash(caminho):
+    return caminho + '.sha256'
+
+
+def grafico_atualizado(caminho, assinatura):
+
+    # O PNG existe e foi gerado a partir dos mesmos dados?
+    try:
+        with open(_caminho_hash(caminho), encoding='utf-8') as arquivo:
+            return arquivo.read().strip() == assinatura and os.path.exists(caminho)
+    except OSError:
+        return False
+
+
+def renderizar_grafico(tarefa):
+
+    # Roda no worker: desenha uma figura e grava o PNG e depois o hash
+    funcao, dados, caminho, dpi, assinatura = tarefa
+    with configurar_estilo():
+        # Mais alto quando há muitos algoritmos (rótulos das barras horizontais)
+        fig = Figure(figsize=(10, max(6, 2 + 0.35 * len(dados))))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+        funcao(ax, dados)
+        # tight_layout uma vez, em vez de bbox_inches='tight' (que desenha a figura de novo)
+        fig.tight_layout()
+        temporario = caminho + '.tmp.png'
+        fig.savefig(temporario, dpi=dpi)
+    os.replace(temporario, caminho)
+    with open(_caminho_hash(caminho), 'w', encoding='utf-8') as arquivo:
+        arquivo.write(assinatura + '\n')
+    return caminho
+
+
+def _tarefa_grafico(funcao, dados, caminho, dpi, forcar):
+
+    # Tarefa de desenho, ou None se o PNG já corresponde aos dados
+    assinatura = hash_grafico(funcao, dados, dpi)
+    if not forcar and grafico_atualizado(caminho, assinatura):
+        print(f"      ⏭️  Sem mudanças: {caminho}")
+        return None
+    return (funcao, dados, caminho, dpi, assinatura)
+
+
+def _renderizar_tarefas(tarefas, processos=None, executor=None):
+
+    if processos is None:
+        processos = min(len(tarefas), os.cpu_count() or 1)
+    if executor is not None and tarefas:
+        gerados = list(executor.map(renderizar_grafico, tarefas))
+    elif processos > 1 and len(tarefas) > 1:
+        with ProcessPoolExecutor(max_workers=processos) as pool:
+            gerados = list(pool.map(renderizar_grafico, tarefas))
+    else:
+        gerados = [renderizar_grafico(tarefa) for tarefa in tarefas]
+
+    for caminho in gerados:
+        print(f"      ✅ Salvo: {caminho}")
+    return gerados
+
+
+def gerar_graficos(resultados_todos, diretorio=None, dpi=300, processos=None, forcar=False,
+                   executor=None):
+    """
+    Gera os gráficos de comparação.
+
+    Cada PNG ganha um arquivo `.sha256` com o hash dos dados resumidos; se o
+    hash não mudou, o gráfico não é redesenhado. Os gráficos que faltam são
+    desenhados em paralelo, um por processo.
+
+    Args:
+        resultados_todos: {nome: lista de resultados ou ResumoAlgoritmo};
+                          qualquer número de algoritmos
+        diretorio: Pasta de saída (padrão: ../data)
+        dpi: Resolução dos PNGs
+        processos: Workers (None = um por gráfico, limitado pelos núcleos;
+                   1 = tudo no processo atual)
+        forcar: Redesenha mesmo sem mudança nos dados
+        executor: Pool já aberto (ex.: para gerar relatórios de vários
+                  experimentos sem recriar os processos); ignora `processos`
+
+    Returns:
+        Lista com os caminhos dos gráficos redesenhados
+    """
+    dados = resumir_para_graficos(resultados_todos)
+    caminho_graficos = criar_diretorio_graficos(diretorio)
+
+    tarefas = []
+    for arquivo, funcao, campos in GRAFICOS:
+        dados_grafico = {nome: {campo: valores[campo] for campo in campos}
+                         for nome, valores in dados.items()}
+        tarefa = _tarefa_grafico(funcao, dados_grafico, os.path.join(caminho_graficos, arquivo),
+                                 dpi, forcar)
+        if tarefa is not None:
+            tarefas.append(tarefa)
+    return _renderizar_tarefas(tarefas, processos, executor)
+
+
+def gerar_graficos_escalabilidade(resumos, diretorio=None, metricas=('tempo',), dpi=300,
+                                  processos=None, forcar=False, executor=None):
+    """
+    Gera um gráfico log–log por métrica (`escalabilidade_<metrica>.png`).
+
+    Args:
+        resumos: {(algoritmo, n): ResumoAlgoritmo} (ver `resumir_por_grupo`)
+        diretorio, dpi, processos, forcar, executor: Como em `gerar_graficos`
+        metricas: Campos dos resultados (ex.: 'tempo', 'avaliacoes')
+
+    Returns:
+        Lista com os caminhos dos gráficos redesenhados
+    """
+    caminho_graficos = criar_diretorio_graficos(diretorio)
+    tarefas = []
+    for metrica in metricas:
+        dados = resumir_escalabilidade(resumos, metrica)
+        if not dados['series']:
+            continue
+        tarefa = _tarefa_grafico(grafico_escalabilidade, dados,
+                                 os.path.join(caminho_graficos, f'escalabilidade_{metrica}.png'),
+                                 dpi, forcar)
+        if tarefa is not None:
+            tarefas.append(tarefa)
+    return _renderizar_tarefas(tarefas, processos, executor)
+
+
+def graficos_de_jsonl(caminho_jsonl, diretorio=None, metricas=('tempo',), **opcoes):
+    """
+    Gera todos os gráficos a partir de um JSONL de resultados, em uma passada.
+
+    Os resultados são agrupados por ('algoritmo', 'n') sem serem guardados. Com
+    um único n, os gráficos de comparação vão para `diretorio`; com vários, vão
+    para `diretorio/n<valor>` e os de escalabilidade para `diretorio`.
+
+    Returns:
+        Lista com os caminhos dos gráficos redesenhados
+    """
+    resumos = resumir_por_grupo(ler_jsonl(caminho_jsonl), ('algoritmo', 'n'))
+    diretorio = criar_diretorio_graficos(diretorio)
+    tamanhos = sorted({n for _, n in resumos}, key=lambda n: (n is None, n))
+
+    gerados = []
+    for n in tamanhos:
+        por_algoritmo = {nome: resumo for (nome, tamanho), resumo in resumos.items() if tamanho == n}
+        destino = diretorio if len(tamanhos) == 1 else os.path.join(diretorio, f'n{n}')
+        gerados += gerar_graficos(por_algoritmo, destino, **opcoes)
+    if len(tamanhos) > 1:
+        gerados += gerar_graficos_escalabilidade(
+            {chave: resumo for chave, resumo in resumos.items() if chave[1] is not None},
+            diretorio, metricas, **opcoes)
+    return gerados
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Gráficos a partir de um JSONL de resultados")
+    parser.add_argument('jsonl', help="Arquivo de resultados (experimentos.py, eight_queens.py --saida)")
+    parser.add_argument('--diretorio', default=None, help="Pasta dos gráficos (padrão: ../data)")
+    parser.add_argument('--metricas', nargs='+', default=['tempo'],
+                        help="Métricas dos gráficos de escalabilidade (ex.: tempo avaliacoes)")
+    parser.add_argument('--dpi', type=int, default=300, help="Resolução dos PNGs")
+    parser.add_argument('--processos', type=int, default=None,
+                        help="Processos de desenho (1 = processo atual)")
+    parser.add_argument('--forcar', action='store_true', help="Redesenha mesmo sem mudança nos dados")
+    args = parser.parse_args(argv)
+
+    graficos_de_jsonl(args.jsonl, args.diretorio, args.metricas, dpi=args.dpi,
+                      processos=args.processos, forcar=args.forcar)
+
+
+if __name__ == "__main__":
+    main()